@@ -9,20 +9,7 @@ let loadFailed = false;
 
 const MAX_SUGGESTIONS = 3;
 const MAX_SUGGESTION_DISTANCE = 3;
-const ICELANDIC_MONTHS = {
-  janúar: 0,
-  febrúar: 1,
-  mars: 2,
-  apríl: 3,
-  maí: 4,
-  júní: 5,
-  júlí: 6,
-  ágúst: 7,
-  september: 8,
-  október: 9,
-  nóvember: 10,
-  desember: 11,
-};
+const MAPPING_CACHE_KEY = 'mapping-cache-v1';
 
 const form = document.getElementById('lookupForm');
 const input = document.getElementById('appealInput');
@@ -103,8 +90,63 @@ setInputEnabled(false);
 showStatus('Sæki gögn...');
 
 // ---------- 1. Fetch mapping.json --------------------------------------
-fetch('mapping.json')
-  .then(response => response.json())
+// Returning visitors keep the mapping and its generation in localStorage and
+// catch up through the delta files listed in changes/manifest.json.
+function fetchJson(path) {
+  return fetch(path).then(response => {
+    if (!response.ok) throw new Error(`${path}: ${response.status}`);
+    return response.json();
+  });
+}
+
+function readCachedMapping() {
+  try {
+    const cached = JSON.parse(window.localStorage.getItem(MAPPING_CACHE_KEY));
+    return cached && Number.isInteger(cached.generation) && cached.mapping ? cached : null;
+  } catch (err) {
+    return null;
+  }
+}
+
+function writeCachedMapping(generation, data) {
+  try {
+    window.localStorage.setItem(MAPPING_CACHE_KEY, JSON.stringify({ generation, mapping: data }));
+  } catch (err) {
+    // Storage full or disabled: the next visit downloads the full mapping.
+  }
+  return data;
+}
+
+function applyDelta(data, delta) {
+  Object.assign(data, delta.added || {}, delta.changed || {});
+  (delta.removed || []).forEach(key => { delete data[key]; });
+  return data;
+}
+
+// Same rules as lookup.sync_plan.
+function getSyncPaths(manifest, generation) {
+  if (generation === manifest.generation) return [];
+  const step = generation == null ? null : manifest.sync[String(generation)];
+  return step ? step.paths : [manifest.mapping.path];
+}
+
+function loadMapping() {
+  const cached = readCachedMapping();
+  return fetchJson('changes/manifest.json')
+    .then(manifest => {
+      const paths = getSyncPaths(manifest, cached ? cached.generation : null);
+      if (!paths.length) return cached.mapping;
+      if (paths[0] === manifest.mapping.path) {
+        return fetchJson(manifest.mapping.path).then(data => writeCachedMapping(manifest.generation, data));
+      }
+      return paths
+        .reduce((pending, path) => pending.then(data => fetchJson(path).then(delta => applyDelta(data, delta))), Promise.resolve(cached.mapping))
+        .then(data => writeCachedMapping(manifest.generation, data));
+    })
+    .catch(() => fetchJson('mapping.json'));
+}
+
+loadMapping()
   .then(data => {
     mapping = data || {};
     mappingKeys = Object.keys(mapping);
@@ -222,10 +264,15 @@ function renderNoMatch(key, suggestions) {
   replaceResult(error, list);
 }
 
+// The entry's Landsréttur link: the first Ísland.is link, else the first non-empty one.
+function entryAppealsLink(rows) {
+  const links = rows.map(row => String(row.appeals_case_link || '').trim()).filter(Boolean);
+  return links.find(link => getSafeHttpUrl(link) && new URL(link).hostname === 'island.is') || links[0] || '';
+}
+
+// Rows arrive sorted by date.
 function renderMatches(key, rows) {
-  const sortedRows = sortResultRows(rows);
-  const firstAppealItem = rows.find(item => toText(item.appeals_case_link).trim() !== '');
-  const firstAppealUrl = firstAppealItem ? getSafeHttpUrl(firstAppealItem.appeals_case_link) : '';
+  const firstAppealUrl = getSafeHttpUrl(entryAppealsLink(rows));
 
   const summary = createElement('div', 'result-summary');
   const summaryText = createElement('div', 'result-summary-text');
@@ -249,7 +296,7 @@ function renderMatches(key, rows) {
   summary.append(summaryText);
 
   const list = createElement('ul', 'result-list');
-  sortedRows.forEach(row => {
+  rows.forEach(row => {
     list.append(createVerdictItem(row));
   });
 
@@ -303,34 +350,6 @@ function getSourceTypeLabel(sourceType) {
   return toText(sourceType).includes('ákvörðun') ? 'Ákvörðun' : 'Dómur';
 }
 
-function parseIcelandicDate(value) {
-  const match = toText(value).trim().match(/^(\d{1,2})\.\s+([a-záðéíóúýþæö]+)\s+(\d{4})$/i);
-  if (!match) return null;
-
-  const day = Number(match[1]);
-  const month = ICELANDIC_MONTHS[match[2].toLocaleLowerCase('is-IS')];
-  const year = Number(match[3]);
-  if (!Number.isInteger(day) || month == null || !Number.isInteger(year)) return null;
-
-  return new Date(year, month, day).getTime();
-}
-
-function sortResultRows(rows) {
-  return rows
-    .map((row, index) => ({
-      row,
-      index,
-      parsedDate: parseIcelandicDate(row.verdict_date),
-    }))
-    .sort((a, b) => {
-      if (a.parsedDate != null && b.parsedDate != null) return a.parsedDate - b.parsedDate;
-      if (a.parsedDate != null) return -1;
-      if (b.parsedDate != null) return 1;
-      return a.index - b.index;
-    })
-    .map(item => item.row);
-}
-
 // ---------- 3. Helper ---------------------------------------------------
 function levenshtein(a, b) {
   if (a === b) return 0;
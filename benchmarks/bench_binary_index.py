@@ -0,0 +1,93 @@
+"""Compare `lookup.BinaryIndex` with loading `mapping.json` via `json.load`.
+
+Cold start is measured in fresh processes (load, then one lookup); lookup
+latency in-process over random known and unknown case numbers. `--keys N`
+synthesizes a mapping with N cases from the real records to show how both
+scale with the corpus:
+
+    python benchmarks/bench_binary_index.py --keys 200000
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from lookup import MAPPING_PATH, BinaryIndex, Lookup, build_binary_index  # noqa: E402
+
+COLD_START = {
+    "json.load": (
+        "import json, time; started = time.perf_counter(); "
+        "mapping = json.load(open({mapping!r}, encoding='utf-8')); mapping.get({case!r}); "
+        "print(time.perf_counter() - started)"
+    ),
+    "BinaryIndex": (
+        "import sys, time; sys.path.insert(0, {root!r}); from lookup import BinaryIndex; "
+        "started = time.perf_counter(); BinaryIndex({index!r}).lookup({case!r}); "
+        "print(time.perf_counter() - started)"
+    ),
+}
+
+
+def synthesize(mapping, keys, rng):
+    records = [record for value in mapping.values() for record in (value if isinstance(value, list) else [value])]
+    keys = min(keys, 9999 * 82)
+    return {f"{index % 9999 + 1}/{2018 + index // 9999}": rng.choice(records) for index in range(keys)}
+
+
+def cold_start(label, **values):
+    timings = []
+    for _ in range(5):
+        output = subprocess.run([sys.executable, "-c", COLD_START[label].format(**values)], capture_output=True, text=True, check=True)
+        timings.append(float(output.stdout))
+    print(f"cold start: {label:<12} {min(timings) * 1000:>10.2f} ms (best of 5)")
+
+
+def timed(label, queries, function):
+    started = time.perf_counter()
+    for query in queries:
+        function(query)
+    elapsed = time.perf_counter() - started
+    print(f"lookup: {label:<16} {elapsed / len(queries) * 1e6:>10.2f} µs/lookup")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mapping", default=str(MAPPING_PATH))
+    parser.add_argument("--keys", type=int, default=0, help="Synthesize a mapping with this many cases (0 uses the mapping as is).")
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapping = json.loads(Path(args.mapping).read_text(encoding="utf-8"))
+    if args.keys:
+        mapping = synthesize(mapping, args.keys, rng)
+
+    with tempfile.TemporaryDirectory() as directory:
+        mapping_path = Path(directory) / "mapping.json"
+        index_path = Path(directory) / "mapping.idx"
+        mapping_path.write_text(json.dumps(mapping, ensure_ascii=False, indent=2), encoding="utf-8")
+        index_path.write_bytes(build_binary_index(mapping))
+        print(f"{len(mapping)} cases; mapping.json {mapping_path.stat().st_size / 1e6:.1f} MB, mapping.idx {index_path.stat().st_size / 1e6:.1f} MB")
+
+        case = next(iter(mapping))
+        cold_start("json.load", mapping=str(mapping_path), case=case)
+        cold_start("BinaryIndex", root=str(ROOT), index=str(index_path), case=case)
+
+        keys = list(mapping)
+        queries = [rng.choice(keys) if rng.random() < 0.9 else f"{rng.randrange(1, 9999)}/1999" for _ in range(args.queries)]
+        lookup = Lookup.from_mapping_data(mapping, cache_size=0)
+        with BinaryIndex(index_path) as index:
+            timed("Lookup (dict)", queries, lookup.lookup)
+            timed("BinaryIndex", queries, index.lookup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare `lookup.CaseIndex` queries with linear scans over `mapping.json`.
+
+Times Supreme-number reverse lookups and one-week date-range queries:
+
+    python benchmarks/bench_case_index.py --queries 20000
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lookup import MAPPING_PATH, CaseIndex, build_case_index, parse_verdict_date  # noqa: E402
+
+
+def scan_supreme(records, supreme_case_number):
+    return [record for record in records if record["supreme_case_number"] == supreme_case_number]
+
+
+def scan_between(records, start, end):
+    matches = []
+    for record in records:
+        parsed = parse_verdict_date(record["verdict_date"])
+        if parsed and start <= parsed <= end:
+            matches.append(record)
+    return matches
+
+
+def timed(label, queries, function):
+    started = time.perf_counter()
+    for query in queries:
+        function(query)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {len(queries) / elapsed:>12,.0f} queries/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mapping", default=str(MAPPING_PATH))
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    mapping = json.loads(Path(args.mapping).read_text(encoding="utf-8"))
+    started = time.perf_counter()
+    case_index = CaseIndex(build_case_index(mapping))
+    print(f"build:                   {(time.perf_counter() - started) * 1000:.1f} ms for {len(case_index)} rows")
+
+    records = [record for value in mapping.values() for record in (value if isinstance(value, list) else [value])]
+    rng = random.Random(args.seed)
+    numbers = [rng.choice(records)["supreme_case_number"] for _ in range(args.queries)]
+    first, last = date.fromisoformat(case_index.dates[0]), date.fromisoformat(case_index.dates[-1])
+    weeks = [first + timedelta(days=rng.randrange((last - first).days)) for _ in range(args.queries)]
+    scan_count = max(1, args.queries // 100)
+
+    timed("supreme: index", numbers, case_index.by_supreme)
+    timed("supreme: scan", numbers[:scan_count], lambda number: scan_supreme(records, number))
+    timed("week range: index", weeks, lambda start: case_index.between(start, start + timedelta(days=6)))
+    timed("week range: scan", weeks[:scan_count], lambda start: scan_between(records, start, start + timedelta(days=6)))
+
+
+if __name__ == "__main__":
+    main()
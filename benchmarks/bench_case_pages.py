@@ -0,0 +1,66 @@
+"""Time static case-page generation (`DataManager.write_case_pages`).
+
+Runs a full generation into an empty directory, a rerun with nothing
+changed, and a rerun with `--changed` percent of the cases edited. `--keys N`
+synthesizes a mapping with N cases from the real records:
+
+    python benchmarks/bench_case_pages.py --keys 20000
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from get_new_verdicts import DataManager  # noqa: E402
+from lookup import MAPPING_PATH  # noqa: E402
+
+
+def synthesize(mapping, keys, rng):
+    values = list(mapping.values())
+    keys = min(keys, 9999 * 82)
+    return {f"{index % 9999 + 1}/{2018 + index // 9999}": rng.choice(values) for index in range(keys)}
+
+
+def timed(label, manager, mapping):
+    started = time.perf_counter()
+    written, removed = manager.write_case_pages(mapping)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<18} {elapsed:>7.2f} s  {written:>7} written  {removed:>5} removed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mapping", default=str(MAPPING_PATH))
+    parser.add_argument("--keys", type=int, default=10_000, help="Synthesize a mapping with this many cases (0 uses the mapping as is).")
+    parser.add_argument("--changed", type=float, default=1.0, help="Percent of cases edited before the last run.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapping = json.loads(Path(args.mapping).read_text(encoding="utf-8"))
+    if args.keys:
+        mapping = synthesize(mapping, args.keys, rng)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = DataManager(pages_dir=directory)
+        print(f"{len(mapping)} cases")
+        timed("full", manager, mapping)
+        timed("unchanged", manager, mapping)
+
+        edited = dict(mapping)
+        for case in rng.sample(list(mapping), max(1, int(len(mapping) * args.changed / 100))):
+            value = edited[case]
+            records = value if isinstance(value, list) else [value]
+            edited[case] = [*records, {**records[0], "supreme_case_number": f"{case}-extra"}]
+        timed(f"{args.changed:g}% changed", manager, edited)
+        size = sum(path.stat().st_size for path in Path(directory).rglob("index.html"))
+        print(f"pages: {size / len(mapping) / 1000:.1f} kB each, {size / 1e6:.1f} MB in total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Time in-process lookups through `lookup.Lookup`.
+
+Runs a mix of formatted inputs ("Mál nr. 731/2022", "731-2022", misses)
+against `mapping.json`, with the LRU cache warm and with it disabled:
+
+    python benchmarks/bench_lookup.py --lookups 1000000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lookup import MAPPING_PATH, Lookup  # noqa: E402
+
+
+def sample_inputs(keys, count, seed):
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(count):
+        key = rng.choice(keys)
+        number, year = key.split("/")
+        inputs.append(rng.choice([key, f"Mál nr. {number} / {year}", f"{number}-{year}", f"{number}/1999"]))
+    return inputs
+
+
+def time_lookups(lookup, inputs):
+    started = time.perf_counter()
+    found = 0
+    for raw in inputs:
+        if lookup.lookup(raw):
+            found += 1
+    return time.perf_counter() - started, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mapping", default=str(MAPPING_PATH))
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    lookup = Lookup.from_mapping(args.mapping)
+    load_seconds = time.perf_counter() - started
+    inputs = sample_inputs(lookup.keys, args.lookups, args.seed)
+    print(f"load:           {load_seconds * 1000:.1f} ms for {len(lookup.keys)} cases")
+
+    for label, cache_size in [("no cache", 0), ("lru cache", len(inputs))]:
+        lookup = Lookup(lookup.records, cache_size=cache_size)
+        elapsed, found = time_lookups(lookup, inputs)
+        print(
+            f"{label + ':':<15} {len(inputs) / elapsed:,.0f} lookups/sec "
+            f"({elapsed:.2f}s, {found} found, {lookup.cache_info().hits} cache hits)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure how detail-page parsing scales with parser processes.
+
+Simulates the live scrape's split: `--threads` fetch threads each wait
+`--latency` seconds per page (standing in for the network) and then parse a
+synthetic Supreme decision page, either inline or through
+`Scraper.parsing_in_processes`:
+
+    python benchmarks/bench_parse_pool.py --pages 400 --threads 16 --processes 0 1 2 4
+"""
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from get_new_verdicts import Scraper  # noqa: E402
+
+PARAGRAPH = (
+    "<p>Með beiðni 3. mars 2026 leitar A leyfis Hæstaréttar til að áfrýja dómi Landsréttar "
+    "19. febrúar sama ár í máli nr. 22/2025. <span>Gagnaðili</span> tekur ekki afstöðu til beiðninnar.</p>"
+)
+
+
+def synthetic_page(index, paragraphs):
+    return (
+        f"<html><body><main><h2>Mál nr. 2026-{index}</h2><p>Miðvikudagurinn 15. apríl 2026</p>"
+        "<h3>Lykilorð</h3><ul><li>Áfrýjunarleyfi</li><li>Hafnað</li></ul>"
+        + PARAGRAPH * paragraphs
+        + '<a href="https://island.is/domar/g-ccc9aa9e-15cb-47b2-87dd-9116cf17c3e3">Úrlausn</a></main></body></html>'
+    )
+
+
+def run(scraper, pages, threads, latency):
+    def fetch_and_parse(item):
+        index, html = item
+        time.sleep(latency)
+        return scraper.parse_html("parse_supreme_html", html, f"https://island.is/s/{index}", html, "ákvörðun")
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        rows = list(executor.map(fetch_and_parse, enumerate(pages)))
+    assert all(row["decision_status"] == "Hafnað" for row, _ in rows)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--paragraphs", type=int, default=300, help="Paragraphs per page; 300 is roughly 60 KB.")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated fetch time per page in seconds.")
+    parser.add_argument("--processes", type=int, nargs="+", default=[0, 1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    pages = [synthetic_page(index, args.paragraphs) for index in range(args.pages)]
+    print(f"{args.pages} pages of {len(pages[0]) / 1024:.0f} KB, {args.threads} fetch threads, {os.cpu_count()} CPUs")
+    for processes in args.processes:
+        scraper = Scraper(retries=0)
+        with scraper.parsing_in_processes(processes, inline_parse_bytes=0):
+            if scraper.parse_pool:
+                list(scraper.parse_pool.map(abs, range(processes)))  # start the workers before timing
+            elapsed = run(scraper, pages, args.threads, args.latency)
+        label = "inline" if processes <= 0 else f"{processes} processes"
+        print(f"{label:<14} {args.pages / elapsed:8.1f} pages/sec ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Replay a recorded scrape under different concurrency settings.
+
+Takes a cassette written with `--record` and the CSV the recorded run
+started from (for a scheduled run, the CSV at the commit before its data
+update), then reruns `run_scrape` against the cassette in a scratch
+directory once per `--workers` value. `--latency-scale 1` waits each
+exchange's recorded duration, so the wall times show what the settings
+would have cost against the live sites. The rows found and the cassette
+misses should not change between settings:
+
+    git show HEAD~1:allir_domar_og_akvardanir.csv > /tmp/before.csv
+    python benchmarks/bench_replay.py night.ndjson.gz --csv /tmp/before.csv --workers 1 4 8
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from get_new_verdicts import DataManager, ReplayAdapter, Scraper, run_scrape  # noqa: E402
+
+
+def replay(cassette, csv_path, workers, latency_scale, parse_workers):
+    with tempfile.TemporaryDirectory() as directory:
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            shutil.copyfile(csv_path, "allir_domar_og_akvardanir.csv")
+            scraper = Scraper(replay=ReplayAdapter(cassette, latency_scale=latency_scale))
+            started = time.perf_counter()
+            exit_code = run_scrape(scraper, DataManager(), workers=workers, parse_workers=parse_workers)
+            elapsed = time.perf_counter() - started
+            report = json.loads(Path("scrape_report.json").read_text(encoding="utf-8"))
+        finally:
+            os.chdir(previous)
+    transport = report["http_transport"]
+    print(
+        f"workers {workers:>3}: {elapsed:>8.2f} s  exit {exit_code}  rows added {report['csv_rows_added']:>5}  "
+        f"served {transport['exchanges_served']:>6}  misses {transport['misses']:>4}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette", type=Path)
+    parser.add_argument("--csv", type=Path, default=Path("allir_domar_og_akvardanir.csv"), help="The CSV the recorded run started from.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.getLogger("get_new_verdicts").setLevel(logging.WARNING)
+    for workers in args.workers:
+        replay(args.cassette.resolve(), args.csv.resolve(), workers, args.latency_scale, args.parse_workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare peak memory of collecting scraped rows in a list with `RowSink`.
+
+Feeds synthetic `VerdictRow`s (shaped as in `bench_rows.py`) from a generator,
+as the scrapers now yield them, either into a list that is written at the end
+or through a `RowSink` that appends batches to a staging CSV. Peak traced
+memory of the list grows with the scrape; the sink's stays at one batch plus
+the deduplication keys:
+
+    python benchmarks/bench_row_sink.py --rows 100000 1000000
+"""
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_rows import synthetic_fields  # noqa: E402
+from get_new_verdicts import DEFAULT_SINK_BATCH_SIZE, DataManager, RowSink, VerdictRow  # noqa: E402
+
+
+def rows(count, seed):
+    return (VerdictRow(**fields) for fields in synthetic_fields(count, seed))
+
+
+def collect_list(count, seed, path):
+    collected = list(rows(count, seed))
+    DataManager().rows_frame(collected).to_csv(path, index=False)
+
+
+def stream_sink(count, seed, path, batch_size):
+    sink = RowSink(path, DataManager().columns, set(), batch_size)
+    sink.extend(rows(count, seed))
+    sink.flush()
+
+
+def measure(label, count, run):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{count:>9,} {label:<8} peak {peak / 1e6:>8.1f} MB  {elapsed:>6.2f} s (traced)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_SINK_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "rows.csv"
+        for count in args.rows:
+            measure("list", count, lambda: collect_list(count, args.seed, path))
+            path.unlink()
+            measure("RowSink", count, lambda: stream_sink(count, args.seed, path, args.batch_size))
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
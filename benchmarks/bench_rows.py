@@ -0,0 +1,77 @@
+"""Compare the memory held by dict rows and `VerdictRow`s.
+
+Builds synthetic rows shaped like scraped ones: fresh case-number, link and
+date strings per row, and shared source-type/status constants, as the parser
+produces them. Reports traced bytes per row, build time, and the time to
+render every row back to the CSV frame. Synthesizing the fields is part of
+both build times:
+
+    python benchmarks/bench_rows.py --rows 100000 1000000
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from get_new_verdicts import ICELANDIC_MONTH_NAMES, SOURCE_TYPES, DataManager, VerdictRow  # noqa: E402
+
+STATUSES = ["", "Samþykkt", "Hafnað"]
+
+
+def synthetic_fields(count, seed):
+    rng = random.Random(seed)
+    for index in range(count):
+        decision = rng.random() < 0.75
+        supreme_uuid = str(uuid.UUID(int=rng.getrandbits(128))).upper()
+        yield {
+            "supreme_case_number": f"{2018 + index % 8}-{index}" if decision else f"{index}/{2018 + index % 8}",
+            "supreme_case_link": (
+                f"https://island.is/s/haestirettur/akvardanir/{supreme_uuid}" if decision else f"https://island.is/domar/s-{supreme_uuid}"
+            ),
+            "appeals_case_number": f"{index % 9999 + 1}/{2018 + index % 8}",
+            "appeals_case_link": f"https://island.is/domar/g-{uuid.UUID(int=rng.getrandbits(128))}",
+            "source_type": SOURCE_TYPES["decisions" if decision else "verdicts"],
+            "verdict_date": f"{rng.randint(1, 28)}. {ICELANDIC_MONTH_NAMES[rng.randint(1, 12)]} {2018 + index % 8}",
+            "decision_status": rng.choice(STATUSES) if decision else "",
+        }
+
+
+def measure(label, count, build):
+    gc.collect()
+    started = time.perf_counter()
+    rows = build()
+    elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    DataManager().rows_frame(rows)
+    render = time.perf_counter() - started
+    del rows
+
+    # Traced separately: tracemalloc slows allocation down several times.
+    gc.collect()
+    tracemalloc.start()
+    rows = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    print(f"{count:>9,} {label:<11} {current / count:>6.0f} B/row {current / 1e6:>8.1f} MB  build {elapsed:>6.2f} s  to frame {render:>6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for count in args.rows:
+        measure("dict", count, lambda: list(synthetic_fields(count, args.seed)))
+        measure("VerdictRow", count, lambda: [VerdictRow(**fields) for fields in synthetic_fields(count, args.seed)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Load-test the lookup service and report requests per second and latency.
+
+Starts an in-process server over `mapping.json` unless --url points at a
+running one, then hammers it from several keep-alive client threads:
+
+    python benchmarks/lookup_load_test.py --threads 8 --seconds 10
+    python benchmarks/lookup_load_test.py --url http://127.0.0.1:8080 --batch 100
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lookup import MappingIndex, start_lookup_server  # noqa: E402
+
+
+def run_client(host, port, keys, batch, deadline, latencies, lock):
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    local = []
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        if batch > 1:
+            body = json.dumps({"cases": random.sample(keys, min(batch, len(keys)))})
+            connection.request("POST", "/lookup", body=body, headers={"Content-Type": "application/json"})
+        else:
+            connection.request("GET", f"/lookup?case={quote(random.choice(keys))}")
+        response = connection.getresponse()
+        response.read()
+        local.append(time.perf_counter() - started)
+    connection.close()
+    with lock:
+        latencies.extend(local)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="", help="Existing service base URL; defaults to an in-process server.")
+    parser.add_argument("--mapping", default="mapping.json")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--batch", type=int, default=1, help="Cases per POST /lookup; 1 uses GET.")
+    args = parser.parse_args()
+
+    keys = list(json.loads(Path(args.mapping).read_text(encoding="utf-8")))
+    server = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        server = start_lookup_server(MappingIndex(Path(args.mapping)), port=0)
+        host, port = "127.0.0.1", server.server_address[1]
+
+    latencies, lock = [], threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=run_client, args=(host, port, keys, args.batch, deadline, latencies, lock))
+        for _ in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if server:
+        server.shutdown()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"requests:       {len(latencies)} in {elapsed:.1f}s with {args.threads} threads")
+    print(f"requests/sec:   {len(latencies) / elapsed:,.0f}")
+    print(f"lookups/sec:    {len(latencies) * args.batch / elapsed:,.0f}")
+    print(f"p50 latency:    {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"p99 latency:    {p99 * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
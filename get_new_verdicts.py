@@ -1,14 +1,31 @@
 import argparse
+import base64
 import concurrent.futures
+import csv
+import gzip
+import hashlib
+import io
 import re
 import json
 import logging
 import math
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
 import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
 from dataclasses import asdict, dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from enum import Enum
 from html import unescape
-from typing import Optional, List, Set, Tuple, Dict, Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List, Set, Tuple, Dict, Any, Callable, Collection, Generator, Iterable, Iterator, Union
 from pathlib import Path
 from zoneinfo import ZoneInfo
 from urllib.parse import parse_qs, urlparse, urljoin
@@ -16,9 +33,38 @@ from urllib.parse import parse_qs, urlparse, urljoin
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup, Tag
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+from lookup import (
+    BINARY_INDEX_PATH,
+    CASE_INDEX_PATH,
+    CASE_PAGES_DIR,
+    CHANGES_DIR,
+    ICELANDIC_MONTHS,
+    build_binary_index,
+    build_case_index,
+    case_page_fingerprint,
+    case_page_slug,
+    diff_mappings,
+    render_case_page,
+    serve_lookup,
+)
+from validation import (
+    MAX_REPORTED_VIOLATIONS,
+    NON_BLOCKING_RULES,
+    STATE_PATH as VALIDATION_STATE_PATH,
+    ContractValidator,
+    Violation,
+    summarize as summarize_violations,
+)
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module; RSS accounting is skipped there.
+    resource = None
+
 # --- Configuration & Constants ---
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
@@ -32,22 +78,71 @@ SUPREME_COURT_LEVEL = "Hæstiréttur"
 LANDSRETTUR_COURT_FILTER = "Landsrettur"
 LANDSRETTUR_COURT_LEVEL = "Landsréttur"
 DEFAULT_DECISION_PAGE_LIMIT = 200
+DEFAULT_WATERMARK_OVERLAP_DAYS = 14
+SOURCE_TYPES = {"verdicts": "dóm", "decisions": "ákvörðun"}
 SCRAPE_REPORT_PATH = Path("scrape_report.json")
+UNLINKED_CACHE_PATH = Path("unlinked_cases.json")
+UNLINKED_RECHECK_BASE_DAYS = 1
+UNLINKED_RECHECK_MAX_DAYS = 64
+# Only pages that were fetched and parsed are negative-cached; an empty
+# result can also mean a transient fetch failure, which must be retried.
+UNLINKED_CACHE_REASONS = {"missing_appeals_case_number"}
+LINK_VERIFICATION_PATH = Path("link_verification.json")
+LINK_REPORT_PATH = Path("link_report.json")
+WATCH_STATUS_PATH = Path("watch_status.json")
+REPARSE_DIFF_PATH = Path("reparse_diff.json")
+REPARSED_COLUMNS = ["supreme_case_number", "appeals_case_number", "appeals_case_link", "verdict_date", "decision_status"]
+REPAIR_DIFF_PATH = Path("repair_diff.json")
+DEFAULT_REPAIR_WORKERS = 8
+DEFAULT_WATCH_INTERVAL_SECONDS = 300
+WATCH_UNHEALTHY_AFTER_ERRORS = 3
+DEFAULT_LINK_VERIFICATION_BUDGET = 200
+DEFAULT_LINK_VERIFICATION_WORKERS = 8
+DEFAULT_LOWER_COURT_WORKERS = 8
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60.0
+DEFERRED_RETRY_ROUNDS = 2
+DEFERRED_RETRY_BACKOFF_SECONDS = 15.0
+PENDING_WORK_PATH = Path("pending_work.json")
+# Delta files older than this many generations are pruned; copies that old
+# sync from the full mapping.
+DELTA_RETENTION_GENERATIONS = 60
+# A time-budgeted run stops dispatching once the time left is this multiple
+# of the measured artifact write time plus room for detail fetches already in
+# flight (one fetch can spend 30 s per attempt before urllib3 gives up).
+FLUSH_COST_FACTOR = 3.0
+IN_FLIGHT_RESERVE_SECONDS = 60.0
+# urllib3 keeps one pool per host; these cover island.is, landsrettur.is and
+# the odd redirect target without evicting a live pool mid-run.
+DEFAULT_POOL_SIZE = 10
+HOST_POOLS = 8
+# Pages smaller than this are parsed in the calling thread; shipping them to
+# a parser process costs more in pickling than the parse itself.
+DEFAULT_INLINE_PARSE_BYTES = 16 * 1024
+# Scraped rows are appended to the staging file this many at a time.
+DEFAULT_SINK_BATCH_SIZE = 100
+SHARD_DIR = Path("shards")
+DEFAULT_SHARD_WINDOW_DAYS = 30
+# Decision listing pages are dealt to shards in blocks of this many pages.
+SHARD_DECISION_BLOCK_PAGES = 5
 HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"}
-ICELANDIC_MONTHS = {
-    "janúar": 1,
-    "febrúar": 2,
-    "mars": 3,
-    "apríl": 4,
-    "maí": 5,
-    "júní": 6,
-    "júlí": 7,
-    "ágúst": 8,
-    "september": 9,
-    "október": 10,
-    "nóvember": 11,
-    "desember": 12,
-}
+ICELANDIC_MONTH_NAMES = {number: name for name, number in ICELANDIC_MONTHS.items()}
+ROW_FIELDS = (
+    "supreme_case_number",
+    "supreme_case_link",
+    "appeals_case_number",
+    "appeals_case_link",
+    "source_type",
+    "verdict_date",
+    "verdict_date_iso",
+    "decision_status",
+)
+# Link prefixes stored as a one-byte code in front of the 16 UUID bytes.
+PACKED_LINK_PREFIXES = (
+    f"{ISLAND_BASE_URL}/domar/s-",
+    f"{ISLAND_BASE_URL}/s/haestirettur/akvardanir/",
+    f"{ISLAND_BASE_URL}/domar/g-",
+)
 
 VERDICTS_QUERY = """
 query GetVerdicts($input: WebVerdictsInput!) {
@@ -79,6 +174,7 @@ APPEALED_LANDSRETTUR_CASE_RE = re.compile(
     re.I,
 )
 MONTHS_PATTERN = "janúar|febrúar|mars|apríl|maí|júní|júlí|ágúst|september|október|nóvember|desember"
+PACKED_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
 DATE_RE = re.compile(rf"\b(\d{{1,2}}\.\s+(?:{MONTHS_PATTERN})\s+20\d{{2}})\b", re.I)
 
 def now_reykjavik_iso() -> str:
@@ -95,6 +191,97 @@ def parse_icelandic_date(value: str) -> Optional[date]:
         return None
     return date(int(year_text), month, int(day_text))
 
+def format_icelandic_date(value: date) -> str:
+    return f"{value.day}. {ICELANDIC_MONTH_NAMES[value.month]} {value.year}"
+
+def parse_iso_date(value: str) -> Optional[date]:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+def iso_verdict_date(value: str) -> str:
+    """The ISO form of an Icelandic verdict date, or "" when it does not parse."""
+    parsed = parse_icelandic_date(value)
+    return parsed.isoformat() if parsed else ""
+
+DateWindow = Tuple[Optional[date], Optional[date]]
+
+def date_windows(start: date, end: date, days: int) -> List[DateWindow]:
+    """Split [start, end] into inclusive, non-overlapping windows, newest first."""
+    windows: List[DateWindow] = []
+    window_end = end
+    while window_end >= start:
+        window_start = max(start, window_end - timedelta(days=max(1, days) - 1))
+        windows.append((window_start, window_end))
+        window_end = window_start - timedelta(days=1)
+    return windows
+
+def format_date_window(date_from: Optional[date], date_to: Optional[date]) -> str:
+    if not date_from and not date_to:
+        return ""
+    return f" [{date_from.isoformat() if date_from else '…'} – {date_to.isoformat() if date_to else '…'}]"
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `count` disjoint slices of a full backfill, numbered from 1.
+
+    Verdict date windows are counted from the backfill start date, not from
+    today, so every machine assigns the same window to the same shard; the
+    newest window is left open-ended. Decision listing pages are dealt out
+    in blocks, and each block also walks the first page of the next one, so
+    a decision pushed across a block boundary while the shards run is still
+    seen by one of them.
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        index, _, count = value.partition("/")
+        shard = cls(int(index), int(count))
+        if not 1 <= shard.index <= shard.count:
+            raise ValueError(f"shard must be i/N with 1 <= i <= N, got {value!r}")
+        return shard
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @property
+    def name(self) -> str:
+        return f"shard-{self.index}-of-{self.count}"
+
+    def owns(self, block: int) -> bool:
+        return block % self.count == self.index - 1
+
+    def verdict_windows(self, start: date, end: date, days: int) -> List[DateWindow]:
+        days = max(1, days)
+        window_count = max(1, (end - start).days // days + 1)
+        windows: List[DateWindow] = []
+        for block in reversed(range(window_count)):
+            if not self.owns(block):
+                continue
+            window_start = start + timedelta(days=block * days)
+            window_end = None if block == window_count - 1 else window_start + timedelta(days=days - 1)
+            windows.append((window_start, window_end))
+        return windows
+
+    def decision_page_ranges(self, page_limit: int, block_pages: int = SHARD_DECISION_BLOCK_PAGES) -> List[Tuple[int, int]]:
+        """Inclusive (first, last) decision listing pages for this shard."""
+        ranges: List[Tuple[int, int]] = []
+        for block in range(math.ceil(page_limit / block_pages)):
+            if not self.owns(block):
+                continue
+            first = block * block_pages + 1
+            last = min(page_limit, first + block_pages)
+            if ranges and first <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], last)
+            else:
+                ranges.append((first, last))
+        return ranges
+
 def is_island_url(value: str) -> bool:
     return urlparse(value or "").netloc.lower() == "island.is"
 
@@ -119,6 +306,18 @@ def normalize_island_link(value: str) -> str:
         return value or ""
     return ISLAND_UUID_RE.sub(lambda m: m.group(0).upper(), value)
 
+def island_link_key(value: str) -> str:
+    """Stable identity for a stored or listed Supreme link.
+
+    Ísland.is and legacy haestirettur.is links share the judgment UUID, so the
+    uppercased UUID is the key when present; other links fall back to their
+    normalized form.
+    """
+    match = ISLAND_UUID_RE.search(unescape(value or ""))
+    if match:
+        return match.group(0).upper()
+    return normalize_island_link((value or "").strip())
+
 def legacy_supreme_link_to_island(value: str, source_type: str) -> str:
     item_id = query_id(value)
     if not item_id:
@@ -127,6 +326,146 @@ def legacy_supreme_link_to_island(value: str, source_type: str) -> str:
         return normalize_island_link(urljoin(ISLAND_BASE_URL, f"/s/haestirettur/akvardanir/{item_id}"))
     return normalize_island_link(urljoin(ISLAND_BASE_URL, f"/domar/s-{item_id}"))
 
+class SourceType(Enum):
+    VERDICT = "dóm"
+    DECISION = "ákvörðun"
+
+class DecisionStatus(Enum):
+    NONE = ""
+    ACCEPTED = "Samþykkt"
+    REJECTED = "Hafnað"
+
+SOURCE_TYPE_MEMBERS: Dict[str, Enum] = {member.value: member for member in SourceType}
+DECISION_STATUS_MEMBERS: Dict[str, Enum] = {member.value: member for member in DecisionStatus}
+
+def pack_link(value: str) -> Union[str, bytes]:
+    """Store a known Ísland.is UUID link as 17 bytes: prefix/case code plus the UUID.
+
+    Anything that would not render back to the exact same string is kept as is.
+    """
+    for code, prefix in enumerate(PACKED_LINK_PREFIXES):
+        if value.startswith(prefix):
+            tail = value[len(prefix):]
+            if not PACKED_UUID_RE.match(tail):
+                return value
+            if tail == tail.lower():
+                return bytes([code * 2]) + bytes.fromhex(tail.replace("-", ""))
+            if tail == tail.upper():
+                return bytes([code * 2 + 1]) + bytes.fromhex(tail.replace("-", ""))
+            return value
+    return value
+
+def unpack_link(value: Union[str, bytes]) -> str:
+    if isinstance(value, str):
+        return value
+    text = value[1:].hex()
+    text = f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}"
+    return PACKED_LINK_PREFIXES[value[0] // 2] + (text.upper() if value[0] % 2 else text)
+
+def pack_enum(members: Dict[str, Enum], value: str) -> Union[Enum, str]:
+    """The enum member for `value`, or the interned string for values outside the enum."""
+    member = members.get(value)
+    return member if member is not None else sys.intern(value)
+
+class VerdictRow(Mapping):
+    """One scraped row, stored compactly and read like the dict rows it replaces.
+
+    Enums, packed Ísland.is UUIDs and a `date` stand in for the strings
+    whenever they render back exactly. Fields render to their CSV/JSON
+    strings on read, and `verdict_date_iso` is derived from `verdict_date`.
+    """
+
+    __slots__ = (
+        "supreme_case_number",
+        "_supreme_case_link",
+        "appeals_case_number",
+        "_appeals_case_link",
+        "_source_type",
+        "_verdict_date",
+        "_decision_status",
+    )
+
+    def __init__(
+        self,
+        supreme_case_number: str = "",
+        supreme_case_link: str = "",
+        appeals_case_number: str = "",
+        appeals_case_link: str = "",
+        source_type: str = "",
+        verdict_date: str = "",
+        verdict_date_iso: str = "",
+        decision_status: str = "",
+    ):
+        self.supreme_case_number = supreme_case_number
+        self._supreme_case_link = pack_link(supreme_case_link)
+        self.appeals_case_number = appeals_case_number
+        self._appeals_case_link = pack_link(appeals_case_link)
+        self._source_type = pack_enum(SOURCE_TYPE_MEMBERS, source_type)
+        parsed = parse_iso_date(verdict_date_iso)
+        if not parsed or format_icelandic_date(parsed) != verdict_date:
+            parsed = parse_icelandic_date(verdict_date)
+        self._verdict_date: Union[date, str] = parsed if parsed and format_icelandic_date(parsed) == verdict_date else verdict_date
+        self._decision_status = pack_enum(DECISION_STATUS_MEMBERS, decision_status)
+
+    @classmethod
+    def from_mapping(cls, row: Any) -> "VerdictRow":
+        if isinstance(row, cls):
+            return row
+        return cls(**{name: str(row.get(name) or "") for name in ROW_FIELDS})
+
+    @property
+    def supreme_case_link(self) -> str:
+        return unpack_link(self._supreme_case_link)
+
+    @property
+    def appeals_case_link(self) -> str:
+        return unpack_link(self._appeals_case_link)
+
+    @property
+    def source_type(self) -> str:
+        return self._source_type.value if isinstance(self._source_type, Enum) else self._source_type
+
+    @property
+    def verdict_date(self) -> str:
+        return format_icelandic_date(self._verdict_date) if isinstance(self._verdict_date, date) else self._verdict_date
+
+    @property
+    def verdict_date_iso(self) -> str:
+        parsed = self.parsed_date
+        return parsed.isoformat() if parsed else ""
+
+    @property
+    def decision_status(self) -> str:
+        return self._decision_status.value if isinstance(self._decision_status, Enum) else self._decision_status
+
+    @property
+    def parsed_date(self) -> Optional[date]:
+        return self._verdict_date if isinstance(self._verdict_date, date) else parse_icelandic_date(self._verdict_date)
+
+    @property
+    def is_decision(self) -> bool:
+        return self._source_type is SourceType.DECISION or "ákvörðun" in self.source_type.casefold()
+
+    def __getitem__(self, name: str) -> str:
+        if name not in ROW_FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ROW_FIELDS)
+
+    def __len__(self) -> int:
+        return len(ROW_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"VerdictRow({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, str]:
+        return {name: getattr(self, name) for name in ROW_FIELDS}
+
+    def replace(self, **changes: str) -> "VerdictRow":
+        return VerdictRow(**{**self.to_dict(), **changes})
+
 @dataclass
 class SourceStats:
     listing_pages_fetched: int = 0
@@ -137,8 +476,361 @@ class SourceStats:
     detail_pages_attempted: int = 0
     detail_pages_with_case_number: int = 0
     detail_pages_without_case_number: int = 0
+    detail_pages_fetch_failed: int = 0
     linked_rows: int = 0
     unlinked_rows: int = 0
+    known_items_skipped_by_reason: Dict[str, int] = field(default_factory=dict)
+
+    def count_skip(self, reason: str) -> None:
+        self.known_items_skipped += 1
+        self.known_items_skipped_by_reason[reason] = self.known_items_skipped_by_reason.get(reason, 0) + 1
+
+    def merge(self, other: "SourceStats") -> None:
+        for name, value in asdict(other).items():
+            if isinstance(value, dict):
+                merged = getattr(self, name)
+                for key, count in value.items():
+                    merged[key] = merged.get(key, 0) + count
+            else:
+                setattr(self, name, getattr(self, name) + value)
+
+def atomic_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.tmp")
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write via a sibling temp file and rename, so readers never see a partial file."""
+    tmp_path = atomic_path(path)
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    # The rename also keeps processes that memory-mapped the old file on
+    # their intact copy until they reopen it.
+    tmp_path = atomic_path(path)
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    write_text_atomic(path, json.dumps(data, ensure_ascii=False, indent=2) + "\n")
+
+def write_csv_atomic(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = atomic_path(path)
+    df.to_csv(tmp_path, index=False, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+class UnlinkedCaseCache:
+    """Persistent negative cache of Supreme cases that did not resolve to Landsréttur.
+
+    `publish_staged` drops unlinked rows, so without this cache they look new on every
+    incremental run. Entries are keyed by Supreme case number, or by link when
+    the detail page had none, and are re-checked on an exponential schedule:
+    1, 2, 4, ... days after each failed attempt, capped at 64 days.
+    """
+
+    def __init__(self, path: Path = UNLINKED_CACHE_PATH, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = entries or {}
+        self._by_link = {
+            island_link_key(entry.get("supreme_case_link", "")): key
+            for key, entry in self.entries.items()
+            if entry.get("supreme_case_link")
+        }
+
+    @classmethod
+    def load(cls, path: Path = UNLINKED_CACHE_PATH) -> "UnlinkedCaseCache":
+        if not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable unlinked-case cache {path}: {e}")
+            return cls(path)
+        return cls(path, data.get("entries") or {})
+
+    def save(self) -> None:
+        write_json_atomic(self.path, {"version": 1, "entries": dict(sorted(self.entries.items()))})
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _key(case_number: str, link: str) -> str:
+        return case_number or island_link_key(link)
+
+    def _entry_for(self, url: str, case_number: str) -> Optional[Dict[str, Any]]:
+        key = case_number if case_number in self.entries else self._by_link.get(island_link_key(url), "")
+        return self.entries.get(key)
+
+    def is_suppressed(self, url: str, case_number: str, now: Optional[datetime] = None) -> bool:
+        entry = self._entry_for(url, case_number)
+        if not entry:
+            return False
+        now = now or datetime.now(ZoneInfo("Atlantic/Reykjavik"))
+        return now < datetime.fromisoformat(entry["next_check_at"])
+
+    def record(self, case: Dict[str, str], now: Optional[datetime] = None) -> None:
+        now = now or datetime.now(ZoneInfo("Atlantic/Reykjavik"))
+        case_number = case.get("supreme_case_number", "")
+        link = case.get("supreme_case_link", "")
+        key = self._key(case_number, link)
+        if not key:
+            return
+        entry = self.entries.get(key) or {"first_attempt_at": now.isoformat(timespec="seconds"), "attempts": 0}
+        attempts = int(entry.get("attempts", 0)) + 1
+        delay_days = min(UNLINKED_RECHECK_BASE_DAYS * 2 ** (attempts - 1), UNLINKED_RECHECK_MAX_DAYS)
+        entry.update({
+            "supreme_case_number": case_number,
+            "supreme_case_link": link,
+            "source_type": case.get("source_type", ""),
+            "reason": case.get("reason", ""),
+            "attempts": attempts,
+            "last_attempt_at": now.isoformat(timespec="seconds"),
+            "next_check_at": (now + timedelta(days=delay_days)).isoformat(timespec="seconds"),
+        })
+        self.entries[key] = entry
+        if link:
+            self._by_link[island_link_key(link)] = key
+
+    def discard(self, case_number: str, link: str = "") -> None:
+        key = case_number if case_number in self.entries else self._by_link.get(island_link_key(link), "")
+        entry = self.entries.pop(key, None)
+        if entry and entry.get("supreme_case_link"):
+            self._by_link.pop(island_link_key(entry["supreme_case_link"]), None)
+
+class KnownItemIndex:
+    """Supreme links already stored, keyed by normalized URL and judgment UUID.
+
+    Listing items without a parsable case-number label can only be matched
+    against `known_case_numbers` after a detail fetch; this index lets the
+    listing step recognise them by URL instead. Cases in the unlinked-case
+    cache are treated as known until their next re-check is due.
+    """
+
+    def __init__(self, links: Optional[List[str]] = None, unlinked: Optional[UnlinkedCaseCache] = None):
+        self.links: Set[str] = set()
+        self.unlinked = unlinked
+        for link in links or []:
+            self.add(link)
+
+    def add(self, link: str) -> None:
+        if link:
+            self.links.add(island_link_key(link))
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def skip_reason(self, url: str, case_number: str) -> str:
+        if island_link_key(url) in self.links:
+            return "known_link"
+        if self.unlinked is not None and self.unlinked.is_suppressed(url, case_number):
+            return "unlinked_cache"
+        return ""
+
+class HtmlArchive:
+    """Gzipped copies of fetched detail and lower-court pages, keyed by URL.
+
+    Page bodies are stored once per content hash under `objects/`; `refs/`
+    maps each URL (by `island_link_key`, so link casing does not matter) to
+    the hash of its latest body. Parsing-rule changes can then be replayed
+    over the archive with `--reparse-from-archive` instead of re-crawling.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def _ref_path(self, url: str) -> Path:
+        key = hashlib.sha256(island_link_key(url).encode("utf-8")).hexdigest()
+        return self.root / "refs" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.html.gz"
+
+    def store(self, url: str, html: str) -> str:
+        body = html.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        ref_path = self._ref_path(url)
+        with self._lock:
+            if not object_path.exists():
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = atomic_path(object_path)
+                tmp_path.write_bytes(gzip.compress(body, mtime=0))
+                os.replace(tmp_path, object_path)
+            ref_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(ref_path, {"url": url, "sha256": digest, "archived_at": now_reykjavik_iso()})
+        return digest
+
+    def load(self, url: str) -> Optional[str]:
+        try:
+            ref = json.loads(self._ref_path(url).read_text(encoding="utf-8"))
+            return gzip.decompress(self._object_path(ref["sha256"]).read_bytes()).decode("utf-8")
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"No archived page for {url}: {e}")
+            return None
+
+    def __contains__(self, url: str) -> bool:
+        return self._ref_path(url).exists()
+
+# Request headers that change which response a URL returns; they are part
+# of the key a recorded exchange is replayed under.
+CASSETTE_KEY_HEADERS = ("Range", "If-None-Match", "If-Modified-Since")
+
+def exchange_key(method: str, url: str, body: Any, headers: Mapping) -> str:
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False)
+        except ValueError:
+            pass
+    vary = {name: headers[name] for name in CASSETTE_KEY_HEADERS if headers.get(name)}
+    return json.dumps([method.upper(), url, body or "", vary], ensure_ascii=False)
+
+class CassetteWriter:
+    """Appends HTTP exchanges to a gzip-compressed NDJSON cassette.
+
+    One line per exchange: the request (method, URL, headers, body), the
+    response (status, reason, final URL, headers, encoding, body) or the
+    exception raised instead, the offset from the start of the recording
+    and the time the exchange took. Worker threads share one writer.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.exchanges = 0
+
+    def write(self, request: requests.PreparedRequest, started: float, response: Optional[requests.Response] = None, error: Optional[Exception] = None) -> None:
+        body = request.body.decode("utf-8", errors="replace") if isinstance(request.body, bytes) else request.body
+        entry: Dict[str, Any] = {
+            "offset": round(started - self._started, 6),
+            "elapsed": round(time.monotonic() - started, 6),
+            "request": {"method": request.method, "url": request.url, "headers": dict(request.headers), "body": body},
+        }
+        if response is not None:
+            content = response.content or b""
+            try:
+                encoded = {"body": content.decode("utf-8")}
+            except UnicodeDecodeError:
+                encoded = {"body_base64": base64.b64encode(content).decode("ascii")}
+            entry["response"] = {
+                "status": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "headers": dict(response.headers),
+                "encoding": response.encoding,
+                **encoded,
+            }
+        else:
+            entry["error"] = {"type": type(error).__name__, "message": str(error)}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self.exchanges += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                logger.info(f"Recorded {self.exchanges} HTTP exchanges to {self.path}.")
+
+class RecordingAdapter(HTTPAdapter):
+    """The regular adapter, writing every exchange it completes to a cassette."""
+
+    def __init__(self, writer: CassetteWriter, **kwargs: Any):
+        self.writer = writer
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        started = time.monotonic()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except requests.RequestException as e:
+            self.writer.write(request, started, error=e)
+            raise
+        self.writer.write(request, started, response=response)
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self.writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": "record", "cassette": str(self.writer.path), "exchanges": self.writer.exchanges}
+
+class ReplayAdapter(BaseAdapter):
+    """Serves a recorded cassette instead of the network.
+
+    Requests are matched on method, URL, body and the headers in
+    `CASSETTE_KEY_HEADERS`. Repeats of a request get the recorded responses
+    in order, then the last one again. An unrecorded request fails like a
+    connection error and is counted in `misses`. `latency_scale` replays
+    each exchange's recorded duration scaled by it (1.0 for the original
+    timings); the default 0 serves at full speed.
+    """
+
+    def __init__(self, path: Path, latency_scale: float = 0.0):
+        super().__init__()
+        self.path = Path(path)
+        self.latency_scale = max(0.0, latency_scale)
+        self._lock = threading.Lock()
+        self._exchanges: Dict[str, deque] = {}
+        self.served = 0
+        self.misses = 0
+        recorded = 0
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    entry = json.loads(line)
+                    request = entry["request"]
+                    key = exchange_key(request["method"], request["url"], request.get("body"), request.get("headers", {}))
+                    self._exchanges.setdefault(key, deque()).append(entry)
+                    recorded += 1
+        except (EOFError, ValueError) as e:
+            # A recording cut short by a killed run is replayed up to its last complete line.
+            logger.warning(f"Cassette {self.path} ends early after {recorded} exchanges: {e}")
+        logger.info(f"Replaying {recorded} HTTP exchanges from {self.path}.")
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout: Any = None, verify: Any = True, cert: Any = None, proxies: Any = None) -> requests.Response:
+        key = exchange_key(request.method or "GET", request.url or "", request.body, request.headers)
+        with self._lock:
+            recorded = self._exchanges.get(key)
+            entry = (recorded.popleft() if len(recorded) > 1 else recorded[0]) if recorded else None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.served += 1
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded response for {request.method} {request.url}", request=request)
+        if self.latency_scale:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+        if "error" in entry:
+            error_type = getattr(requests.exceptions, entry["error"]["type"], requests.ConnectionError)
+            if not (isinstance(error_type, type) and issubclass(error_type, requests.RequestException)):
+                error_type = requests.ConnectionError
+            raise error_type(entry["error"]["message"], request=request)
+
+        data = entry["response"]
+        response = requests.Response()
+        response.status_code = data["status"]
+        response.reason = data["reason"]
+        response.url = data["url"]
+        response.headers = CaseInsensitiveDict(data["headers"])
+        response.encoding = data["encoding"]
+        response._content = base64.b64decode(data["body_base64"]) if "body_base64" in data else data["body"].encode("utf-8")
+        response.request = request
+        response.elapsed = timedelta(seconds=entry["elapsed"])
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": "replay", "cassette": str(self.path), "exchanges_served": self.served, "misses": self.misses}
 
 @dataclass
 class ScrapeReport:
@@ -146,6 +838,9 @@ class ScrapeReport:
     completed_at: str = ""
     mode: str = "incremental"
     max_pages: Optional[int] = None
+    shard: str = ""
+    merged_shards: List[str] = field(default_factory=list)
+    verdict_date_windows: List[List[str]] = field(default_factory=list)
     source_urls: Dict[str, str] = field(default_factory=lambda: {
         "verdicts": VERDICT_LISTING_URL,
         "decisions": DECISION_LISTING_URL,
@@ -157,17 +852,30 @@ class ScrapeReport:
     skipped_cases: List[Dict[str, str]] = field(default_factory=list)
     source_failures: List[str] = field(default_factory=list)
     csv_rows_added: int = 0
+    unlinked_cases_cached: int = 0
+    link_verification: Dict[str, Any] = field(default_factory=dict)
+    broken_links: List[Dict[str, Any]] = field(default_factory=list)
     mapping_links_generated: int = 0
+    mapping_generation: Optional[int] = None
+    staged_rows_recovered: int = 0
+    contract_violations: List[Dict[str, str]] = field(default_factory=list)
     artifacts_refreshed: bool = False
     failed: bool = False
     failure_reason: str = ""
+    memory_budget_mb: Optional[float] = None
+    memory: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    http_connections: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    http_transport: Dict[str, Any] = field(default_factory=dict)
+    deferred_retries: Dict[str, int] = field(default_factory=dict)
+    circuit_breakers: Dict[str, Any] = field(default_factory=dict)
+    time_budget: Dict[str, Any] = field(default_factory=dict)
 
     def source(self, name: str) -> SourceStats:
         if name not in self.sources:
             self.sources[name] = SourceStats()
         return self.sources[name]
 
-    def add_skipped_case(self, source: str, row: Dict[str, str], reason: str) -> None:
+    def add_skipped_case(self, source: str, row: Mapping, reason: str) -> None:
         self.skipped_cases.append({
             "source": source,
             "reason": reason,
@@ -196,6 +904,17 @@ class ScrapeReport:
     def total_linked_rows(self) -> int:
         return sum(stats.linked_rows for stats in self.sources.values())
 
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Fold in the counters of another run's report, as written to JSON."""
+        for name, stats in data.get("sources", {}).items():
+            self.source(name).merge(SourceStats(**stats))
+        self.verdict_date_windows.extend(data.get("verdict_date_windows", []))
+        self.skipped_cases.extend(data.get("skipped_cases", []))
+        self.source_failures.extend(data.get("source_failures", []))
+        self.staged_rows_recovered += data.get("staged_rows_recovered", 0)
+        for key, count in data.get("deferred_retries", {}).items():
+            self.deferred_retries[key] = self.deferred_retries.get(key, 0) + count
+
     def mark_failed(self, reason: str) -> None:
         self.failed = True
         self.failure_reason = reason
@@ -227,7 +946,7 @@ class ScrapeReport:
 
 def write_scrape_report(report: ScrapeReport, path: Path = SCRAPE_REPORT_PATH) -> None:
     report.mark_completed()
-    path.write_text(json.dumps(report.to_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    write_json_atomic(path, report.to_dict())
     logger.info(f"Wrote scrape report: {path}")
 
 def suspicious_run_reason(report: ScrapeReport, full: bool) -> str:
@@ -238,6 +957,9 @@ def suspicious_run_reason(report: ScrapeReport, full: bool) -> str:
         return "Source listing pages were fetched, but no listing items were discovered."
 
     if report.total_detail_pages_attempted > 0 and report.total_valid_supreme_cases == 0:
+        fetch_failed = sum(stats.detail_pages_fetch_failed for stats in report.sources.values())
+        if fetch_failed == report.total_detail_pages_attempted:
+            return "Detail pages were queued, but every fetch failed."
         return "Detail pages were queued, but none produced a Supreme Court case number."
 
     if full and report.total_valid_supreme_cases == 0:
@@ -250,8 +972,281 @@ def suspicious_run_reason(report: ScrapeReport, full: bool) -> str:
 
     return ""
 
+class MemoryBudgetExceeded(RuntimeError):
+    pass
+
+def current_rss_bytes() -> int:
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        try:
+            resident_pages = int(statm.read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            return 0
+        return resident_pages * (resource.getpagesize() if resource else 4096)
+    return peak_rss_bytes()
+
+def peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def to_mb(value: int) -> float:
+    return round(value / (1024 * 1024), 1)
+
+class MemoryTracker:
+    """Records RSS per pipeline phase and enforces an optional peak-RSS budget.
+
+    The OS only reports the process-wide peak RSS, so each phase records that
+    peak and how much it grew during the phase. The budget is checked between
+    phases, not while one runs. Debug mode additionally runs tracemalloc so
+    each phase reports its traced peak and the top allocation sites.
+    tracemalloc slows pandas noticeably, so it stays off for normal scheduled
+    runs.
+    """
+
+    def __init__(self, budget_mb: Optional[float] = None, debug: bool = False, top_n: int = 10):
+        self.budget_mb = budget_mb
+        self.debug = debug
+        self.top_n = top_n
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if self.debug and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def phase(self, name: str, enforce: bool = True) -> Iterator[None]:
+        """Record a phase and check the budget once it ends.
+
+        Publishing phases pass `enforce=False`: once files start being written,
+        aborting would leave the CSV and the generated artifacts out of step,
+        so an overrun is only recorded on the phase and logged.
+        """
+        rss_before = current_rss_bytes()
+        peak_before = peak_rss_bytes()
+        started = time.perf_counter()
+        if self.debug and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self.phases[name] = self._phase_entry(rss_before, peak_before, started)
+        if enforce:
+            self.check(name)
+        elif self.over_budget_mb() is not None:
+            self.phases[name]["budget_exceeded"] = True
+            logger.warning(f"Peak RSS exceeded the {self.budget_mb:.0f} MB memory budget by the end of the {name} phase; publishing continues.")
+
+    def _phase_entry(self, rss_before: int, peak_before: int, started: float) -> Dict[str, Any]:
+        rss_after = current_rss_bytes()
+        peak_after = peak_rss_bytes()
+        entry: Dict[str, Any] = {
+            "seconds": round(time.perf_counter() - started, 3),
+            "rss_before_mb": to_mb(rss_before),
+            "rss_after_mb": to_mb(rss_after),
+            # Zero growth means the phase stayed below an earlier phase's peak.
+            "process_peak_rss_mb": to_mb(peak_after),
+            "peak_growth_mb": to_mb(peak_after - peak_before),
+        }
+        if self.debug and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            entry["traced_current_mb"] = to_mb(current)
+            entry["traced_peak_mb"] = to_mb(peak)
+            entry["top_allocations"] = self.top_allocations()
+        return entry
+
+    def top_allocations(self) -> List[Dict[str, Any]]:
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ])
+        return [
+            {"site": str(stat.traceback[0]), "size_mb": to_mb(stat.size), "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:self.top_n]
+        ]
+
+    def over_budget_mb(self) -> Optional[float]:
+        if not self.budget_mb:
+            return None
+        peak_mb = peak_rss_bytes() / (1024 * 1024)
+        return peak_mb if peak_mb > self.budget_mb else None
+
+    def check(self, phase: str) -> None:
+        peak_mb = self.over_budget_mb()
+        if peak_mb is not None:
+            raise MemoryBudgetExceeded(
+                f"Peak RSS {peak_mb:.0f} MB exceeded the {self.budget_mb:.0f} MB memory budget "
+                f"by the end of the {phase} phase."
+            )
+
+def url_class(url: str) -> str:
+    path = urlparse(url).path
+    if VERDICT_PATH_RE.match(path):
+        return "verdict"
+    if DECISION_PATH_RE.match(path):
+        return "decision"
+    return "lower_court"
+
+class CircuitBreaker:
+    """Fails fast for a (host, URL class) after repeated fetch failures.
+
+    After `threshold` consecutive failures the circuit opens and callers get
+    an immediate refusal instead of the full retry/backoff cycle. Once
+    `cooldown` seconds pass, one probe request is let through; success closes
+    the circuit and failure keeps it open for another cooldown.
+    """
+
+    def __init__(self, threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.trips: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.cooldown:
+                self._opened_at[key] = time.monotonic()
+                return True
+            self.rejected[key] = self.rejected.get(key, 0) + 1
+            return False
+
+    def record(self, key: str, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures.pop(key, None)
+                self._opened_at.pop(key, None)
+                return
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if self._failures[key] >= self.threshold and key not in self._opened_at:
+                self._opened_at[key] = time.monotonic()
+                self.trips[key] = self.trips.get(key, 0) + 1
+                logger.warning(f"Circuit opened for {key} after {self._failures[key]} consecutive fetch failures.")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"trips": dict(self.trips), "rejected": dict(self.rejected), "open": sorted(self._opened_at)}
+
+class Deadline:
+    """Wall-clock budget for one run that keeps back enough time to publish.
+
+    Once the time left falls to `reserve_seconds`, `should_stop` turns true
+    and callers record the work they skip with `defer_link` and
+    `defer_listing` instead of dispatching it; run_scrape persists that work
+    to pending_work.json for the next run. Without a budget it never expires.
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.budget_seconds = budget_seconds
+        self.flush_seconds = 0.0
+        self.reserve_seconds = IN_FLIGHT_RESERVE_SECONDS if budget_seconds else 0.0
+        self.reached = False
+        self.detail_links: List[Tuple[str, str]] = []
+        self.listing_cursors: List[Dict[str, Any]] = []
+        self._clock = clock
+        self._expires_at = clock() + budget_seconds if budget_seconds else None
+        self._lock = threading.Lock()
+
+    def reserve_flush(self, flush_seconds: float) -> None:
+        self.flush_seconds = flush_seconds
+        self.reserve_seconds = FLUSH_COST_FACTOR * flush_seconds + IN_FLIGHT_RESERVE_SECONDS
+
+    def remaining(self) -> float:
+        if self._expires_at is None:
+            return math.inf
+        return self._expires_at - self._clock()
+
+    def should_stop(self) -> bool:
+        if self.reached or self._expires_at is None:
+            return self.reached
+        with self._lock:
+            if not self.reached and self.remaining() <= self.reserve_seconds:
+                self.reached = True
+                logger.warning(
+                    f"Time budget nearly spent ({max(0.0, self.remaining()):.0f}s left, "
+                    f"{self.reserve_seconds:.0f}s reserved for publishing); dispatching no new work."
+                )
+        return self.reached
+
+    def defer_link(self, source: str, link: str) -> None:
+        with self._lock:
+            self.detail_links.append((source, link))
+
+    def defer_listing(
+        self,
+        source: str,
+        page: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        full: bool = False,
+    ) -> None:
+        cursor: Dict[str, Any] = {"source": source, "page": page, "full": full}
+        if source == "verdicts":
+            cursor["date_from"] = date_from.isoformat() if date_from else ""
+            cursor["date_to"] = date_to.isoformat() if date_to else ""
+        with self._lock:
+            self.listing_cursors.append(cursor)
+
+    def pending_work(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            return {
+                "detail_links": [{"source": source, "link": link} for source, link in self.detail_links],
+                "listing_cursors": list(self.listing_cursors),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_seconds": self.budget_seconds,
+            "flush_seconds": round(self.flush_seconds, 3),
+            "reserve_seconds": round(self.reserve_seconds, 3),
+            "reached": self.reached,
+            **self.pending_work(),
+        }
+
 class Scraper:
-    def __init__(self, retries: int = 3, backoff_factor: float = 0.5):
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        archive: Optional[HtmlArchive] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        recorder: Optional[CassetteWriter] = None,
+        replay: Optional[ReplayAdapter] = None,
+    ):
+        """`recorder` writes every HTTP exchange to a cassette; `replay` serves
+        one instead of the network."""
+        self.archive = archive
+        self.parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.inline_parse_bytes = DEFAULT_INLINE_PARSE_BYTES
+        self.breaker = CircuitBreaker()
+        # Detail pages whose fetch failed (or was refused by the breaker);
+        # retried by retry_deferred once both sources have been walked.
+        self.deferred: List[Tuple[str, str]] = []
+        self.deferred_retry_rounds = DEFERRED_RETRY_ROUNDS
+        self.deferred_retry_backoff = DEFERRED_RETRY_BACKOFF_SECONDS
+        self.deadline = Deadline()
+        # Listing walks a previous run left unfinished; walked after the
+        # regular listing pages of each source.
+        self.resume_cursors: List[Dict[str, Any]] = []
         self.session = requests.Session()
         self.session.headers.update(HEADERS)
         
@@ -259,11 +1254,48 @@ class Scraper:
             total=retries,
             backoff_factor=backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            allowed_methods=["GET", "HEAD", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        # One adapter, shared by every worker thread: pool_maxsize is the
+        # per-host connection limit and pool_block makes extra threads wait
+        # for a kept-alive connection instead of opening throwaway ones.
+        adapter_options: Dict[str, Any] = {
+            "max_retries": retry_strategy,
+            "pool_connections": HOST_POOLS,
+            "pool_maxsize": max(1, pool_size),
+            "pool_block": True,
+        }
+        self.adapter: BaseAdapter
+        if replay is not None:
+            self.adapter = replay
+        elif recorder is not None:
+            self.adapter = RecordingAdapter(recorder, **adapter_options)
+        else:
+            self.adapter = HTTPAdapter(**adapter_options)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Requests and newly opened connections per host since the Scraper was built."""
+        stats: Dict[str, Dict[str, int]] = {}
+        if not isinstance(self.adapter, HTTPAdapter):
+            return stats
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            entry = stats.setdefault(host, {"requests": 0, "connections_opened": 0, "connections_reused": 0})
+            entry["requests"] += pool.num_requests
+            entry["connections_opened"] += pool.num_connections
+            entry["connections_reused"] = max(0, entry["requests"] - entry["connections_opened"])
+        return stats
+
+    def transport_stats(self) -> Dict[str, Any]:
+        """Cassette counters when recording or replaying, else empty."""
+        stats = getattr(self.adapter, "stats", None)
+        return stats() if stats else {}
 
     def fetch_page(self, url: str) -> Optional[str]:
         try:
@@ -274,6 +1306,160 @@ class Scraper:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def fetch_detail_page(self, url: str) -> Optional[str]:
+        """Fetch a Supreme or lower-court page through the circuit breaker.
+
+        Pages are archived when an archive is set. Returns None when the fetch
+        fails or the breaker for the URL's host and class is open.
+        """
+        key = f"{urlparse(url).netloc}:{url_class(url)}"
+        if not self.breaker.allow(key):
+            logger.debug(f"Circuit open for {key}; deferring {url}.")
+            return None
+        html = self.fetch_page(url)
+        self.breaker.record(key, bool(html))
+        if html and self.archive:
+            self.archive.store(url, html)
+        return html
+
+    def retry_deferred(self, report: Optional[ScrapeReport], known_case_numbers: Set[str]) -> Iterator[VerdictRow]:
+        """Retry detail pages whose fetch failed during the run.
+
+        Each round waits twice as long as the previous one, starting at
+        `deferred_retry_backoff` seconds, and closes every circuit first so
+        the retry probes the source again. Pages that still fail are counted
+        as fetch failures, unless the run's time budget cut the retries short;
+        those are carried over to the next run instead. Recovered rows are
+        yielded as they parse; the report is filled in once the generator is
+        exhausted.
+        """
+        pending, self.deferred = self.deferred, []
+        queued = len(pending)
+        rounds = 0
+        out_of_time = False
+        while pending and rounds < self.deferred_retry_rounds:
+            delay = self.deferred_retry_backoff * 2 ** rounds
+            if self.deadline.should_stop() or self.deadline.remaining() - delay <= self.deadline.reserve_seconds:
+                out_of_time = True
+                break
+            time.sleep(delay)
+            rounds += 1
+            self.breaker.reset()
+            logger.info(f"Retrying {len(pending)} deferred detail pages (round {rounds}).")
+            still_failing = []
+            for source, link in pending:
+                data = self.parse_supreme_page(link, SOURCE_TYPES[source])
+                if not data:
+                    still_failing.append((source, link))
+                    continue
+                case_number = data.get("supreme_case_number", "")
+                if case_number in known_case_numbers:
+                    logger.info(f"Skipping duplicate Supreme case {case_number} from {source}.")
+                    continue
+                if record_detail_result(report, source, link, data):
+                    known_case_numbers.add(case_number)
+                    yield data
+            pending = still_failing
+
+        for source, link in pending:
+            if out_of_time:
+                self.deadline.defer_link(source, link)
+            else:
+                record_detail_result(report, source, link, None)
+        if report:
+            carried_over = len(pending) if out_of_time else 0
+            report.deferred_retries = {
+                "queued": queued,
+                "recovered": queued - len(pending),
+                "failed": len(pending) - carried_over,
+                "carried_over": carried_over,
+                "rounds": rounds,
+            }
+            report.circuit_breakers = self.breaker.to_dict()
+
+    @contextmanager
+    def parsing_in_processes(self, workers: int, inline_parse_bytes: int = DEFAULT_INLINE_PARSE_BYTES) -> Iterator[None]:
+        """Ship HTML parsing to `workers` processes while the block runs.
+
+        BeautifulSoup parsing is CPU-bound and holds the GIL, so fetch threads
+        stop scaling once parsing dominates. Fetching stays in threads; each
+        thread hands the raw HTML to a parser process and waits on the result
+        with the GIL released. `workers <= 0` keeps everything inline.
+        """
+        if workers <= 0:
+            yield
+            return
+        # spawn: forking a process that already runs fetch threads can
+        # copy held locks into the children.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            self.parse_pool = pool
+            self.inline_parse_bytes = inline_parse_bytes
+            try:
+                yield
+            finally:
+                self.parse_pool = None
+
+    def parse_html(self, method: str, html: str, *args: Any) -> Any:
+        """Call the pure parsing method `method(*args)`, offloading large pages."""
+        if self.parse_pool is None or len(html) < self.inline_parse_bytes:
+            return getattr(self, method)(*args)
+        return self.parse_pool.submit(run_parser_method, method, *args).result()
+
+    def fetch_page_conditional(
+        self,
+        url: str,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Optional[str], Dict[str, str]]:
+        """GET with If-None-Match/If-Modified-Since from a previous response.
+
+        Returns the status (304 when unchanged, 0 on error), the body when it
+        changed, and the validators to send next time.
+        """
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return 304, None, validators
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return 0, None, validators
+        fresh = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+        return response.status_code, response.text, fresh
+
+    def check_link(self, url: str) -> int:
+        """Return the HTTP status a stored link resolves to, or 0 on a network error.
+
+        HEAD is tried first; servers that reject it get a one-byte ranged GET so
+        the page body is never downloaded.
+        """
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=30)
+            if response.status_code in {403, 405, 501}:
+                response = self.session.get(
+                    url,
+                    headers={"Range": "bytes=0-0"},
+                    allow_redirects=True,
+                    stream=True,
+                    timeout=30,
+                )
+                response.close()
+            return response.status_code
+        except requests.RequestException as e:
+            logger.warning(f"Error verifying {url}: {e}")
+            return 0
+
     def fetch_json(self, url: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         try:
             response = self.session.post(url, json=payload, timeout=30)
@@ -378,7 +1564,7 @@ class Scraper:
             return ""
 
         logger.debug(f"Checking appeals link: {url}")
-        html = self.fetch_page(url)
+        html = self.fetch_detail_page(url)
         if not html:
             return ""
         
@@ -452,18 +1638,16 @@ class Scraper:
                 return urljoin(ISLAND_BASE_URL, f"/domar/{item_id}")
         return ""
 
-    def resolve_lower_court_links(self, case_numbers: Set[str], max_workers: int = 8) -> Dict[str, str]:
+    def resolve_lower_court_links(self, case_numbers: Set[str], max_workers: int = DEFAULT_LOWER_COURT_WORKERS) -> Dict[str, str]:
         links: Dict[str, str] = {}
         ordered_case_numbers = sorted(case_numbers)
         if not ordered_case_numbers:
             return links
 
-        thread_local = threading.local()
-
         def worker(case_number: str) -> Tuple[str, str]:
-            if not hasattr(thread_local, "scraper"):
-                thread_local.scraper = Scraper(retries=1, backoff_factor=0.1)
-            return case_number, thread_local.scraper.find_island_lower_court_link(case_number)
+            if self.deadline.should_stop():
+                return case_number, ""
+            return case_number, self.find_island_lower_court_link(case_number)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [executor.submit(worker, case_number) for case_number in ordered_case_numbers]
@@ -484,6 +1668,8 @@ class Scraper:
     ) -> Dict[str, str]:
         decision_links: Dict[str, str] = {}
         for page in range(1, page_limit + 1):
+            if self.deadline.should_stop():
+                break
             items, ok = self.get_decision_listing_page(page)
             if not ok:
                 logger.warning(f"Could not fetch decision listing page {page} during link migration.")
@@ -516,11 +1702,21 @@ class Scraper:
         m = SUPREME_VERDICT_RE.search(search_text)
         return f"{m.group(1)}/{m.group(2)}" if m else ""
 
-    def parse_supreme_page(self, url: str, source_type: str) -> Dict[str, str]:
-        html = self.fetch_page(url)
+    def parse_supreme_page(self, url: str, source_type: str) -> Optional[VerdictRow]:
+        html = self.fetch_detail_page(url)
         if not html:
-            return {}
-        
+            return None
+
+        row, fallback_no = self.parse_html("parse_supreme_html", html, url, html, source_type)
+        return self.resolve_appeals_case(row, fallback_no)
+
+    def parse_supreme_html(self, url: str, html: str, source_type: str) -> Tuple[VerdictRow, str]:
+        """Parse a fetched Supreme page without touching the network.
+
+        Returns the row with the candidate appeals link but no appeals case
+        number yet, plus the appealed Landsréttur case number from the body
+        text that `resolve_appeals_case` falls back to.
+        """
         soup = BeautifulSoup(html, "html.parser")
         page_text = soup.get_text(" ", strip=True)
 
@@ -535,29 +1731,34 @@ class Scraper:
         if "ákvörðun" in source_type.casefold():
              decision_status = self.decide_status(soup, page_text)
 
-        # 4. Appeals Link & Number
+        # 4. Appeals Link (the number needs a lower-court fetch)
         app_link = self.extract_appeals_link(html)
+        fallback_no = self.extract_appeals_case_number_from_supreme_text(page_text, source_type)
+
+        row = VerdictRow(
+            supreme_case_number=sup_no,
+            supreme_case_link=url,
+            appeals_case_link=app_link,
+            source_type=source_type,
+            verdict_date=verdict_date,
+            decision_status=decision_status,
+        )
+        return row, fallback_no
+
+    def resolve_appeals_case(self, row: VerdictRow, fallback_no: str = "") -> VerdictRow:
+        app_link = row.appeals_case_link
         app_no = ""
-        
+
         if app_link:
             app_no = self.get_appeals_case_number(app_link)
 
         if not app_no:
-            fallback_no = self.extract_appeals_case_number_from_supreme_text(page_text, source_type)
             fallback_link = self.find_island_lower_court_link(fallback_no) if fallback_no else ""
             if fallback_no and fallback_link:
                 app_no = fallback_no
                 app_link = fallback_link
 
-        return {
-            "supreme_case_number": sup_no,
-            "supreme_case_link": url,
-            "appeals_case_number": app_no,
-            "appeals_case_link": app_link,
-            "source_type": source_type,
-            "verdict_date": verdict_date,
-            "decision_status": decision_status,
-        }
+        return row.replace(appeals_case_number=app_no, appeals_case_link=app_link)
 
     def _dedupe_items(self, items: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
         seen = set()
@@ -608,7 +1809,12 @@ class Scraper:
 
         return self._dedupe_items(items)
 
-    def get_verdict_listing_page(self, page: int) -> Tuple[List[Tuple[str, str]], int, bool]:
+    def get_verdict_listing_page(
+        self,
+        page: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Tuple[List[Tuple[str, str]], int, bool]:
         payload = {
             "query": VERDICTS_QUERY,
             "variables": {
@@ -621,8 +1827,8 @@ class Scraper:
                     "court": SUPREME_COURT_LEVEL,
                     "laws": None,
                     "caseNumber": None,
-                    "dateFrom": None,
-                    "dateTo": None,
+                    "dateFrom": date_from.isoformat() if date_from else None,
+                    "dateTo": date_to.isoformat() if date_to else None,
                     "caseContact": None,
                 }
             },
@@ -637,11 +1843,13 @@ class Scraper:
                     items.append((urljoin(ISLAND_BASE_URL, f"/domar/{item_id}"), (item.get("caseNumber") or "").strip()))
             return self._dedupe_items(items), int(web_verdicts.get("total") or 0), True
 
-        if page == 1:
+        # The rendered page only shows the newest verdicts, which is no
+        # substitute for a bounded backfill window.
+        if page == 1 and date_to is None:
             logger.warning("Falling back to parsing the rendered verdict listing page.")
             html = self.fetch_page(VERDICT_LISTING_URL)
             if html:
-                return self.extract_verdict_links_from_html(html), 0, True
+                return self.parse_html("extract_verdict_links_from_html", html, html), 0, True
         return [], 0, False
 
     def get_decision_listing_page(self, page: int) -> Tuple[List[Tuple[str, str]], bool]:
@@ -649,178 +1857,727 @@ class Scraper:
         html = self.fetch_page(url)
         if not html:
             return [], False
-        return self.extract_decision_links_from_html(html), True
+        return self.parse_html("extract_decision_links_from_html", html, html), True
 
-    def _items_to_scrape(self, items: List[Tuple[str, str]], known_case_numbers: Set[str], full: bool) -> List[Tuple[str, str]]:
+    def _items_to_scrape(
+        self,
+        items: List[Tuple[str, str]],
+        known_case_numbers: Set[str],
+        full: bool,
+        known_index: Optional[KnownItemIndex] = None,
+        stats: Optional[SourceStats] = None,
+    ) -> List[Tuple[str, str]]:
         if full:
             return items
-        return [(url, case_number) for url, case_number in items if not case_number or case_number not in known_case_numbers]
 
-    def scrape_verdicts(
+        to_scrape: List[Tuple[str, str]] = []
+        for url, case_number in items:
+            reason = "known_case_number" if case_number and case_number in known_case_numbers else ""
+            if not reason and known_index is not None:
+                reason = known_index.skip_reason(url, case_number)
+            if not reason:
+                to_scrape.append((url, case_number))
+            elif stats is not None:
+                stats.count_skip(reason)
+        return to_scrape
+
+    def iter_verdict_batches(
         self,
         known_case_numbers: Set[str],
         full: bool = False,
         max_pages: Optional[int] = None,
-        report: Optional[ScrapeReport] = None,
-    ) -> Tuple[List[Dict[str, str]], bool]:
-        rows: List[Dict[str, str]] = []
-        page = 1
-        source_ok = False
-        stats = report.source("verdicts") if report else None
+        stats: Optional[SourceStats] = None,
+        failures: Optional[List[str]] = None,
+        windows: Optional[List[DateWindow]] = None,
+        known_index: Optional[KnownItemIndex] = None,
+    ) -> Iterator[List[Tuple[str, str]]]:
+        """Yield the detail links to scrape from each verdict listing page.
+
+        The incremental stopping rules are applied between batches, so callers
+        only decide how the queued detail pages are fetched. `windows` limits
+        discovery to `webVerdicts` date ranges; each window is paged
+        independently and `max_pages` applies per window. Walks in
+        `resume_cursors` follow the regular windows.
+        """
+        stats = stats if stats is not None else SourceStats()
+        failures = failures if failures is not None else []
+        seen_links: Set[str] = set()
+        for date_from, date_to in windows or [(None, None)]:
+            yield from self._iter_verdict_window(
+                known_case_numbers, full, max_pages, stats, failures, seen_links, date_from, date_to, known_index
+            )
+        for cursor in self.resume_cursors_for("verdicts"):
+            yield from self._iter_verdict_window(
+                known_case_numbers,
+                full or bool(cursor.get("full")),
+                max_pages,
+                stats,
+                failures,
+                seen_links,
+                date.fromisoformat(cursor["date_from"]) if cursor.get("date_from") else None,
+                date.fromisoformat(cursor["date_to"]) if cursor.get("date_to") else None,
+                known_index,
+                start_page=int(cursor.get("page") or 1),
+            )
+
+    def resume_cursors_for(self, source: str) -> List[Dict[str, Any]]:
+        return [cursor for cursor in self.resume_cursors if cursor.get("source") == source]
+
+    def _iter_verdict_window(
+        self,
+        known_case_numbers: Set[str],
+        full: bool,
+        max_pages: Optional[int],
+        stats: SourceStats,
+        failures: List[str],
+        seen_links: Set[str],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        known_index: Optional[KnownItemIndex],
+        start_page: int = 1,
+    ) -> Iterator[List[Tuple[str, str]]]:
+        # A date-bounded window is small enough to walk completely, so it does
+        # not rely on listing order to decide where the known cases start.
+        stop_at_known = not full and date_from is None and date_to is None
+        window_label = format_date_window(date_from, date_to)
+        page = start_page
+        page_size = 0
 
         while True:
-            if max_pages and page > max_pages:
-                logger.info(f"Stopping verdict scrape at configured page limit: {max_pages}")
+            if max_pages and page >= start_page + max_pages:
+                logger.info(f"Stopping verdict scrape{window_label} at configured page limit: {max_pages}")
+                break
+            if self.deadline.should_stop():
+                self.deadline.defer_listing("verdicts", page, date_from, date_to, full)
                 break
 
-            items, total, ok = self.get_verdict_listing_page(page)
-            source_ok = source_ok or ok
+            items, total, ok = self.get_verdict_listing_page(page, date_from=date_from, date_to=date_to)
             if not ok:
-                if stats:
-                    stats.listing_pages_failed += 1
-                if report:
-                    report.source_failures.append(f"verdicts page {page}")
-                logger.warning(f"Could not fetch verdict listing page {page}.")
+                stats.listing_pages_failed += 1
+                failures.append(f"verdicts{window_label} page {page}")
+                logger.warning(f"Could not fetch verdict listing page {page}{window_label}.")
                 break
-            if stats:
-                stats.listing_pages_fetched += 1
-                stats.listing_items_discovered += len(items)
+            stats.listing_pages_fetched += 1
+            stats.listing_items_discovered += len(items)
             if not items:
-                if stats:
-                    stats.listing_pages_empty += 1
-                logger.info(f"No verdict links found on page {page}; stopping.")
+                stats.listing_pages_empty += 1
+                logger.info(f"No verdict links found on page {page}{window_label}; stopping.")
                 break
 
-            to_scrape = self._items_to_scrape(items, known_case_numbers, full)
-            if stats:
-                stats.known_items_skipped += len(items) - len(to_scrape)
-            logger.info(f"Verdict page {page}: {len(items)} links, {len(to_scrape)} queued.")
+            fresh_items = [(url, case_number) for url, case_number in items if url not in seen_links]
+            seen_links.update(url for url, _ in fresh_items)
+            to_scrape = self._items_to_scrape(fresh_items, known_case_numbers, full, known_index, stats)
+            logger.info(f"Verdict page {page}{window_label}: {len(items)} links, {len(to_scrape)} queued.")
 
-            if not to_scrape and not full:
+            if not to_scrape and stop_at_known:
                 logger.info(f"Stopping verdict scrape at page {page}; all visible cases are already known.")
                 break
 
-            for link, _ in to_scrape:
-                if stats:
-                    stats.detail_pages_attempted += 1
-                data = self.parse_supreme_page(link, "dóm")
-                if data.get("supreme_case_number"):
-                    if stats:
-                        stats.detail_pages_with_case_number += 1
-                        if data.get("appeals_case_number"):
-                            stats.linked_rows += 1
-                        else:
-                            stats.unlinked_rows += 1
-                    if report and not data.get("appeals_case_number"):
-                        report.add_skipped_case("verdicts", data, "missing_appeals_case_number")
-                    rows.append(data)
-                else:
-                    if stats:
-                        stats.detail_pages_without_case_number += 1
-                    if report:
-                        report.add_skipped_case(
-                            "verdicts",
-                            {"supreme_case_link": link, "source_type": "dóm"},
-                            "missing_supreme_case_number",
-                        )
-
-            if not full and len(to_scrape) < len(items):
+            if to_scrape:
+                yield to_scrape
+
+            # A resumed walk starts mid-listing, where new items may have
+            # pushed already-scraped cases onto the page, so it only stops at
+            # a page with nothing left to scrape.
+            if stop_at_known and start_page == 1 and len(to_scrape) < len(items):
                 logger.info(f"Stopping verdict scrape after page {page}; reached already-known cases.")
                 break
 
-            if total and items:
-                page_count = math.ceil(total / len(items))
+            page_size = page_size or len(items)
+            if total:
+                page_count = math.ceil(total / page_size)
                 if page >= page_count:
                     break
+            elif page == 1 and (date_from or date_to):
+                logger.warning(f"Verdict listing{window_label} reported no total; paging until an empty page.")
 
             page += 1
 
-        return rows, source_ok
-
-    def scrape_decisions(
+    def iter_decision_batches(
         self,
         known_case_numbers: Set[str],
         full: bool = False,
         max_pages: Optional[int] = None,
-        report: Optional[ScrapeReport] = None,
-    ) -> Tuple[List[Dict[str, str]], bool]:
-        rows: List[Dict[str, str]] = []
-        page = 1
-        source_ok = False
+        stats: Optional[SourceStats] = None,
+        failures: Optional[List[str]] = None,
+        known_index: Optional[KnownItemIndex] = None,
+        page_ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> Iterator[List[Tuple[str, str]]]:
+        """Yield the detail links to scrape from each decision listing page.
+
+        `page_ranges` limits the walk to inclusive (first, last) page ranges,
+        taken in order until one of them runs past the end of the listing.
+        """
+        stats = stats if stats is not None else SourceStats()
+        failures = failures if failures is not None else []
         seen_links: Set[str] = set()
         page_limit = max_pages or DEFAULT_DECISION_PAGE_LIMIT
-        stats = report.source("decisions") if report else None
-
+        if page_ranges is None:
+            yield from self._iter_decision_pages(known_case_numbers, full, page_limit, stats, failures, seen_links, known_index)
+        for first, last in page_ranges or []:
+            reached_end = yield from self._iter_decision_pages(
+                known_case_numbers, full, last, stats, failures, seen_links, known_index, start_page=first, warn_at_limit=False
+            )
+            if reached_end:
+                break
+        for cursor in self.resume_cursors_for("decisions"):
+            yield from self._iter_decision_pages(
+                known_case_numbers,
+                full or bool(cursor.get("full")),
+                page_limit,
+                stats,
+                failures,
+                seen_links,
+                known_index,
+                start_page=int(cursor.get("page") or 1),
+            )
+
+    def _iter_decision_pages(
+        self,
+        known_case_numbers: Set[str],
+        full: bool,
+        page_limit: int,
+        stats: SourceStats,
+        failures: List[str],
+        seen_links: Set[str],
+        known_index: Optional[KnownItemIndex],
+        start_page: int = 1,
+        warn_at_limit: bool = True,
+    ) -> Generator[List[Tuple[str, str]], None, bool]:
+        """Walk decision pages up to `page_limit`; returns whether the listing ran out."""
+        page = start_page
         while page <= page_limit:
+            if self.deadline.should_stop():
+                self.deadline.defer_listing("decisions", page, full=full)
+                break
             items, ok = self.get_decision_listing_page(page)
-            source_ok = source_ok or ok
             if not ok:
-                if stats:
-                    stats.listing_pages_failed += 1
-                if report:
-                    report.source_failures.append(f"decisions page {page}")
+                stats.listing_pages_failed += 1
+                failures.append(f"decisions page {page}")
                 logger.warning(f"Could not fetch decision listing page {page}.")
                 break
-            if stats:
-                stats.listing_pages_fetched += 1
-                stats.listing_items_discovered += len(items)
+            stats.listing_pages_fetched += 1
+            stats.listing_items_discovered += len(items)
 
             fresh_items = [(url, case_number) for url, case_number in items if url not in seen_links]
             seen_links.update(url for url, _ in fresh_items)
             if not fresh_items:
-                if stats:
-                    stats.listing_pages_empty += 1
+                stats.listing_pages_empty += 1
                 logger.info(f"No new decision links found on page {page}; stopping.")
-                break
+                return True
 
-            to_scrape = self._items_to_scrape(fresh_items, known_case_numbers, full)
-            if stats:
-                stats.known_items_skipped += len(fresh_items) - len(to_scrape)
+            to_scrape = self._items_to_scrape(fresh_items, known_case_numbers, full, known_index, stats)
             logger.info(f"Decision page {page}: {len(fresh_items)} links, {len(to_scrape)} queued.")
 
             if not to_scrape and not full:
                 logger.info(f"Stopping decision scrape at page {page}; all visible cases are already known.")
                 break
 
-            for link, _ in to_scrape:
-                if stats:
-                    stats.detail_pages_attempted += 1
-                data = self.parse_supreme_page(link, "ákvörðun")
-                if data.get("supreme_case_number"):
-                    if stats:
-                        stats.detail_pages_with_case_number += 1
-                        if data.get("appeals_case_number"):
-                            stats.linked_rows += 1
-                        else:
-                            stats.unlinked_rows += 1
-                    if report and not data.get("appeals_case_number"):
-                        report.add_skipped_case("decisions", data, "missing_appeals_case_number")
-                    rows.append(data)
-                else:
-                    if stats:
-                        stats.detail_pages_without_case_number += 1
-                    if report:
-                        report.add_skipped_case(
-                            "decisions",
-                            {"supreme_case_link": link, "source_type": "ákvörðun"},
-                            "missing_supreme_case_number",
-                        )
-
-            if not full and len(to_scrape) < len(fresh_items):
+            yield to_scrape
+
+            if not full and start_page == 1 and len(to_scrape) < len(fresh_items):
                 logger.info(f"Stopping decision scrape after page {page}; reached already-known cases.")
                 break
 
             page += 1
 
-        if page > page_limit:
+        if page > page_limit and warn_at_limit:
             logger.warning(f"Stopped decision scrape at page limit {page_limit}.")
+        return False
+
+    def iter_source_batches(self, source: str, *args: Any, **kwargs: Any) -> Iterator[List[Tuple[str, str]]]:
+        if source == "verdicts":
+            return self.iter_verdict_batches(*args, **kwargs)
+        return self.iter_decision_batches(*args, **kwargs)
+
+    def _iter_source_rows(
+        self,
+        source: str,
+        known_case_numbers: Set[str],
+        full: bool,
+        max_pages: Optional[int],
+        report: Optional[ScrapeReport],
+        **batch_options: Any,
+    ) -> Iterator[VerdictRow]:
+        stats = report.source(source) if report else SourceStats()
+        failures = report.source_failures if report else []
+        source_type = SOURCE_TYPES[source]
+        batches = self.iter_source_batches(source, known_case_numbers, full, max_pages, stats, failures, **batch_options)
+
+        for to_scrape in batches:
+            for link, _ in to_scrape:
+                if self.deadline.should_stop():
+                    self.deadline.defer_link(source, link)
+                    continue
+                data = self.parse_supreme_page(link, source_type)
+                if not data:
+                    self.deferred.append((source, link))
+                elif record_detail_result(report, source, link, data):
+                    yield data
+
+    def scrape_pending(
+        self,
+        links: List[Tuple[str, str]],
+        known_case_numbers: Set[str],
+        report: Optional[ScrapeReport] = None,
+    ) -> Iterator[VerdictRow]:
+        """Fetch (source, link) detail pages a previous run never dispatched."""
+        for source, link in links:
+            if self.deadline.should_stop():
+                self.deadline.defer_link(source, link)
+                continue
+            data = self.parse_supreme_page(link, SOURCE_TYPES[source])
+            if not data:
+                self.deferred.append((source, link))
+                continue
+            case_number = data.get("supreme_case_number", "")
+            if case_number in known_case_numbers:
+                logger.info(f"Skipping duplicate Supreme case {case_number} from {source}.")
+                continue
+            if record_detail_result(report, source, link, data):
+                known_case_numbers.add(case_number)
+                yield data
+
+    def scrape_verdicts(
+        self,
+        known_case_numbers: Set[str],
+        full: bool = False,
+        max_pages: Optional[int] = None,
+        report: Optional[ScrapeReport] = None,
+        windows: Optional[List[DateWindow]] = None,
+        known_index: Optional[KnownItemIndex] = None,
+    ) -> Iterator[VerdictRow]:
+        """Yield verdict rows as their detail pages are parsed.
+
+        Whether the listing answered at all is in the report's
+        `listing_pages_fetched` once the generator is exhausted.
+        """
+        return self._iter_source_rows(
+            "verdicts", known_case_numbers, full, max_pages, report, windows=windows, known_index=known_index
+        )
+
+    def scrape_decisions(
+        self,
+        known_case_numbers: Set[str],
+        full: bool = False,
+        max_pages: Optional[int] = None,
+        report: Optional[ScrapeReport] = None,
+        known_index: Optional[KnownItemIndex] = None,
+        page_ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> Iterator[VerdictRow]:
+        """Yield decision rows as their detail pages are parsed, like `scrape_verdicts`."""
+        return self._iter_source_rows(
+            "decisions", known_case_numbers, full, max_pages, report, known_index=known_index, page_ranges=page_ranges
+        )
+
+_worker_parser: Optional[Scraper] = None
+
+def run_parser_method(method: str, *args: Any) -> Any:
+    """Entry point in parser processes; reuses one Scraper per process for its parsing helpers."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = Scraper(retries=0)
+    return getattr(_worker_parser, method)(*args)
+
+class ArchiveScraper(Scraper):
+    """Offline Scraper that reads pages from an HtmlArchive.
+
+    Nothing touches the network: pages missing from the archive count as
+    failed fetches, and the Ísland.is lower-court search used by the decision
+    fallback is answered from links already stored in the CSV.
+    """
+
+    def __init__(self, archive: HtmlArchive, lower_court_links: Optional[Dict[str, str]] = None):
+        super().__init__(retries=0)
+        self.source_archive = archive
+        self.lower_court_links = lower_court_links or {}
+
+    def fetch_page(self, url: str) -> Optional[str]:
+        return self.source_archive.load(url)
+
+    def fetch_json(self, url: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return None
+
+    def find_island_lower_court_link(self, case_number: str) -> str:
+        return self.lower_court_links.get(case_number, "")
+
+_reparse_scraper: Optional[ArchiveScraper] = None
+
+def _init_reparse_worker(archive_root: str, lower_court_links: Dict[str, str]) -> None:
+    global _reparse_scraper
+    _reparse_scraper = ArchiveScraper(HtmlArchive(Path(archive_root)), lower_court_links)
+
+def reparse_archived_page(task: Tuple[str, str]) -> Optional[VerdictRow]:
+    link, source_type = task
+    assert _reparse_scraper is not None
+    return _reparse_scraper.parse_supreme_page(link, source_type)
+
+def record_detail_result(
+    report: Optional[ScrapeReport],
+    source: str,
+    link: str,
+    data: Optional[Mapping],
+) -> bool:
+    """Count one parsed detail page; returns whether it produced a Supreme row."""
+    stats = report.source(source) if report else SourceStats()
+    stats.detail_pages_attempted += 1
+    if data and data.get("supreme_case_number"):
+        stats.detail_pages_with_case_number += 1
+        if data.get("appeals_case_number"):
+            stats.linked_rows += 1
+        else:
+            stats.unlinked_rows += 1
+            if report:
+                report.add_skipped_case(source, data, "missing_appeals_case_number")
+        return True
+
+    # No result means the page never arrived; a row without a case number
+    # was fetched but did not parse.
+    if data:
+        stats.detail_pages_without_case_number += 1
+        reason = "missing_supreme_case_number"
+    else:
+        stats.detail_pages_fetch_failed += 1
+        reason = "fetch_failed"
+    if report:
+        report.add_skipped_case(
+            source,
+            {"supreme_case_link": link, "source_type": SOURCE_TYPES[source]},
+            reason,
+        )
+    return False
+
+class ScrapePipeline:
+    """Runs both sources as a staged producer/consumer pipeline.
+
+    Listing producers (one per source) feed a bounded queue of detail links,
+    detail workers fetch and parse Supreme pages, lower-court workers resolve
+    the Landsréttur case number, and the calling thread collects the results.
+    Every queue is bounded, so a slow stage blocks the stages before it
+    instead of buffering the backlog in memory. Queue operations poll a stop
+    flag that is raised when the collector returns or fails, so an error in
+    one stage cannot leave the others blocked on a full queue.
+
+    The collector is the only code that touches the ScrapeReport detail
+    counters and the known case numbers. Producers count listing pages into
+    private SourceStats that are merged into the report when they finish, and
+    apply the incremental stopping rules against a snapshot of the known
+    cases taken before the run.
+
+    Once the scraper's deadline says stop, producers and detail workers
+    record the links they would have dispatched on the deadline instead.
+    """
+
+    _DONE = object()
 
+    def __init__(
+        self,
+        scraper: Scraper,
+        detail_workers: int = 4,
+        lower_court_workers: int = 4,
+        queue_size: int = 32,
+        poll_interval: float = 0.1,
+    ):
+        self.scraper = scraper
+        self.poll_interval = poll_interval
+        self.detail_workers = max(1, detail_workers)
+        self.lower_court_workers = max(1, lower_court_workers)
+        self.queue_size = max(1, queue_size)
+
+    def run(
+        self,
+        known_case_numbers: Set[str],
+        full: bool = False,
+        max_pages: Optional[int] = None,
+        report: Optional[ScrapeReport] = None,
+        windows: Optional[List[DateWindow]] = None,
+        known_index: Optional[KnownItemIndex] = None,
+        pending: Optional[List[Tuple[str, str]]] = None,
+        on_row: Optional[Callable[[VerdictRow], Any]] = None,
+        decision_pages: Optional[List[Tuple[int, int]]] = None,
+    ) -> Tuple[List[VerdictRow], bool]:
+        """Scrape both sources; `pending` detail links are queued after the listings.
+
+        With `on_row`, each collected row is handed to it as it arrives and
+        the returned list stays empty.
+        """
+        deadline = self.scraper.deadline
+        detail_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        appeals_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        results: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        snapshot = frozenset(known_case_numbers)
+        listing_stats = {source: SourceStats() for source in SOURCE_TYPES}
+        listing_failures: Dict[str, List[str]] = {source: [] for source in SOURCE_TYPES}
+
+        stop = threading.Event()
+        dispatched: Set[str] = set()
+
+        def put(target: "queue.Queue[Any]", item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=self.poll_interval)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(source_queue: "queue.Queue[Any]") -> Any:
+            while not stop.is_set():
+                try:
+                    return source_queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+            return self._DONE
+
+        def produce(source: str) -> None:
+            options: Dict[str, Any] = {"known_index": known_index}
+            if source == "verdicts":
+                options["windows"] = windows
+            else:
+                options["page_ranges"] = decision_pages
+            batches = self.scraper.iter_source_batches(
+                source, snapshot, full, max_pages, listing_stats[source], listing_failures[source], **options
+            )
+            for to_scrape in batches:
+                for link, _ in to_scrape:
+                    dispatched.add(island_link_key(link))
+                    if deadline.should_stop():
+                        deadline.defer_link(source, link)
+                    elif not put(detail_queue, (source, link)):
+                        return
+
+        def produce_pending(after: List["concurrent.futures.Future[None]"]) -> None:
+            # Newly listed cases go first; leftovers from the previous run
+            # fill whatever budget remains.
+            concurrent.futures.wait(after)
+            for source, link in pending or []:
+                if island_link_key(link) in dispatched:
+                    continue
+                if deadline.should_stop():
+                    deadline.defer_link(source, link)
+                elif not put(detail_queue, (source, link)):
+                    return
+
+        def parse_details() -> None:
+            while True:
+                task = get(detail_queue)
+                if task is self._DONE:
+                    return
+                source, link = task
+                if deadline.should_stop():
+                    deadline.defer_link(source, link)
+                    continue
+                try:
+                    html = self.scraper.fetch_detail_page(link)
+                    if not html:
+                        put(results, (source, link, None))
+                        continue
+                    row, fallback_no = self.scraper.parse_html("parse_supreme_html", html, link, html, SOURCE_TYPES[source])
+                except Exception:
+                    logger.exception(f"Detail worker failed on {link}.")
+                    put(results, (source, link, None))
+                    continue
+                if row.get("supreme_case_number"):
+                    put(appeals_queue, (source, link, row, fallback_no))
+                else:
+                    put(results, (source, link, row))
+
+        def resolve_lower_courts() -> None:
+            while True:
+                task = get(appeals_queue)
+                if task is self._DONE:
+                    return
+                source, link, row, fallback_no = task
+                try:
+                    row = self.scraper.resolve_appeals_case(row, fallback_no)
+                except Exception:
+                    logger.exception(f"Lower-court worker failed on {link}.")
+                put(results, (source, link, row))
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(SOURCE_TYPES) + self.detail_workers + self.lower_court_workers + 2,
+            thread_name_prefix="scrape-pipeline",
+        ) as executor:
+            producers = [executor.submit(produce, source) for source in SOURCE_TYPES]
+            producers.append(executor.submit(produce_pending, list(producers)))
+            detailers = [executor.submit(parse_details) for _ in range(self.detail_workers)]
+            resolvers = [executor.submit(resolve_lower_courts) for _ in range(self.lower_court_workers)]
+
+            def close_stages() -> None:
+                concurrent.futures.wait(producers)
+                for _ in detailers:
+                    put(detail_queue, self._DONE)
+                concurrent.futures.wait(detailers)
+                for _ in resolvers:
+                    put(appeals_queue, self._DONE)
+                concurrent.futures.wait(resolvers)
+                put(results, self._DONE)
+
+            executor.submit(close_stages)
+            try:
+                rows = self._collect(results, known_case_numbers, report, get, on_row)
+            finally:
+                # On a collector error every stage sees the stop flag within
+                # one poll interval, so leaving the executor cannot hang.
+                stop.set()
+
+            for future in producers + detailers + resolvers:
+                if future.exception():
+                    logger.error(f"Scrape pipeline stage failed: {future.exception()}")
+
+        for source in SOURCE_TYPES:
+            if report:
+                report.source(source).merge(listing_stats[source])
+                report.source_failures.extend(listing_failures[source])
+        source_ok = any(stats.listing_pages_fetched > 0 for stats in listing_stats.values())
         return rows, source_ok
 
+    def _collect(
+        self,
+        results: "queue.Queue[Any]",
+        known_case_numbers: Set[str],
+        report: Optional[ScrapeReport],
+        get: Callable[["queue.Queue[Any]"], Any],
+        on_row: Optional[Callable[[VerdictRow], Any]] = None,
+    ) -> List[VerdictRow]:
+        rows: List[VerdictRow] = []
+        collected: Set[str] = set()
+        while True:
+            item = get(results)
+            if item is self._DONE:
+                return rows
+            source, link, data = item
+            if not data:
+                self.scraper.deferred.append((source, link))
+                continue
+            case_number = data.get("supreme_case_number", "")
+            if case_number in collected:
+                logger.info(f"Skipping duplicate Supreme case {case_number} from {source}.")
+                continue
+            if not record_detail_result(report, source, link, data):
+                continue
+            collected.add(case_number)
+            known_case_numbers.add(case_number)
+            if on_row:
+                on_row(data)
+            else:
+                rows.append(data)
+
+class RowSink:
+    """Streams scraped rows to a staging CSV next to the store, in batches.
+
+    Rows whose Supreme case number is already stored, or was staged earlier
+    in the run, are dropped, so memory holds one batch plus the case numbers
+    and link keys seen, however long the backfill. Staged rows are durable
+    but unpublished: `DataManager.publish_staged` appends them to the CSV once
+    the run has passed its guards, and `discard` drops them. A staging file
+    left by an interrupted run is taken over with `recover`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: List[str],
+        known_case_numbers: Set[str],
+        batch_size: int = DEFAULT_SINK_BATCH_SIZE,
+    ):
+        self.path = path
+        self.columns = columns
+        self.case_numbers = set(known_case_numbers)
+        self.links: Set[str] = set()
+        self.batch_size = max(1, batch_size)
+        self.staged = 0
+        self.linked = 0
+        self._batch: List[VerdictRow] = []
+
+    def recover(self) -> int:
+        """Re-stage the rows of an interrupted run's staging file; returns how many were kept."""
+        if not self.path.exists():
+            return 0
+        leftover = self.path.with_name(f"{self.path.name}.recovered")
+        os.replace(self.path, leftover)
+        before = self.staged
+        try:
+            with leftover.open(newline="", encoding="utf-8") as file:
+                self.extend(VerdictRow.from_mapping(record) for record in csv.DictReader(file))
+        except (OSError, csv.Error) as e:
+            logger.warning(f"Ignoring unreadable staged rows {leftover}: {e}")
+        leftover.unlink()
+        recovered = self.staged - before
+        if recovered:
+            logger.info(f"Recovered {recovered} rows staged by an interrupted run.")
+        return recovered
+
+    def add(self, row: VerdictRow) -> bool:
+        self.links.add(island_link_key(row.get("supreme_case_link", "")))
+        case_number = row.get("supreme_case_number", "")
+        if not case_number or case_number in self.case_numbers:
+            return False
+        self.case_numbers.add(case_number)
+        self._batch.append(row)
+        self.staged += 1
+        if row.get("appeals_case_number"):
+            self.linked += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+        return True
+
+    def extend(self, rows: Iterable[VerdictRow]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        with self.path.open("a", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file, lineterminator="\n")
+            if new_file:
+                writer.writerow(self.columns)
+            writer.writerows([row.get(column) or "" for column in self.columns] for row in self._batch)
+        self._batch = []
+
+    def rows(self) -> Iterator[VerdictRow]:
+        """Every staged row, read back from disk."""
+        self.flush()
+        if not self.path.exists():
+            return
+        with self.path.open(newline="", encoding="utf-8") as file:
+            for record in csv.DictReader(file):
+                yield VerdictRow.from_mapping(record)
+
+    def discard(self) -> None:
+        self._batch = []
+        if self.path.exists():
+            self.path.unlink()
+
 class DataManager:
-    def __init__(self, csv_path: str = "allir_domar_og_akvardanir.csv", json_path: str = "mapping.json"):
+    def __init__(
+        self,
+        csv_path: str = "allir_domar_og_akvardanir.csv",
+        json_path: str = "mapping.json",
+        unlinked_cache_path: str = str(UNLINKED_CACHE_PATH),
+        verification_path: str = str(LINK_VERIFICATION_PATH),
+        index_path: str = str(CASE_INDEX_PATH),
+        binary_index_path: str = str(BINARY_INDEX_PATH),
+        pending_path: str = str(PENDING_WORK_PATH),
+        pages_dir: str = str(CASE_PAGES_DIR),
+        changes_dir: str = str(CHANGES_DIR),
+        validation_path: str = str(VALIDATION_STATE_PATH),
+    ):
         self.csv_path = Path(csv_path)
         self.json_path = Path(json_path)
+        self.unlinked_cache_path = Path(unlinked_cache_path)
+        self.verification_path = Path(verification_path)
+        self.index_path = Path(index_path)
+        self.binary_index_path = Path(binary_index_path)
+        self.pending_path = Path(pending_path)
+        self.pages_dir = Path(pages_dir)
+        self.staging_path = self.csv_path.with_name(f".{self.csv_path.stem}.staged.csv")
+        self.changes_dir = Path(changes_dir)
+        self.generation: Optional[int] = None
+        self.validator = ContractValidator(Path(validation_path))
+        self._csv_valid_after_publish = False
         self.columns = [
             "supreme_case_number",
             "supreme_case_link",
@@ -828,6 +2585,7 @@ class DataManager:
             "appeals_case_link",
             "source_type",
             "verdict_date",
+            "verdict_date_iso",
             "decision_status",
         ]
 
@@ -842,6 +2600,13 @@ class DataManager:
                 df.loc[:, col] = df[col].astype(str).map(normalize_island_link)
         return df
 
+    def _normalize_date_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fill `verdict_date_iso` where it is missing, e.g. in a CSV written before the column existed."""
+        missing = df["verdict_date_iso"].astype(str).str.strip() == ""
+        if missing.any():
+            df.loc[missing, "verdict_date_iso"] = df.loc[missing, "verdict_date"].astype(str).map(iso_verdict_date)
+        return df
+
     def load_existing_data(self) -> pd.DataFrame:
         if self.csv_path.exists():
             df = pd.read_csv(self.csv_path, dtype=str).fillna("")
@@ -849,44 +2614,166 @@ class DataManager:
             for col in self.columns:
                 if col not in df.columns:
                     df[col] = ""
-            return df[self.columns]
+            return self._normalize_date_columns(df[self.columns].copy())
         return pd.DataFrame(columns=self.columns)
 
-    def save_csv(self, new_rows: List[Dict[str, str]]) -> int:
-        if not new_rows:
+    def load_rows(self) -> List[VerdictRow]:
+        return [VerdictRow.from_mapping(record) for record in self.load_existing_data().to_dict(orient="records")]
+
+    def rows_frame(self, rows: List[VerdictRow]) -> pd.DataFrame:
+        """Render rows to a string DataFrame in CSV column order."""
+        return pd.DataFrame([[row.get(column) or "" for column in self.columns] for row in rows], columns=self.columns, dtype=str)
+
+    def known_item_index(self, df: pd.DataFrame, unlinked: Optional[UnlinkedCaseCache] = None) -> KnownItemIndex:
+        return KnownItemIndex(df["supreme_case_link"].dropna().astype(str).tolist(), unlinked)
+
+    def load_unlinked_cache(self) -> UnlinkedCaseCache:
+        return UnlinkedCaseCache.load(self.unlinked_cache_path)
+
+    def load_link_verifications(self) -> Dict[str, Dict[str, Any]]:
+        if not self.verification_path.exists():
+            return {}
+        try:
+            return json.loads(self.verification_path.read_text(encoding="utf-8")).get("links") or {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable link verification state {self.verification_path}: {e}")
+            return {}
+
+    def save_link_verifications(self, links: Dict[str, Dict[str, Any]]) -> None:
+        write_json_atomic(self.verification_path, {"version": 1, "links": dict(sorted(links.items()))})
+
+    def load_pending_work(self) -> Dict[str, List[Dict[str, Any]]]:
+        pending: Dict[str, List[Dict[str, Any]]] = {"detail_links": [], "listing_cursors": []}
+        if not self.pending_path.exists():
+            return pending
+        try:
+            data = json.loads(self.pending_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable pending work {self.pending_path}: {e}")
+            return pending
+        return {key: data.get(key) or [] for key in pending}
+
+    def save_pending_work(self, pending: Dict[str, List[Dict[str, Any]]]) -> None:
+        write_json_atomic(self.pending_path, {"version": 1, **pending})
+
+    def measure_flush_seconds(self, df: pd.DataFrame) -> float:
+        """Time to serialize `df` as CSV and JSON, the bulk of publishing, without writing anything."""
+        started = time.perf_counter()
+        df.to_csv(io.StringIO(), index=False)
+        json.dumps(df.to_dict(orient="records"), ensure_ascii=False, indent=2)
+        return time.perf_counter() - started
+
+    def update_unlinked_cache(self, cache: UnlinkedCaseCache, report: ScrapeReport, rows: Iterable[VerdictRow]) -> int:
+        for row in rows:
+            if row.get("appeals_case_number"):
+                cache.discard(row.get("supreme_case_number", ""), row.get("supreme_case_link", ""))
+        for case in report.skipped_cases:
+            if case["reason"] in UNLINKED_CACHE_REASONS:
+                cache.record(case)
+        cache.save()
+        return len(cache)
+
+    def verdict_watermark(self, df: pd.DataFrame, overlap_days: int = DEFAULT_WATERMARK_OVERLAP_DAYS) -> Optional[date]:
+        """Newest stored Supreme verdict date minus a safety overlap.
+
+        The overlap re-lists verdicts published late or backdated on Ísland.is;
+        already-known cases in it are skipped before any detail fetch.
+        """
+        verdicts = df[~df["source_type"].str.contains("ákvörðun", na=False)]
+        dates = [parsed for parsed in map(parse_iso_date, verdicts["verdict_date_iso"]) if parsed]
+        if not dates:
+            return None
+        return max(dates) - timedelta(days=overlap_days)
+
+    def row_sink(self, known_case_numbers: Set[str], batch_size: int = DEFAULT_SINK_BATCH_SIZE) -> RowSink:
+        return RowSink(self.staging_path, self.columns, known_case_numbers, batch_size)
+
+    def publish_staged(self, sink: RowSink) -> int:
+        """Append the sink's staged rows that link to Landsréttur to the CSV.
+
+        The sink already dropped known case numbers, so publishing is an
+        append: the CSV is copied, staged rows are added in batches, and the
+        copy replaces the CSV. A CSV with an older header is rewritten with
+        the current columns first.
+        """
+        sink.flush()
+        if not sink.staged:
             logger.info("No new rows to save.")
+            sink.discard()
             return 0
 
-        df_existing = self.load_existing_data()
-        df_new = pd.DataFrame(new_rows, columns=self.columns).fillna("")
-        
-        # Filter rows that have an appeals case number
-        df_new = df_new[df_new["appeals_case_number"].str.strip().astype(bool)]
-        if df_new.empty:
+        tmp_path = atomic_path(self.csv_path)
+        header = ""
+        if self.csv_path.exists():
+            with self.csv_path.open(encoding="utf-8-sig") as file:
+                header = file.readline().strip()
+        if header == ",".join(self.columns):
+            shutil.copyfile(self.csv_path, tmp_path)
+            with tmp_path.open("rb+") as file:
+                if file.seek(0, os.SEEK_END):
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        file.write(b"\n")
+        else:
+            self._normalize_link_columns(self.load_existing_data()).to_csv(tmp_path, index=False, encoding="utf-8")
+
+        added = 0
+        for chunk in pd.read_csv(sink.path, dtype=str, chunksize=sink.batch_size, keep_default_na=False):
+            chunk = chunk[chunk["appeals_case_number"].str.strip().astype(bool)]
+            if chunk.empty:
+                continue
+            chunk = self._normalize_date_columns(self._normalize_link_columns(chunk))
+            chunk[self.columns].to_csv(tmp_path, mode="a", header=False, index=False, encoding="utf-8")
+            added += len(chunk)
+
+        if not added:
+            tmp_path.unlink()
+            sink.discard()
             logger.info("Parsed cases did not include any Landsréttur links to save.")
             return 0
-        
-        # Combine
-        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-        # Deduplicate on supreme case number, keeping existing (oldest scrape might be better? or overwrite? 
-        # The original script kept 'first' which implies existing. Let's stick to that.)
-        df_combined = df_combined.drop_duplicates(subset="supreme_case_number", keep="first")
-        added_count = len(df_combined) - len(df_existing)
-
-        if added_count == 0:
-            logger.info(f"No new CSV rows after deduplication. Total rows: {len(df_combined)}")
-            return 0
-
-        df_combined = self._normalize_link_columns(df_combined)
-        df_combined.to_csv(self.csv_path, index=False, encoding="utf-8")
-        logger.info(f"Updated CSV. Total rows: {len(df_combined)}. New rows: {added_count}")
-        return added_count
+        os.replace(tmp_path, self.csv_path)
+        sink.discard()
+        logger.info(f"Appended {added} new rows to the CSV.")
+        return added
+
+    def validate_publish(self, rows: Iterable[Mapping], stored_case_numbers: Collection[str] = ()) -> List[Violation]:
+        """Check the rows about to be added or changed against the data contract.
+
+        While the stored CSV is the one last recorded as valid only `rows`
+        are checked. Otherwise the stored rows are streamed through the full
+        check first; their violations are logged but do not block, since
+        they are already published. Violations of `NON_BLOCKING_RULES` in
+        `rows` are logged too. Returns the violations that block publishing.
+        Pass `stored_case_numbers` for added rows; changed rows replace
+        themselves.
+        """
+        self._csv_valid_after_publish = not self.csv_path.exists() or self.validator.is_current(self.csv_path)
+        if not self._csv_valid_after_publish:
+            stored = self.validator.validate_csv(self.csv_path)
+            self._csv_valid_after_publish = not stored
+            if stored:
+                logger.warning(f"Stored rows already break the data contract: {summarize_violations(stored)}")
+        violations = self.validator.check_delta(rows, stored_case_numbers)
+        warnings = [violation for violation in violations if violation.rule in NON_BLOCKING_RULES]
+        if warnings:
+            # Published anyway, so the next run re-checks the whole CSV.
+            self._csv_valid_after_publish = False
+            logger.warning(f"Publishing rows the data contract flags: {summarize_violations(warnings)}")
+        return [violation for violation in violations if violation.rule not in NON_BLOCKING_RULES]
+
+    def record_validation(self) -> None:
+        """After publishing checked rows, remember the new CSV as valid."""
+        if self._csv_valid_after_publish and self.csv_path.exists():
+            self.validator.record(self.csv_path)
 
     def write_data(self, df: pd.DataFrame) -> None:
-        df = self._normalize_link_columns(df.copy())
-        df[self.columns].to_csv(self.csv_path, index=False, encoding="utf-8")
+        df = self._normalize_date_columns(self._normalize_link_columns(df.copy()))
+        write_csv_atomic(df[self.columns], self.csv_path)
         logger.info(f"Wrote CSV with {len(df)} rows.")
 
+    def write_rows(self, rows: List[VerdictRow]) -> None:
+        self.write_data(self.rows_frame(rows))
+
     def generate_json_mapping(self) -> int:
         if not self.csv_path.exists():
             logger.warning("No CSV file found to generate JSON mapping.")
@@ -902,42 +2789,361 @@ class DataManager:
         for col in self.columns:
             df.loc[:, col] = df[col].astype(str).str.strip()
 
-        df = self._normalize_link_columns(df)
+        df = self._normalize_date_columns(self._normalize_link_columns(df))
         df = df[df["appeals_case_number"].astype(bool)]
 
-        # Grouping
+        # Grouping. Records are published in date order (undated last, CSV
+        # order within a day), so clients neither parse nor sort. Each record
+        # keeps its own appeals link; `lookup.entry_appeals_link` picks the
+        # entry's.
         mapping = {}
         grouped = df.groupby("appeals_case_number")
         for appeals_num, group in grouped:
             records = group.drop(columns="appeals_case_number").to_dict(orient="records")
-            if len(records) == 1:
-                mapping[appeals_num] = records[0]
-            else:
-                mapping[appeals_num] = records
-        
-        with open(self.json_path, 'w', encoding='utf-8') as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2)
+            records.sort(key=lambda record: (not record["verdict_date_iso"], record["verdict_date_iso"]))
+            mapping[appeals_num] = records[0] if len(records) == 1 else records
         
+        previous = self._load_published_mapping()
+        write_text_atomic(self.json_path, json.dumps(mapping, ensure_ascii=False, indent=2))
+        self.write_change_feed(previous, mapping)
+        write_text_atomic(self.index_path, json.dumps(build_case_index(mapping), ensure_ascii=False, separators=(",", ":")))
+        write_bytes_atomic(self.binary_index_path, build_binary_index(mapping))
+        self.write_case_pages(mapping)
+
         total_linked = sum(len(v) if isinstance(v, list) else 1 for v in mapping.values())
         logger.info(f"Generated JSON mapping with {total_linked} links.")
         return total_linked
 
+    def _load_published_mapping(self) -> Optional[Dict[str, Any]]:
+        if not self.json_path.exists():
+            return None
+        try:
+            return json.loads(self.json_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read the previous mapping {self.json_path}; starting a new change feed: {e}")
+            return None
+
+    def write_change_feed(self, previous: Optional[Dict[str, Any]], mapping: Dict[str, Any]) -> Optional[int]:
+        """Record `mapping` as a new generation if it differs from `previous`.
+
+        Writes `<generation>.json` with the delta, appends one line per changed
+        key to `changes.ndjson`, prunes deltas older than
+        DELTA_RETENTION_GENERATIONS, and rewrites `manifest.json` with the
+        cheapest sync path from every retained generation. Without a previous
+        mapping or manifest, the feed restarts from a baseline generation that
+        has no delta. Returns the generation, or None when nothing changed.
+        """
+        manifest_path = self.changes_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = None
+
+        delta = diff_mappings(previous, mapping) if previous is not None and manifest else None
+        if delta is not None and not any(delta.values()):
+            self.generation = manifest["generation"]
+            return None
+
+        generated_at = now_reykjavik_iso()
+        generation = manifest["generation"] + 1 if manifest else 1
+        deltas = [step for step in manifest["deltas"] if step["generation"] > generation - DELTA_RETENTION_GENERATIONS] if delta else []
+        self.changes_dir.mkdir(parents=True, exist_ok=True)
+        if delta:
+            delta_name = f"{generation}.json"
+            delta_text = json.dumps(
+                {"version": 1, "generation": generation, "previous": generation - 1, "generated_at": generated_at, **delta},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            write_text_atomic(self.changes_dir / delta_name, delta_text)
+            deltas.append({
+                "generation": generation,
+                "path": f"{self.changes_dir.name}/{delta_name}",
+                "bytes": len(delta_text.encode("utf-8")),
+                "added": len(delta["added"]),
+                "changed": len(delta["changed"]),
+                "removed": len(delta["removed"]),
+            })
+            events = [(op, key) for op in ("added", "changed") for key in delta[op]] + [("removed", key) for key in delta["removed"]]
+            with (self.changes_dir / "changes.ndjson").open("a", encoding="utf-8") as log:
+                for op, key in events:
+                    log.write(json.dumps({"generation": generation, "generated_at": generated_at, "op": op, "case": key}, ensure_ascii=False) + "\n")
+
+        kept = {step["path"] for step in deltas}
+        for path in self.changes_dir.glob("*.json"):
+            if path.stem.isdigit() and f"{self.changes_dir.name}/{path.name}" not in kept:
+                path.unlink()
+
+        # Walk back from the newest delta: a copy at `generation - 1` needs that
+        # delta plus everything after it, unless the full mapping is smaller.
+        mapping_bytes = self.json_path.stat().st_size
+        sync: Dict[str, Dict[str, Any]] = {}
+        paths: List[str] = []
+        chain_bytes = 0
+        for step in reversed(deltas):
+            paths.insert(0, step["path"])
+            chain_bytes += step["bytes"]
+            if chain_bytes < mapping_bytes:
+                sync[str(step["generation"] - 1)] = {"paths": list(paths), "bytes": chain_bytes}
+
+        write_json_atomic(manifest_path, {
+            "version": 1,
+            "generation": generation,
+            "generated_at": generated_at,
+            "mapping": {"path": self.json_path.name, "bytes": mapping_bytes},
+            "deltas": deltas,
+            "sync": dict(sorted(sync.items(), key=lambda item: int(item[0]))),
+        })
+        self.generation = generation
+        logger.info(f"Mapping generation {generation}" + (f": {len(delta['added'])} added, {len(delta['changed'])} changed, {len(delta['removed'])} removed." if delta else " (baseline)."))
+        return generation
+
+    def write_case_pages(self, mapping: Dict[str, Any]) -> Tuple[int, int]:
+        """Write the static page of every case whose records changed since the last run.
+
+        `manifest.json` in the pages directory holds each page's fingerprint;
+        pages are only rendered when it differs, and pages for cases that left
+        the mapping are removed. Returns (written, removed).
+        """
+        manifest_path = self.pages_dir / "manifest.json"
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("pages") or {}
+        except (OSError, ValueError):
+            previous = {}
+
+        pages: Dict[str, str] = {}
+        written = 0
+        for case, value in mapping.items():
+            slug = case_page_slug(case)
+            if slug is None:
+                continue
+            records = value if isinstance(value, list) else [value]
+            pages[slug] = case_page_fingerprint(records)
+            page_path = self.pages_dir / slug / "index.html"
+            if previous.get(slug) == pages[slug] and page_path.exists():
+                continue
+            page_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(page_path, render_case_page(case, records))
+            written += 1
+
+        removed = 0
+        for slug in set(previous) - set(pages):
+            page_path = self.pages_dir / slug / "index.html"
+            if page_path.exists():
+                page_path.unlink()
+                removed += 1
+            if page_path.parent.is_dir() and not any(page_path.parent.iterdir()):
+                page_path.parent.rmdir()
+
+        write_json_atomic(manifest_path, {"version": 1, "pages": dict(sorted(pages.items()))})
+        logger.info(f"Case pages: {written} written, {removed} removed, {len(pages) - written} unchanged.")
+        return written, removed
+
     def update_timestamp(self):
         months = ["", "janúar", "febrúar", "mars", "apríl", "maí", "júní",
                   "júlí", "ágúst", "september", "október", "nóvember", "desember"]
         dt = datetime.now(ZoneInfo("Atlantic/Reykjavik"))
         ts_str = f"Síðast uppfært {dt.day}. {months[dt.month]} {dt.year}."
-        Path("last_updated.txt").write_text(ts_str, encoding="utf-8")
+        write_text_atomic(Path("last_updated.txt"), ts_str)
         logger.info(f"Updated timestamp: {ts_str}")
 
+def listing_fingerprint(items: List[Tuple[str, str]]) -> str:
+    return hashlib.sha256("\n".join(f"{url}|{case_number}" for url, case_number in items).encode("utf-8")).hexdigest()
+
+class ListingWatcher:
+    """Polls the head of both listings and runs a scrape only when one changes.
+
+    Verdicts are fingerprinted from `webVerdicts` page 1. The decisions page is
+    fetched conditionally with the previous ETag/Last-Modified, and a changed
+    body is fingerprinted from its extracted links so volatile page markup
+    does not trigger scrapes. The first poll always counts as a change, so a
+    restarted watcher catches up straight away.
+    """
+
+    def __init__(
+        self,
+        scraper: Scraper,
+        on_change: Callable[[], int],
+        interval: float = DEFAULT_WATCH_INTERVAL_SECONDS,
+        status_path: Path = WATCH_STATUS_PATH,
+    ):
+        self.scraper = scraper
+        self.on_change = on_change
+        self.interval = interval
+        self.status_path = status_path
+        self.fingerprints: Dict[str, str] = {}
+        self.decision_validators: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.status: Dict[str, Any] = {
+            "started_at": now_reykjavik_iso(),
+            "healthy": True,
+            "polls": 0,
+            "changes": 0,
+            "consecutive_errors": 0,
+            "last_poll_at": "",
+            "last_change_at": "",
+            "last_scrape_at": "",
+            "last_scrape_exit_code": None,
+            "last_error": "",
+        }
+
+    def _listing_heads(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Return the head fingerprints and the decision validators that go with them."""
+        heads: Dict[str, str] = {}
+        items, _, ok = self.scraper.get_verdict_listing_page(1)
+        if not ok:
+            raise RuntimeError("Could not fetch verdict listing head.")
+        heads["verdicts"] = listing_fingerprint(items)
+
+        status, html, validators = self.scraper.fetch_page_conditional(
+            DECISION_LISTING_URL, self.decision_validators
+        )
+        if status == 304 and "decisions" in self.fingerprints:
+            heads["decisions"] = self.fingerprints["decisions"]
+        elif html:
+            heads["decisions"] = listing_fingerprint(self.scraper.extract_decision_links_from_html(html))
+        else:
+            raise RuntimeError("Could not fetch decision listing head.")
+        return heads, validators
+
+    def poll_once(self) -> bool:
+        polled_at = now_reykjavik_iso()
+        try:
+            heads, validators = self._listing_heads()
+        except RuntimeError as e:
+            logger.warning(f"Watch poll failed: {e}")
+            self._update_status(polls=1, last_poll_at=polled_at, error=str(e))
+            return False
+
+        changed = sorted(name for name, value in heads.items() if self.fingerprints.get(name) != value)
+        if not changed:
+            self.decision_validators = validators
+            self._update_status(polls=1, last_poll_at=polled_at)
+            return False
+
+        logger.info(f"Listing head changed for {', '.join(changed)}; running incremental scrape.")
+        try:
+            exit_code = self.on_change()
+            error = "" if exit_code == 0 else f"Scrape exited with {exit_code}."
+        except Exception as e:
+            logger.exception("Watch scrape failed.")
+            exit_code, error = 1, f"Scrape raised {type(e).__name__}: {e}"
+        # Only a successful scrape moves the baseline, so a failed one is
+        # retried on the next poll even if the listing has not moved again.
+        if exit_code == 0:
+            self.fingerprints = heads
+            self.decision_validators = validators
+        self._update_status(
+            polls=1,
+            changes=1,
+            last_poll_at=polled_at,
+            last_change_at=polled_at,
+            last_scrape_at=now_reykjavik_iso(),
+            last_scrape_exit_code=exit_code,
+            error=error,
+        )
+        return True
+
+    def _update_status(self, polls: int = 0, changes: int = 0, error: str = "", **values: Any) -> None:
+        with self._lock:
+            self.status["polls"] += polls
+            self.status["changes"] += changes
+            self.status.update(values)
+            if error:
+                self.status["consecutive_errors"] += 1
+                self.status["last_error"] = error
+            else:
+                self.status["consecutive_errors"] = 0
+            self.status["healthy"] = self.status["consecutive_errors"] < WATCH_UNHEALTHY_AFTER_ERRORS
+            snapshot = dict(self.status)
+        write_json_atomic(self.status_path, snapshot)
+
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.status)
+
+    def run(self, max_polls: Optional[int] = None) -> int:
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                self.poll_once()
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(self.interval)
+        except KeyboardInterrupt:
+            logger.info("Watch mode stopped.")
+        return 0 if self.health()["healthy"] else 1
+
+def serve_watch_status(watcher: ListingWatcher, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve the watcher status as JSON on /health (503 when unhealthy)."""
+
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") not in {"/health", ""}:
+                self.send_error(404)
+                return
+            status = watcher.health()
+            body = json.dumps(status, ensure_ascii=False).encode("utf-8")
+            self.send_response(200 if status["healthy"] else 503)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format, *args)
+
+    server = ThreadingHTTPServer((host, port), StatusHandler)
+    threading.Thread(target=server.serve_forever, name="watch-status", daemon=True).start()
+    logger.info(f"Serving watch status on http://{host}:{server.server_address[1]}/health")
+    return server
+
+def shard_arg(value: str) -> Shard:
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"expected i/N with 1 <= i <= N, got {value!r}") from e
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Update Landsréttur to Hæstiréttur lookup data.")
     parser.add_argument("--full", action="store_true", help="Crawl available listing pages instead of stopping at known cases.")
     parser.add_argument("--max-pages", type=int, default=None, help="Optional page limit for each source, useful for diagnostics.")
     parser.add_argument("--migrate-island-links", action="store_true", help="Rewrite stored links from 2018 onward to their Ísland.is equivalents.")
-    parser.add_argument("--since-date", default="2018-01-01", help="Start date for --migrate-island-links, ISO format YYYY-MM-DD.")
+    parser.add_argument("--since-date", default="2018-01-01", help="Start date for --migrate-island-links and --date-window-days backfills, ISO format YYYY-MM-DD.")
     parser.add_argument("--decision-page-limit", type=int, default=DEFAULT_DECISION_PAGE_LIMIT, help="Decision listing page cap for --migrate-island-links.")
-    parser.add_argument("--dry-run", action="store_true", help="Report migration changes without writing CSV, mapping, or timestamp files.")
+    parser.add_argument("--dry-run", action="store_true", help="Report migration, reparse or repair changes without writing CSV, mapping, or timestamp files.")
+    parser.add_argument("--watermark-overlap-days", type=int, default=DEFAULT_WATERMARK_OVERLAP_DAYS, help="Incremental runs list verdicts dated from the newest stored verdict minus this many days.")
+    parser.add_argument("--no-date-watermark", action="store_true", help="Page the verdict listing from the newest item until known cases instead of using a date watermark.")
+    parser.add_argument("--date-window-days", type=int, default=None, help="Backfill verdicts from --since-date in independent date windows of this many days.")
+    parser.add_argument("--workers", type=int, default=1, help="Run both sources as a concurrent pipeline with this many detail and lower-court workers each.")
+    parser.add_argument("--parse-workers", type=int, default=0, help="Parse fetched HTML in this many worker processes (0 parses in the fetching threads).")
+    parser.add_argument("--inline-parse-bytes", type=int, default=DEFAULT_INLINE_PARSE_BYTES, help="Pages smaller than this are parsed inline even with --parse-workers.")
+    parser.add_argument("--verify-links", action="store_true", help="Check the least-recently-verified stored links instead of scraping.")
+    parser.add_argument("--verify-budget", type=int, default=DEFAULT_LINK_VERIFICATION_BUDGET, help="Number of links checked per --verify-links run.")
+    parser.add_argument("--verify-workers", type=int, default=DEFAULT_LINK_VERIFICATION_WORKERS, help="Concurrent link checks during --verify-links.")
+    parser.add_argument("--watch", action="store_true", help="Keep running, polling both listing heads and scraping incrementally when they change.")
+    parser.add_argument("--watch-interval", type=float, default=DEFAULT_WATCH_INTERVAL_SECONDS, help="Seconds between --watch polls.")
+    parser.add_argument("--watch-status-port", type=int, default=None, help="Serve the --watch health status as JSON on this local port.")
+    parser.add_argument("--serve-lookup", action="store_true", help="Serve mapping.json lookups over HTTP instead of scraping.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for --serve-lookup.")
+    parser.add_argument("--port", type=int, default=8080, help="Port for --serve-lookup.")
+    parser.add_argument("--report-path", default=None, help="Where to write the run report (scrape_report.json, or link_report.json for --verify-links).")
+    parser.add_argument("--archive-html", default=None, help="Archive every fetched detail and lower-court page under this directory.")
+    parser.add_argument("--reparse-from-archive", default=None, help="Re-derive stored rows offline from the archive in this directory and write reparse_diff.json.")
+    parser.add_argument("--repair", nargs="*", default=None, choices=sorted(REPAIR_PREDICATES), metavar="PREDICATE", help=f"Re-fetch stored rows matching these predicates ({', '.join(REPAIR_PREDICATES)}; all when none are given) and upsert the fields that changed.")
+    parser.add_argument("--repair-before", default=None, help="Also re-fetch rows dated before this ISO date (YYYY-MM-DD); implies --repair.")
+    parser.add_argument("--repair-limit", type=int, default=None, help="Re-fetch at most this many selected rows.")
+    parser.add_argument("--memory-budget", type=float, default=None, help="Fail the scrape before publishing if peak RSS exceeds this many MB, checked between phases.")
+    parser.add_argument("--time-budget", type=float, default=None, help="Wall-clock seconds for a scrape or link migration; work that would not finish before publishing is left to the next run.")
+    parser.add_argument("--shard", type=shard_arg, default=None, help="Run slice i of an N-way full backfill (i/N, from 1) and write its rows to --shard-dir instead of publishing.")
+    parser.add_argument("--shard-dir", default=str(SHARD_DIR), help="Where --shard runs write their partial CSVs and reports, and --merge-shards reads them.")
+    parser.add_argument("--case-pages", action="store_true", help="Write the static case pages under mal/ from the published mapping.json instead of scraping.")
+    parser.add_argument("--merge-shards", action="store_true", help="Publish the rows of a complete set of --shard runs from --shard-dir and regenerate the mapping.")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument("--record", default=None, metavar="CASSETTE", help="Record every HTTP request and response of the run to this gzip NDJSON cassette.")
+    transport.add_argument("--replay", default=None, metavar="CASSETTE", help="Serve HTTP from a cassette written by --record instead of the network.")
+    parser.add_argument("--replay-latency-scale", type=float, default=0.0, help="With --replay, wait each exchange's recorded duration times this (1 for the original timings, 0 for full speed).")
+    parser.add_argument("--memory-debug", action="store_true", help="Trace allocations with tracemalloc and record the top allocation sites per phase.")
     return parser.parse_args()
 
 def run_link_migration(
@@ -946,21 +3152,26 @@ def run_link_migration(
     since_date: date,
     decision_page_limit: int = DEFAULT_DECISION_PAGE_LIMIT,
     dry_run: bool = False,
+    time_budget: Optional[float] = None,
 ) -> int:
-    df = manager.load_existing_data().copy()
-    if df.empty:
+    deadline = Deadline(time_budget)
+    scraper.deadline = deadline
+    rows = manager.load_rows()
+    if not rows:
         logger.info("No CSV rows found to migrate.")
         return 0
+    if time_budget:
+        deadline.reserve_flush(manager.measure_flush_seconds(manager.rows_frame(rows)))
 
-    rows_since_date: Set[int] = set()
+    rows_since_date: List[int] = []
     needed_appeals_case_numbers: Set[str] = set()
-    for idx, row in df.iterrows():
-        parsed_date = parse_icelandic_date(str(row.get("verdict_date", "")))
+    for idx, row in enumerate(rows):
+        parsed_date = row.parsed_date
         if not parsed_date or parsed_date < since_date:
             continue
-        rows_since_date.add(idx)
-        appeals_case_number = str(row.get("appeals_case_number", "")).strip()
-        current_appeals_link = str(row.get("appeals_case_link", "")).strip()
+        rows_since_date.append(idx)
+        appeals_case_number = row.appeals_case_number.strip()
+        current_appeals_link = row.appeals_case_link.strip()
         if appeals_case_number and (not current_appeals_link or not is_island_url(current_appeals_link)):
             needed_appeals_case_numbers.add(appeals_case_number)
 
@@ -973,21 +3184,22 @@ def run_link_migration(
     rows_considered = 0
     supreme_updates = 0
     appeals_updates = 0
+    changed: Set[int] = set()
 
-    for idx, row in df.iterrows():
-        if idx not in rows_since_date:
-            continue
+    for idx in rows_since_date:
+        if deadline.should_stop():
+            break
 
+        row = rows[idx]
         rows_considered += 1
-        supreme_case_number = str(row.get("supreme_case_number", "")).strip()
-        appeals_case_number = str(row.get("appeals_case_number", "")).strip()
-        source_type = str(row.get("source_type", ""))
-        current_supreme_link = str(row.get("supreme_case_link", "")).strip()
-        current_appeals_link = str(row.get("appeals_case_link", "")).strip()
+        supreme_case_number = row.supreme_case_number.strip()
+        appeals_case_number = row.appeals_case_number.strip()
+        current_supreme_link = row.supreme_case_link.strip()
+        current_appeals_link = row.appeals_case_link.strip()
 
         if current_supreme_link and not is_island_url(current_supreme_link):
-            new_supreme_link = legacy_supreme_link_to_island(current_supreme_link, source_type)
-            if not new_supreme_link and "ákvörðun" in source_type.casefold():
+            new_supreme_link = legacy_supreme_link_to_island(current_supreme_link, row.source_type)
+            if not new_supreme_link and row.is_decision:
                 if decision_links is None:
                     decision_links = scraper.build_decision_link_index(
                         since_year=since_date.year,
@@ -1001,7 +3213,8 @@ def run_link_migration(
 
             if new_supreme_link:
                 if current_supreme_link != new_supreme_link:
-                    df.loc[idx, "supreme_case_link"] = new_supreme_link
+                    rows[idx] = row.replace(supreme_case_link=new_supreme_link)
+                    changed.add(idx)
                     supreme_updates += 1
             elif has_domain(current_supreme_link, "haestirettur.is"):
                 unresolved_supreme.append(supreme_case_number)
@@ -1015,7 +3228,8 @@ def run_link_migration(
             new_appeals_link = appeals_cache[appeals_case_number]
             if new_appeals_link:
                 if current_appeals_link != new_appeals_link:
-                    df.loc[idx, "appeals_case_link"] = new_appeals_link
+                    rows[idx] = rows[idx].replace(appeals_case_link=new_appeals_link)
+                    changed.add(idx)
                     appeals_updates += 1
             elif current_appeals_link and has_domain(current_appeals_link, "landsrettur.is"):
                 unresolved_appeals.append(appeals_case_number)
@@ -1034,82 +3248,682 @@ def run_link_migration(
         logger.warning("Unresolved Supreme links: %s", ", ".join(unresolved_supreme[:20]))
     if unresolved_appeals:
         logger.warning("Unresolved Landsréttur links: %s", ", ".join(unresolved_appeals[:20]))
+    if deadline.reached:
+        # Migrated rows no longer carry legacy links, so rerunning the
+        # migration picks up exactly the rows left here.
+        logger.warning(
+            "Time budget reached; %s rows from %s onward are left for the next --migrate-island-links run.",
+            len(rows_since_date) - rows_considered,
+            since_date.isoformat(),
+        )
+
+    violations = manager.validate_publish(rows[idx] for idx in sorted(changed))
+    if violations:
+        logger.error(f"Migrated rows break the data contract; leaving files unchanged: {summarize_violations(violations)}")
+        return 1
 
     if dry_run:
         logger.info("Dry run requested; leaving files unchanged.")
         return 1 if unresolved_supreme or unresolved_appeals else 0
 
-    manager.write_data(df)
+    manager.write_rows(rows)
+    manager.record_validation()
     manager.generate_json_mapping()
     manager.update_timestamp()
     return 1 if unresolved_supreme or unresolved_appeals else 0
 
-def run_scrape(
+def run_link_verification(
     scraper: Scraper,
     manager: DataManager,
-    full: bool = False,
-    max_pages: Optional[int] = None,
-    report_path: Path = SCRAPE_REPORT_PATH,
+    budget: int = DEFAULT_LINK_VERIFICATION_BUDGET,
+    workers: int = DEFAULT_LINK_VERIFICATION_WORKERS,
+    report_path: Path = LINK_REPORT_PATH,
 ) -> int:
-    report = ScrapeReport(mode="full" if full else "incremental", max_pages=max_pages)
+    """Check the least-recently-verified stored links within a request budget.
+
+    Each run verifies `budget` links, never-checked ones first, so the whole
+    corpus is covered every ceil(links / budget) runs. Results are persisted
+    in `link_verification.json` and broken links are listed in the report.
+    """
+    report = ScrapeReport(mode="verify-links")
+    df = manager.load_existing_data()
+    owners: Dict[str, Dict[str, str]] = {}
+    for row in df.to_dict(orient="records"):
+        for column in ("supreme_case_link", "appeals_case_link"):
+            link = str(row.get(column, "")).strip()
+            if link:
+                owners.setdefault(link, {"column": column, "supreme_case_number": row["supreme_case_number"]})
+
+    state = {link: entry for link, entry in manager.load_link_verifications().items() if link in owners}
+    due = sorted(owners, key=lambda link: (state.get(link, {}).get("verified_at", ""), link))[:max(0, budget)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        statuses = dict(zip(due, executor.map(scraper.check_link, due)))
+
+    verified_at = now_reykjavik_iso()
+    for link, status in statuses.items():
+        ok = 200 <= status < 400
+        state[link] = {"verified_at": verified_at, "status": status, "ok": ok}
+
+    report.broken_links = [
+        {"url": link, "status": entry["status"], "verified_at": entry["verified_at"], **owners[link]}
+        for link, entry in sorted(state.items())
+        if not entry["ok"]
+    ]
+    report.link_verification = {
+        "budget": budget,
+        "stored_links": len(owners),
+        "verified_this_run": len(statuses),
+        "never_verified": len(owners) - len(state),
+        "broken": len(report.broken_links),
+        "cycle_runs": math.ceil(len(owners) / budget) if budget > 0 else 0,
+    }
+    manager.save_link_verifications(state)
+    record_connection_stats(report, scraper)
+    logger.info(
+        "Verified %s of %s stored links; %s known broken. Full cycle takes %s runs.",
+        len(statuses),
+        len(owners),
+        len(report.broken_links),
+        report.link_verification["cycle_runs"],
+    )
+    write_scrape_report(report, report_path)
+    return 1 if report.broken_links else 0
 
-    df_existing = manager.load_existing_data()
-    known_case_numbers = set(df_existing["supreme_case_number"].dropna().str.strip())
-    known_case_numbers.discard("")
+def run_reparse_from_archive(
+    manager: DataManager,
+    archive: HtmlArchive,
+    workers: int = 1,
+    diff_path: Path = REPARSE_DIFF_PATH,
+    dry_run: bool = False,
+) -> int:
+    """Re-derive stored rows from archived pages with the current parsing rules.
+
+    Pages are parsed across a process pool. Rows that no longer yield a Supreme
+    or Landsréttur case number keep their stored values and are listed as
+    unresolved, so a parser regression cannot blank out the dataset.
+    """
+    rows = manager.load_rows()
+    lower_court_links = {
+        row.appeals_case_number: row.appeals_case_link
+        for row in rows
+        if row.appeals_case_number and is_island_url(row.appeals_case_link)
+    }
+    indexes = [idx for idx, row in enumerate(rows) if row.supreme_case_link in archive]
+    tasks = [(rows[idx].supreme_case_link, rows[idx].source_type) for idx in indexes]
+    logger.info(f"Reparsing {len(tasks)} archived rows with {workers} worker processes; {len(rows) - len(tasks)} rows are not archived.")
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        initializer=_init_reparse_worker,
+        initargs=(str(archive.root), lower_court_links),
+    ) as executor:
+        reparsed = list(executor.map(reparse_archived_page, tasks, chunksize=max(1, len(tasks) // (max(1, workers) * 4))))
+
+    changes: List[Dict[str, Any]] = []
+    unresolved: List[str] = []
+    for idx, new_row in zip(indexes, reparsed):
+        old_row = rows[idx]
+        if not new_row or not new_row.supreme_case_number or not new_row.appeals_case_number:
+            unresolved.append(old_row.supreme_case_link)
+            continue
+        # Links are left alone: archived pages predate the Ísland.is link
+        # migration, so the appeals link is only replaced when the appeals
+        # case itself changed.
+        if new_row.appeals_case_number == old_row.appeals_case_number:
+            new_row = new_row.replace(appeals_case_link=old_row.appeals_case_link)
+        else:
+            new_row = new_row.replace(
+                appeals_case_link=lower_court_links.get(new_row.appeals_case_number) or new_row.appeals_case_link,
+            )
+        fields = {
+            column: {"old": old_row[column], "new": new_row[column]}
+            for column in REPARSED_COLUMNS
+            if new_row[column] != old_row[column]
+        }
+        if not fields:
+            continue
+        changes.append({"supreme_case_link": old_row.supreme_case_link, "supreme_case_number": old_row.supreme_case_number, "fields": fields})
+        rows[idx] = old_row.replace(**{column: change["new"] for column, change in fields.items()})
+
+    write_json_atomic(diff_path, {
+        "generated_at": now_reykjavik_iso(),
+        "archive": str(archive.root),
+        "rows_stored": len(rows),
+        "rows_reparsed": len(tasks),
+        "rows_not_archived": len(rows) - len(tasks),
+        "rows_changed": len(changes),
+        "unresolved": unresolved,
+        "changes": changes,
+    })
+    logger.info(f"Reparse changed {len(changes)} rows; {len(unresolved)} unresolved. Diff written to {diff_path}.")
 
-    all_data: List[Dict[str, str]] = []
+    if dry_run or not changes:
+        return 0
+    manager.write_rows(rows)
+    manager.generate_json_mapping()
+    manager.update_timestamp()
+    return 0
 
-    verdict_rows, verdict_source_ok = scraper.scrape_verdicts(
-        known_case_numbers,
-        full=full,
-        max_pages=max_pages,
-        report=report,
-    )
-    all_data.extend(verdict_rows)
-    known_case_numbers.update(row["supreme_case_number"] for row in verdict_rows if row.get("supreme_case_number"))
-
-    decision_rows, decision_source_ok = scraper.scrape_decisions(
-        known_case_numbers,
-        full=full,
-        max_pages=max_pages,
-        report=report,
+def row_has_missing_fields(row: VerdictRow) -> bool:
+    """Fields the parser left empty: no date, no Landsréttur link, or a decision without a status."""
+    return (
+        not row.verdict_date
+        or (bool(row.appeals_case_number) and not row.appeals_case_link)
+        or (row.is_decision and not row.decision_status)
     )
-    all_data.extend(decision_rows)
 
-    source_ok = verdict_source_ok or decision_source_ok
-    if not source_ok:
-        reason = "No source listing pages were fetched successfully; leaving generated artifacts untouched."
-        report.mark_failed(reason)
-        report.log_summary()
-        write_scrape_report(report, report_path)
-        logger.error(reason)
+def row_has_legacy_links(row: VerdictRow) -> bool:
+    return any(link and not is_island_url(link) for link in (row.supreme_case_link, row.appeals_case_link))
+
+REPAIR_PREDICATES: Dict[str, Callable[[VerdictRow], bool]] = {
+    "missing-fields": row_has_missing_fields,
+    "legacy-links": row_has_legacy_links,
+}
+
+def select_repair_rows(
+    rows: List[VerdictRow],
+    predicates: Iterable[str],
+    before: Optional[date] = None,
+) -> List[Tuple[int, List[str]]]:
+    """Indexes of the rows to re-fetch, each with the predicates that selected it.
+
+    `before` selects rows dated before it, and rows without a date.
+    """
+    predicates = list(predicates)
+    selected: List[Tuple[int, List[str]]] = []
+    for idx, row in enumerate(rows):
+        reasons = [name for name in predicates if REPAIR_PREDICATES[name](row)]
+        if before and (not row.parsed_date or row.parsed_date < before):
+            reasons.append(f"before-{before.isoformat()}")
+        if reasons and row.supreme_case_link:
+            selected.append((idx, reasons))
+    return selected
+
+def refetch_row(scraper: Scraper, row: VerdictRow) -> Optional[VerdictRow]:
+    """Re-parse a stored row from its Ísland.is Supreme page.
+
+    A legacy Supreme link is first resolved the way `--migrate-island-links`
+    does it, from the link's id or, for verdicts, an Ísland.is search. Legacy
+    decision links without an id need the decision listing index and are
+    left unresolved.
+    """
+    link = row.supreme_case_link
+    if not is_island_url(link):
+        link = legacy_supreme_link_to_island(link, row.source_type)
+        if not link and not row.is_decision:
+            link = scraper.find_island_supreme_verdict_link(row.supreme_case_number)
+    return scraper.parse_supreme_page(link, row.source_type) if link else None
+
+def repaired_fields(old_row: VerdictRow, new_row: VerdictRow) -> Dict[str, Dict[str, str]]:
+    """The fields a re-fetched row improves, as {"old", "new"} pairs.
+
+    Only non-empty values replace stored ones, and a link is only replaced
+    when it was empty or the new one is an Ísland.is link, so a flaky page
+    can fill gaps but never blank out or downgrade a row.
+    """
+    fields: Dict[str, Dict[str, str]] = {}
+    new_supreme_link = new_row.supreme_case_link
+    if new_supreme_link != old_row.supreme_case_link and is_island_url(new_supreme_link) and not is_island_url(old_row.supreme_case_link):
+        fields["supreme_case_link"] = {"old": old_row.supreme_case_link, "new": new_supreme_link}
+    for column in ("verdict_date", "decision_status"):
+        if new_row[column] and new_row[column] != old_row[column]:
+            fields[column] = {"old": old_row[column], "new": new_row[column]}
+
+    new_link = new_row.appeals_case_link
+    if new_row.appeals_case_number and new_row.appeals_case_number != old_row.appeals_case_number:
+        fields["appeals_case_number"] = {"old": old_row.appeals_case_number, "new": new_row.appeals_case_number}
+        if new_link and new_link != old_row.appeals_case_link:
+            fields["appeals_case_link"] = {"old": old_row.appeals_case_link, "new": new_link}
+    elif new_row.appeals_case_number and new_link and new_link != old_row.appeals_case_link:
+        if not old_row.appeals_case_link or (is_island_url(new_link) and not is_island_url(old_row.appeals_case_link)):
+            fields["appeals_case_link"] = {"old": old_row.appeals_case_link, "new": new_link}
+    return fields
+
+def run_repair(
+    scraper: Scraper,
+    manager: DataManager,
+    predicates: Iterable[str] = tuple(REPAIR_PREDICATES),
+    before: Optional[date] = None,
+    limit: Optional[int] = None,
+    workers: int = DEFAULT_REPAIR_WORKERS,
+    diff_path: Path = REPAIR_DIFF_PATH,
+    dry_run: bool = False,
+) -> int:
+    """Re-fetch the Supreme pages of selected stored rows and fill in what they lacked.
+
+    Unlike `--full`, only the selected rows' pages (and their lower-court
+    pages) are requested. Pages that fail, or now parse to a different Supreme
+    case number, leave their row unchanged and are listed as unresolved.
+    """
+    predicates = list(predicates)
+    rows = manager.load_rows()
+    selected = select_repair_rows(rows, predicates, before=before)
+    if limit is not None:
+        selected = selected[:max(0, limit)]
+    logger.info(f"Repairing {len(selected)} of {len(rows)} stored rows with {workers} workers.")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        fetched = list(executor.map(lambda idx: refetch_row(scraper, rows[idx]), [idx for idx, _ in selected]))
+
+    changes: List[Dict[str, Any]] = []
+    unresolved: List[str] = []
+    changed: List[int] = []
+    for (idx, reasons), new_row in zip(selected, fetched):
+        old_row = rows[idx]
+        if not new_row or new_row.supreme_case_number != old_row.supreme_case_number:
+            unresolved.append(old_row.supreme_case_number)
+            continue
+        fields = repaired_fields(old_row, new_row)
+        if not fields:
+            continue
+        changes.append({
+            "supreme_case_link": old_row.supreme_case_link,
+            "supreme_case_number": old_row.supreme_case_number,
+            "selected_by": reasons,
+            "fields": fields,
+        })
+        rows[idx] = old_row.replace(**{column: change["new"] for column, change in fields.items()})
+        changed.append(idx)
+
+    write_json_atomic(diff_path, {
+        "generated_at": now_reykjavik_iso(),
+        "predicates": predicates + ([f"before-{before.isoformat()}"] if before else []),
+        "rows_stored": len(rows),
+        "rows_selected": len(selected),
+        "rows_changed": len(changes),
+        "unresolved": unresolved,
+        "changes": changes,
+        "http_requests": sum(entry["requests"] for entry in scraper.connection_stats().values()),
+    })
+    logger.info(f"Repair changed {len(changes)} rows; {len(unresolved)} unresolved. Diff written to {diff_path}.")
+    if unresolved:
+        logger.warning("Unresolved repairs: %s", ", ".join(unresolved[:20]))
+
+    violations = manager.validate_publish(rows[idx] for idx in changed)
+    if violations:
+        logger.error(f"Repaired rows break the data contract; leaving files unchanged: {summarize_violations(violations)}")
         return 1
+    if dry_run or not changes:
+        return 0
+    manager.write_rows(rows)
+    manager.record_validation()
+    manager.generate_json_mapping()
+    manager.update_timestamp()
+    return 0
 
-    suspicious_reason = suspicious_run_reason(report, full=full)
-    if suspicious_reason:
-        report.mark_failed(suspicious_reason)
+def linked_rows(rows: Iterable[VerdictRow]) -> Iterator[VerdictRow]:
+    """The rows `publish_staged` would append: those with a Landsréttur case number."""
+    return (row for row in rows if row.get("appeals_case_number", "").strip())
+
+def record_contract_violations(report: ScrapeReport, violations: List[Violation]) -> str:
+    report.contract_violations = [violation.to_dict() for violation in violations[:MAX_REPORTED_VIOLATIONS]]
+    return summarize_violations(violations)
+
+def merge_pending_work(
+    previous: Dict[str, List[Dict[str, Any]]],
+    deferred: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Pending work after a failed run: what it was resuming plus what it deferred.
+
+    Links are kept once. A walk deferred again replaces its older cursor, so
+    the next run resumes it from the page this run reached.
+    """
+    detail_links = {entry["link"]: entry for entry in previous["detail_links"] + deferred["detail_links"]}
+    cursors: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for cursor in previous["listing_cursors"] + deferred["listing_cursors"]:
+        cursors[(cursor["source"], cursor.get("full"), cursor.get("date_from"), cursor.get("date_to"))] = cursor
+    return {"detail_links": list(detail_links.values()), "listing_cursors": list(cursors.values())}
+
+def fail_run(report: ScrapeReport, reason: str, report_path: Path) -> int:
+    report.mark_failed(reason)
+    report.log_summary()
+    write_scrape_report(report, report_path)
+    return 1
+
+def verdict_windows_for_run(
+    manager: "DataManager",
+    df_existing: pd.DataFrame,
+    full: bool,
+    watermark_overlap_days: Optional[int],
+    date_window_days: Optional[int],
+    since_date: date,
+) -> Optional[List[DateWindow]]:
+    if date_window_days:
+        today = datetime.now(ZoneInfo("Atlantic/Reykjavik")).date()
+        return date_windows(since_date, today, date_window_days)
+    if full or watermark_overlap_days is None:
+        return None
+    watermark = manager.verdict_watermark(df_existing, watermark_overlap_days)
+    return [(watermark, None)] if watermark else None
+
+def run_scrape(
+    scraper: Scraper,
+    manager: DataManager,
+    full: bool = False,
+    max_pages: Optional[int] = None,
+    report_path: Path = SCRAPE_REPORT_PATH,
+    memory: Optional[MemoryTracker] = None,
+    workers: int = 1,
+    watermark_overlap_days: Optional[int] = DEFAULT_WATERMARK_OVERLAP_DAYS,
+    date_window_days: Optional[int] = None,
+    since_date: date = date(2018, 1, 1),
+    parse_workers: int = 0,
+    inline_parse_bytes: int = DEFAULT_INLINE_PARSE_BYTES,
+    time_budget: Optional[float] = None,
+    shard: Optional[Shard] = None,
+    shard_dir: Path = SHARD_DIR,
+) -> int:
+    """Scrape new rows, then publish them once the run passes its guards.
+
+    A `shard` run walks only its slice of a full backfill, leaves the
+    published artifacts, pending work and unlinked cache alone, and writes
+    its linked rows and its report to `shard_dir` for `run_shard_merge`.
+    """
+    full = full or shard is not None
+    report = ScrapeReport(mode="full" if full else "incremental", max_pages=max_pages, shard=shard.label if shard else "")
+    # A shard stages and publishes into its own partial CSV.
+    target = manager
+    if shard:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        target = DataManager(csv_path=str(shard_dir / f"{shard.name}.csv"))
+        report_path = shard_dir / f"{shard.name}.report.json"
+    decision_pages = None
+    deadline = Deadline(time_budget)
+    scraper.deadline = deadline
+    memory = memory or MemoryTracker()
+    report.memory_budget_mb = memory.budget_mb
+    report.memory = memory.phases
+    memory.start()
+
+    def keep_deferred_work() -> None:
+        # Nothing is published, so the previous pending work still stands and
+        # this run's deferrals join it.
+        deferred = deadline.pending_work()
+        if not shard and (deferred["detail_links"] or deferred["listing_cursors"]):
+            manager.save_pending_work(merge_pending_work(manager.load_pending_work(), deferred))
+
+    try:
+        with memory.phase("load_existing"):
+            df_existing = manager.load_existing_data()
+            known_case_numbers = set(df_existing["supreme_case_number"].dropna().str.strip())
+            known_case_numbers.discard("")
+            stored_case_numbers = frozenset(known_case_numbers)
+            unlinked_cache = manager.load_unlinked_cache()
+            known_index = manager.known_item_index(df_existing, unlinked_cache)
+            if shard:
+                today = datetime.now(ZoneInfo("Atlantic/Reykjavik")).date()
+                windows = shard.verdict_windows(since_date, today, date_window_days or DEFAULT_SHARD_WINDOW_DAYS)
+                decision_pages = shard.decision_page_ranges(max_pages or DEFAULT_DECISION_PAGE_LIMIT)
+            else:
+                windows = verdict_windows_for_run(
+                    manager, df_existing, full, watermark_overlap_days, date_window_days, since_date
+                )
+            if time_budget:
+                deadline.reserve_flush(manager.measure_flush_seconds(df_existing))
+            del df_existing
+            # Pending work belongs to the regular incremental runs.
+            pending = manager.load_pending_work() if not shard else {"detail_links": [], "listing_cursors": []}
+            scraper.resume_cursors = pending["listing_cursors"]
+            pending_links = [
+                (entry["source"], entry["link"])
+                for entry in pending["detail_links"]
+                if entry.get("source") in SOURCE_TYPES and not known_index.skip_reason(entry["link"], "")
+            ]
+            if pending_links or scraper.resume_cursors:
+                logger.info(
+                    f"Resuming {len(pending_links)} detail pages and {len(scraper.resume_cursors)} "
+                    "listing walks left by the previous run."
+                )
+
+        if windows:
+            report.verdict_date_windows = [
+                [date_from.isoformat() if date_from else "", date_to.isoformat() if date_to else ""]
+                for date_from, date_to in windows
+            ]
+            logger.info(f"Discovering verdicts in {len(windows)} date window(s), newest{format_date_window(*windows[0])}.")
+
+        # Rows stream into a staging file as they are parsed; the CSV is only
+        # appended to after the guards below have passed.
+        sink = target.row_sink(known_case_numbers)
+        report.staged_rows_recovered = sink.recover()
+
+        parsing = scraper.parsing_in_processes(parse_workers, inline_parse_bytes) if parse_workers > 0 else nullcontext()
+        with parsing:
+            if workers > 1:
+                with memory.phase("scrape_pipeline"):
+                    pipeline = ScrapePipeline(scraper, detail_workers=workers, lower_court_workers=workers)
+                    _, source_ok = pipeline.run(
+                        known_case_numbers,
+                        full=full,
+                        max_pages=max_pages,
+                        report=report,
+                        windows=windows,
+                        known_index=known_index,
+                        pending=pending_links,
+                        on_row=sink.add,
+                        decision_pages=decision_pages,
+                    )
+            else:
+                with memory.phase("scrape_verdicts"):
+                    sink.extend(scraper.scrape_verdicts(
+                        known_case_numbers,
+                        full=full,
+                        max_pages=max_pages,
+                        report=report,
+                        windows=windows,
+                        known_index=known_index,
+                    ))
+                    known_case_numbers.update(sink.case_numbers)
+
+                with memory.phase("scrape_decisions"):
+                    sink.extend(scraper.scrape_decisions(
+                        known_case_numbers,
+                        full=full,
+                        max_pages=max_pages,
+                        report=report,
+                        known_index=known_index,
+                        page_ranges=decision_pages,
+                    ))
+                    known_case_numbers.update(sink.case_numbers)
+                source_ok = any(report.source(source).listing_pages_fetched > 0 for source in SOURCE_TYPES)
+
+                visited = set(sink.links)
+                visited.update(island_link_key(case["supreme_case_link"]) for case in report.skipped_cases)
+                visited.update(island_link_key(link) for _, link in scraper.deferred)
+                pending_links = [(source, link) for source, link in pending_links if island_link_key(link) not in visited]
+                if pending_links:
+                    with memory.phase("scrape_pending"):
+                        sink.extend(scraper.scrape_pending(pending_links, known_case_numbers, report))
+
+            sink.extend(scraper.retry_deferred(report, known_case_numbers))
+
+        record_connection_stats(report, scraper)
+        report.time_budget = deadline.to_dict()
+        if not source_ok:
+            reason = "No source listing pages were fetched successfully; leaving generated artifacts untouched."
+            if deadline.reached and report.total_listing_pages_fetched == 0:
+                reason = "The time budget ran out before any listing page was fetched; leaving generated artifacts untouched."
+            logger.error(reason)
+            sink.discard()
+            keep_deferred_work()
+            return fail_run(report, reason, report_path)
+
+        suspicious_reason = suspicious_run_reason(report, full=full)
+        if suspicious_reason:
+            logger.error(f"Suspicious scrape run; leaving generated artifacts untouched: {suspicious_reason}")
+            sink.discard()
+            keep_deferred_work()
+            return fail_run(report, suspicious_reason, report_path)
+
+        # Shard rows are checked when the merge publishes them.
+        violations = [] if shard else manager.validate_publish(linked_rows(sink.rows()), stored_case_numbers)
+        if violations:
+            reason = record_contract_violations(report, violations)
+            logger.error(f"Data contract violated; leaving generated artifacts untouched: {reason}")
+            sink.discard()
+            keep_deferred_work()
+            return fail_run(report, reason, report_path)
+
+        logger.info(
+            f"Parsed {sink.staged} valid Supreme Court pages; "
+            f"{sink.linked} include Landsréttur case numbers."
+        )
+        memory.check("scrape")
+        if shard:
+            with memory.phase("save_csv", enforce=False):
+                target.csv_path.unlink(missing_ok=True)
+                report.csv_rows_added = target.publish_staged(sink)
+            logger.info(f"Shard {shard.label} wrote {report.csv_rows_added} rows to {target.csv_path}.")
+            report.log_summary()
+            write_scrape_report(report, report_path)
+            return 0
+        with memory.phase("save_csv", enforce=False):
+            report.unlinked_cases_cached = manager.update_unlinked_cache(unlinked_cache, report, sink.rows())
+            report.csv_rows_added = manager.publish_staged(sink)
+            manager.record_validation()
+            manager.save_pending_work(deadline.pending_work())
+        with memory.phase("generate_json_mapping", enforce=False):
+            report.mapping_links_generated = manager.generate_json_mapping()
+            report.mapping_generation = manager.generation
+        manager.update_timestamp()
+        report.artifacts_refreshed = True
+        if deadline.reached:
+            logger.warning(
+                f"Time budget reached; {len(deadline.detail_links)} detail pages and "
+                f"{len(deadline.listing_cursors)} listing walks are left for the next run in {manager.pending_path}."
+            )
         report.log_summary()
         write_scrape_report(report, report_path)
-        logger.error(f"Suspicious scrape run; leaving generated artifacts untouched: {suspicious_reason}")
-        return 1
+        return 0
+    except MemoryBudgetExceeded as e:
+        logger.error(f"Memory budget exceeded; leaving generated artifacts untouched: {e}")
+        target.row_sink(set()).discard()
+        keep_deferred_work()
+        return fail_run(report, str(e), report_path)
+    finally:
+        memory.stop()
+
+def run_shard_merge(manager: DataManager, shard_dir: Path = SHARD_DIR, report_path: Path = SCRAPE_REPORT_PATH) -> int:
+    """Publish the partial CSVs of a complete set of shard runs in one go.
+
+    Shard rows are appended like a scrape's, in shard order: stored rows
+    are kept and the first shard to stage a Supreme case number wins. The
+    shard reports are summed into one report, which has to pass the full-run
+    guards before the CSV is touched; the mapping is regenerated once.
+    """
+    report = ScrapeReport(mode="full")
+    reports: Dict[Shard, Dict[str, Any]] = {}
+    for path in sorted(shard_dir.glob("shard-*-of-*.report.json")):
+        index, count = re.fullmatch(r"shard-(\d+)-of-(\d+)\.report\.json", path.name).groups()
+        reports[Shard(int(index), int(count))] = json.loads(path.read_text(encoding="utf-8"))
+    counts = {shard.count for shard in reports}
+    if len(counts) != 1:
+        return fail_run(report, f"Expected shard reports of one N/N split in {shard_dir}, found {sorted(counts) or 'none'}.", report_path)
+    count = counts.pop()
+    missing = [f"{index}/{count}" for index in range(1, count + 1) if Shard(index, count) not in reports]
+    if missing:
+        return fail_run(report, f"Missing shard reports: {', '.join(missing)}.", report_path)
+
+    shards = sorted(reports, key=lambda shard: shard.index)
+    for shard in shards:
+        data = reports[shard]
+        if data.get("failed"):
+            return fail_run(report, f"Shard {shard.label} failed: {data.get('failure_reason', '')}", report_path)
+        report.merge(data)
+        report.merged_shards.append(shard.label)
 
-    linked_rows = [row for row in all_data if row.get("appeals_case_number")]
-    logger.info(
-        f"Parsed {len(all_data)} valid Supreme Court pages; "
-        f"{len(linked_rows)} include Landsréttur case numbers."
-    )
-    report.csv_rows_added = manager.save_csv(all_data)
+    df_existing = manager.load_existing_data()
+    known_case_numbers = set(df_existing["supreme_case_number"].dropna().str.strip())
+    known_case_numbers.discard("")
+    stored_case_numbers = frozenset(known_case_numbers)
+    del df_existing
+    sink = manager.row_sink(known_case_numbers)
+    report.staged_rows_recovered += sink.recover()
+    for shard in shards:
+        path = shard_dir / f"{shard.name}.csv"
+        if not path.exists():
+            continue
+        with path.open(newline="", encoding="utf-8") as file:
+            sink.extend(VerdictRow.from_mapping(record) for record in csv.DictReader(file))
+
+    suspicious_reason = suspicious_run_reason(report, full=True)
+    if suspicious_reason:
+        logger.error(f"Suspicious shard merge; leaving generated artifacts untouched: {suspicious_reason}")
+        sink.discard()
+        return fail_run(report, suspicious_reason, report_path)
+    violations = manager.validate_publish(linked_rows(sink.rows()), stored_case_numbers)
+    if violations:
+        reason = record_contract_violations(report, violations)
+        logger.error(f"Data contract violated; leaving generated artifacts untouched: {reason}")
+        sink.discard()
+        return fail_run(report, reason, report_path)
+
+    logger.info(f"Merging {len(shards)} shards: {sink.staged} rows not stored yet, {sink.linked} linked.")
+    report.unlinked_cases_cached = manager.update_unlinked_cache(manager.load_unlinked_cache(), report, sink.rows())
+    report.csv_rows_added = manager.publish_staged(sink)
+    manager.record_validation()
     report.mapping_links_generated = manager.generate_json_mapping()
+    report.mapping_generation = manager.generation
     manager.update_timestamp()
     report.artifacts_refreshed = True
     report.log_summary()
     write_scrape_report(report, report_path)
     return 0
 
+def connection_pool_size(args: argparse.Namespace) -> int:
+    """Per-host connections needed so no mode's worker threads wait on the pool."""
+    return max(
+        DEFAULT_POOL_SIZE,
+        len(SOURCE_TYPES) + 2 * args.workers,
+        args.verify_workers,
+        DEFAULT_LOWER_COURT_WORKERS,
+    )
+
+def run_case_pages(manager: DataManager) -> int:
+    """Bring `mal/` up to date with the published mapping; unchanged pages are skipped."""
+    mapping = manager._load_published_mapping()
+    if mapping is None:
+        logger.error(f"No published mapping at {manager.json_path}; nothing to render.")
+        return 1
+    manager.write_case_pages(mapping)
+    return 0
+
+def record_connection_stats(report: ScrapeReport, scraper: Any) -> None:
+    connection_stats = getattr(scraper, "connection_stats", None)
+    if connection_stats:
+        report.http_connections = connection_stats()
+    transport_stats = getattr(scraper, "transport_stats", None)
+    if transport_stats:
+        report.http_transport = transport_stats()
+
 def main() -> int:
     args = parse_args()
-    scraper = Scraper()
     manager = DataManager()
+    if args.serve_lookup:
+        return serve_lookup(manager.json_path, host=args.host, port=args.port)
+    if args.case_pages:
+        return run_case_pages(manager)
+    if args.merge_shards:
+        return run_shard_merge(manager, Path(args.shard_dir), report_path=Path(args.report_path or SCRAPE_REPORT_PATH))
+    if args.reparse_from_archive:
+        return run_reparse_from_archive(
+            manager,
+            HtmlArchive(Path(args.reparse_from_archive)),
+            workers=max(args.workers, os.cpu_count() or 1),
+            dry_run=args.dry_run,
+        )
+    scraper = Scraper(
+        archive=HtmlArchive(Path(args.archive_html)) if args.archive_html else None,
+        pool_size=connection_pool_size(args),
+        recorder=CassetteWriter(Path(args.record)) if args.record else None,
+        replay=ReplayAdapter(Path(args.replay), latency_scale=args.replay_latency_scale) if args.replay else None,
+    )
+    # Closing the session closes its adapter, which finishes a recording.
+    with scraper.session:
+        return run_scraper_command(args, manager, scraper)
+
+def run_scraper_command(args: argparse.Namespace, manager: DataManager, scraper: Scraper) -> int:
     if args.migrate_island_links:
         return run_link_migration(
             scraper,
@@ -1117,8 +3931,53 @@ def main() -> int:
             since_date=date.fromisoformat(args.since_date),
             decision_page_limit=args.decision_page_limit,
             dry_run=args.dry_run,
+            time_budget=args.time_budget,
+        )
+    if args.repair is not None or args.repair_before:
+        return run_repair(
+            scraper,
+            manager,
+            predicates=() if args.repair is None else args.repair or tuple(REPAIR_PREDICATES),
+            before=date.fromisoformat(args.repair_before) if args.repair_before else None,
+            limit=args.repair_limit,
+            workers=max(args.workers, DEFAULT_REPAIR_WORKERS),
+            dry_run=args.dry_run,
+        )
+    if args.verify_links:
+        return run_link_verification(
+            scraper,
+            manager,
+            budget=args.verify_budget,
+            workers=args.verify_workers,
+            report_path=Path(args.report_path or LINK_REPORT_PATH),
         )
-    return run_scrape(scraper, manager, full=args.full, max_pages=args.max_pages)
+    memory = MemoryTracker(budget_mb=args.memory_budget, debug=args.memory_debug)
+
+    def scrape() -> int:
+        return run_scrape(
+            scraper,
+            manager,
+            full=args.full,
+            max_pages=args.max_pages,
+            report_path=Path(args.report_path or SCRAPE_REPORT_PATH),
+            memory=memory,
+            workers=args.workers,
+            watermark_overlap_days=None if args.no_date_watermark else args.watermark_overlap_days,
+            date_window_days=args.date_window_days,
+            since_date=date.fromisoformat(args.since_date),
+            parse_workers=args.parse_workers,
+            inline_parse_bytes=args.inline_parse_bytes,
+            time_budget=args.time_budget,
+            shard=args.shard,
+            shard_dir=Path(args.shard_dir),
+        )
+
+    if args.watch:
+        watcher = ListingWatcher(scraper, scrape, interval=args.watch_interval)
+        if args.watch_status_port is not None:
+            serve_watch_status(watcher, args.watch_status_port)
+        return watcher.run()
+    return scrape()
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,949 @@
+"""Landsréttur → Hæstiréttur lookups over the generated `mapping.json`.
+
+Mirrors the lookup rules in `app.js` so other tools can resolve case numbers
+without reimplementing them, and serves them over a small local HTTP API.
+Standard library only, so it can run anywhere the mapping is deployed.
+
+    from lookup import Lookup
+    Lookup.from_mapping("mapping.json").lookup("Mál nr. 731 / 2022")
+
+Processes that only need exact lookups can memory-map the binary index
+instead of parsing the JSON:
+
+    from lookup import BinaryIndex
+    BinaryIndex("mapping.idx").lookup("731/2022")
+
+Bulk lookups stream a file of case numbers to CSV or NDJSON:
+
+    python lookup.py cases.txt --format ndjson > results.ndjson
+"""
+import argparse
+import bisect
+import csv
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import re
+import struct
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+MAPPING_PATH = Path("mapping.json")
+CSV_PATH = Path("allir_domar_og_akvardanir.csv")
+CASE_INDEX_PATH = Path("case_index.json")
+CASE_INDEX_VERSION = 1
+BINARY_INDEX_PATH = Path("mapping.idx")
+BINARY_INDEX_MAGIC = b"HVIX"
+BINARY_INDEX_VERSION = 1
+CHANGES_DIR = Path("changes")
+CASE_PAGES_DIR = Path("mal")
+# The app page whose <head> every case page reuses.
+INDEX_HTML_PATH = Path(__file__).resolve().parent / "index.html"
+# Bump with any change to the page markup so every page is regenerated.
+CASE_PAGE_VERSION = 1
+DEFAULT_CACHE_SIZE = 4096
+RECORD_FIELDS = [
+    "supreme_case_number",
+    "supreme_case_link",
+    "appeals_case_link",
+    "source_type",
+    "verdict_date",
+    "verdict_date_iso",
+    "decision_status",
+]
+ICELANDIC_MONTHS = {
+    "janúar": 1,
+    "febrúar": 2,
+    "mars": 3,
+    "apríl": 4,
+    "maí": 5,
+    "júní": 6,
+    "júlí": 7,
+    "ágúst": 8,
+    "september": 9,
+    "október": 10,
+    "nóvember": 11,
+    "desember": 12,
+}
+MAX_SUGGESTIONS = 3
+MAX_SUGGESTION_DISTANCE = 3
+MAX_BATCH_SIZE = 10000
+# A full batch of padded case numbers fits comfortably.
+MAX_REQUEST_BYTES = 1024 * 1024
+DEFAULT_RELOAD_INTERVAL_SECONDS = 2.0
+
+# JavaScript's \s and String.prototype.trim() whitespace set, which differs
+# from Python's: it includes U+FEFF but not the U+001C-U+001F separators.
+JS_WHITESPACE = "\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+JS_WHITESPACE_RE = re.compile(f"[{JS_WHITESPACE}]+")
+JS_TRIM_RE = re.compile(f"^[{JS_WHITESPACE}]+|[{JS_WHITESPACE}]+$")
+CASE_PREFIX_RE = re.compile(f"^(?:landsréttarmál(?:ið)?|m[áa]l)[{JS_WHITESPACE}]*nr\\.?[{JS_WHITESPACE}]*", re.I)
+# re.ASCII: JavaScript's \d only matches 0-9.
+SLASH_CASE_RE = re.compile(r"^(\d{1,4})/(\d{4})$", re.ASCII)
+HYPHEN_CASE_RE = re.compile(r"^(\d{1,4})-(\d{4})$", re.ASCII)
+VERDICT_DATE_RE = re.compile(r"^(\d{1,2})\.\s+([a-záðéíóúýþæö]+)\s+(\d{4})$", re.I)
+
+
+def normalize_case_input(value: Any) -> str:
+    """Normalize user input to `sequence/year`, exactly like `normalizeCaseInput` in app.js."""
+    raw = JS_TRIM_RE.sub("", "" if value is None else str(value))
+    if not raw:
+        return ""
+
+    compact = CASE_PREFIX_RE.sub("", raw, count=1)
+    compact = JS_WHITESPACE_RE.sub("", compact).replace("–", "-").replace("—", "-")
+
+    match = SLASH_CASE_RE.match(compact) or HYPHEN_CASE_RE.match(compact)
+    return f"{match.group(1)}/{match.group(2)}" if match else ""
+
+
+def parse_verdict_date(value: Any) -> Optional[date]:
+    """Parse "8. maí 2018", the display form of `verdict_date`."""
+    match = VERDICT_DATE_RE.match("" if value is None else str(value).strip())
+    if not match:
+        return None
+    month = ICELANDIC_MONTHS.get(match.group(2).lower())
+    if not month:
+        return None
+    try:
+        return date(int(match.group(3)), month, int(match.group(1)))
+    except ValueError:
+        return None
+
+
+def record_date(record: Dict[str, Any]) -> Optional[date]:
+    """A record's verdict date, from `verdict_date_iso` when the mapping has it."""
+    try:
+        return date.fromisoformat(record["verdict_date_iso"])
+    except (KeyError, TypeError, ValueError):
+        return parse_verdict_date(record.get("verdict_date"))
+
+
+def sort_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Chronological order with undated rows last, the order `mapping.json` entries are published in.
+
+    Generated mappings are already sorted, so this only reorders older or
+    hand-built ones.
+    """
+    dated = [(record_date(record), index, record) for index, record in enumerate(records)]
+    dated.sort(key=lambda item: (item[0] is None, item[0] or date.min, item[1]))
+    return [record for _, _, record in dated]
+
+
+
+def entry_appeals_link(records: List[Dict[str, Any]]) -> str:
+    """The Landsréttur link for a whole entry: the first Ísland.is one, else the first non-empty one.
+
+    Records keep their own links, so this is the only place the entry-level
+    link is chosen (`entryAppealsLink` in app.js does the same).
+    """
+    links = [str(record.get("appeals_case_link") or "").strip() for record in records]
+    links = [link for link in links if link]
+    island = [link for link in links if urlparse(link).netloc.lower() == "island.is"]
+    return (island or links or [""])[0]
+
+# ---------- Suggestions (port of getSuggestions in app.js) ---------------
+
+def levenshtein(a: str, b: str) -> int:
+    if a == b:
+        return 0
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+
+    prev = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        curr = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, start=1):
+            cost = 0 if char_a == char_b else 1
+            curr[j] = min(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+        prev = curr
+    return prev[len(b)]
+
+
+def _parse_case_number_parts(value: str) -> Tuple[str, str, Optional[int], Optional[int]]:
+    sequence_text, _, year_text = value.partition("/")
+    year_text = year_text.split("/", 1)[0]
+    sequence = int(sequence_text) if sequence_text.isdigit() else None
+    year = int(year_text) if year_text.isdigit() else None
+    return sequence_text, year_text, sequence, year
+
+
+def _numeric_gap(first: Optional[int], second: Optional[int]) -> float:
+    if first is None or second is None:
+        return float("inf")
+    return abs(first - second)
+
+
+def _rank_suggestion(input_parts: Tuple[str, str, Optional[int], Optional[int]], key: str) -> Tuple[float, float, float, int, int, str]:
+    in_seq_text, in_year_text, in_seq, in_year = input_parts
+    seq_text, year_text, seq, year = _parse_case_number_parts(key)
+    sequence_distance = levenshtein(in_seq_text, seq_text)
+    year_distance = levenshtein(in_year_text, year_text)
+    sequence_gap = _numeric_gap(in_seq, seq)
+    year_gap = _numeric_gap(in_year, year)
+
+    sequence_penalty = 0.0
+    if sequence_gap != float("inf") and sequence_gap != 0:
+        if sequence_gap <= 100:
+            sequence_penalty = sequence_gap / 100
+        elif sequence_distance <= 1 and len(in_seq_text) != len(seq_text):
+            sequence_penalty = 1
+        else:
+            sequence_penalty = 2.5
+
+    year_penalty = 0.0
+    if year_gap != float("inf") and year_gap > 1:
+        if sequence_distance == 0:
+            year_penalty = min(year_gap / 10, 1)
+        else:
+            year_penalty = min((year_gap - 1) * 0.5, 2)
+
+    score = sequence_distance + year_distance * 1.5 + sequence_penalty + year_penalty
+    return score, year_gap, sequence_gap, sequence_distance, year_distance, key
+
+
+def _numeric_sort_key(key: str) -> Tuple[Any, ...]:
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", key))
+
+
+def suggest_cases(term: str, keys: List[str], limit: int = MAX_SUGGESTIONS) -> List[str]:
+    """Nearby Landsréttur case numbers for a term that has no match."""
+    if not term or not keys:
+        return []
+    input_parts = _parse_case_number_parts(term)
+    ranked = [rank for rank in (_rank_suggestion(input_parts, key) for key in keys) if rank[0] <= MAX_SUGGESTION_DISTANCE]
+    ranked.sort(key=lambda rank: rank[:5] + (_numeric_sort_key(rank[5]),))
+    return [rank[5] for rank in ranked[:limit]]
+
+
+# ---------- In-memory index ----------------------------------------------
+
+class Lookup:
+    """Case-number lookups over the mapping, loaded once.
+
+    Every value is a list sorted by verdict date, whether the mapping stored
+    one object or several. Records are sorted at load time and results are
+    memoized per raw input, so repeated lookups cost a dict hit.
+    """
+
+    def __init__(self, records: Dict[str, List[Dict[str, Any]]], cache_size: int = DEFAULT_CACHE_SIZE):
+        self.records = {key: sort_records(value) for key, value in records.items()}
+        self.keys = list(self.records)
+        self._cached_matches = functools.lru_cache(maxsize=cache_size)(self._matches)
+
+    @classmethod
+    def from_mapping(cls, path: Any = MAPPING_PATH, cache_size: int = DEFAULT_CACHE_SIZE) -> "Lookup":
+        mapping = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls.from_mapping_data(mapping, cache_size)
+
+    @classmethod
+    def from_mapping_data(cls, mapping: Dict[str, Any], cache_size: int = DEFAULT_CACHE_SIZE) -> "Lookup":
+        return cls({key: value if isinstance(value, list) else [value] for key, value in mapping.items()}, cache_size)
+
+    @classmethod
+    def from_csv(cls, path: Any = CSV_PATH, cache_size: int = DEFAULT_CACHE_SIZE) -> "Lookup":
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        with Path(path).open(newline="", encoding="utf-8-sig") as file:
+            for row in csv.DictReader(file):
+                appeals_case_number = (row.get("appeals_case_number") or "").strip()
+                if appeals_case_number:
+                    records.setdefault(appeals_case_number, []).append(
+                        {name: (row.get(name) or "").strip() for name in RECORD_FIELDS}
+                    )
+        return cls(records, cache_size)
+
+    def _matches(self, raw_case: Any) -> Tuple[str, Tuple[Dict[str, Any], ...]]:
+        case = normalize_case_input(raw_case)
+        return case, tuple(self.records.get(case, ())) if case else ()
+
+    def resolve(self, raw_case: Any) -> Tuple[str, List[Dict[str, Any]]]:
+        """Return the normalized case number and its date-sorted matches."""
+        if not isinstance(raw_case, str):
+            raw_case = "" if raw_case is None else str(raw_case)
+        case, matches = self._cached_matches(raw_case)
+        return case, list(matches)
+
+    def lookup(self, raw_case: Any) -> List[Dict[str, Any]]:
+        return self.resolve(raw_case)[1]
+
+    def suggestions(self, raw_case: Any, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        return suggest_cases(normalize_case_input(raw_case), self.keys, limit)
+
+    def result(self, raw_case: Any) -> Dict[str, Any]:
+        case, matches = self.resolve(raw_case)
+        result: Dict[str, Any] = {"query": raw_case, "case": case, "matches": matches}
+        if case and not matches:
+            result["suggestions"] = suggest_cases(case, self.keys)
+        return result
+
+    def cache_info(self) -> Any:
+        return self._cached_matches.cache_info()
+
+
+@dataclass(frozen=True)
+class MappingSnapshot:
+    lookup: Lookup
+    etag: str
+    signature: Tuple[int, int] = (0, 0)
+
+
+def load_mapping_snapshot(path: Path) -> MappingSnapshot:
+    raw = path.read_bytes()
+    stat = path.stat()
+    lookup = Lookup.from_mapping_data(json.loads(raw.decode("utf-8")))
+    etag = hashlib.sha256(raw).hexdigest()[:20]
+    return MappingSnapshot(lookup, etag, (stat.st_mtime_ns, stat.st_size))
+
+
+@dataclass
+class MappingIndex:
+    """`Lookup` over `mapping.json` that hot-swaps when the file changes.
+
+    Readers grab `self.snapshot` once per request; a reload builds a complete
+    new snapshot and replaces the reference, so a request never sees a mix of
+    old and new data.
+    """
+
+    path: Path = MAPPING_PATH
+    snapshot: MappingSnapshot = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self.snapshot = load_mapping_snapshot(self.path)
+
+    def reload_if_changed(self) -> bool:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == self.snapshot.signature:
+            return False
+        try:
+            snapshot = load_mapping_snapshot(self.path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Keeping previous mapping; could not reload {self.path}: {e}")
+            return False
+        changed = snapshot.etag != self.snapshot.etag
+        self.snapshot = snapshot
+        if changed:
+            logger.info(f"Reloaded {self.path} with {len(snapshot.lookup.keys)} cases.")
+        return changed
+
+
+# ---------- Secondary indexes --------------------------------------------
+
+INDEX_FIELDS = ["appeals_case_number"] + RECORD_FIELDS
+
+
+def build_case_index(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the persisted secondary indexes for `mapping.json`.
+
+    Rows are stored once, in chronological order with undated rows last, so
+    a row id doubles as its position in the date order. `dates` holds the ISO
+    dates of the dated prefix for bisecting, and every postings list is a
+    sorted list of row ids, so it can be bisected by date range too.
+    """
+    rows = []
+    for appeals_case_number, value in mapping.items():
+        for record in value if isinstance(value, list) else [value]:
+            rows.append({"appeals_case_number": appeals_case_number, **record})
+    rows = sort_records(rows)
+
+    dates = []
+    by_supreme_case_number: Dict[str, List[int]] = {}
+    by_source_type: Dict[str, List[int]] = {}
+    by_decision_status: Dict[str, List[int]] = {}
+    for row_id, row in enumerate(rows):
+        parsed = record_date(row)
+        if parsed:
+            dates.append(parsed.isoformat())
+        by_supreme_case_number.setdefault(str(row.get("supreme_case_number") or ""), []).append(row_id)
+        by_source_type.setdefault(str(row.get("source_type") or ""), []).append(row_id)
+        by_decision_status.setdefault(str(row.get("decision_status") or ""), []).append(row_id)
+    by_supreme_case_number.pop("", None)
+
+    return {
+        "version": CASE_INDEX_VERSION,
+        "fields": INDEX_FIELDS,
+        "rows": [[str(row.get(name) or "") for name in INDEX_FIELDS] for row in rows],
+        "dates": dates,
+        "by_supreme_case_number": by_supreme_case_number,
+        "by_source_type": by_source_type,
+        "by_decision_status": by_decision_status,
+    }
+
+
+class CaseIndex:
+    """Query API over `case_index.json`.
+
+    Supreme-number lookups are a dict hit; date ranges bisect `dates`, and
+    source-type/status filters bisect their postings to the same row range,
+    so a range query costs O(log n + matches).
+    """
+
+    def __init__(self, payload: Dict[str, Any]):
+        if payload.get("version") != CASE_INDEX_VERSION:
+            raise ValueError(f"Unsupported case index version: {payload.get('version')!r}")
+        self.fields = payload["fields"]
+        self.rows = payload["rows"]
+        self.dates = payload["dates"]
+        self.by_supreme_case_number = payload["by_supreme_case_number"]
+        self.by_source_type = payload["by_source_type"]
+        self.by_decision_status = payload["by_decision_status"]
+
+    @classmethod
+    def from_file(cls, path: Any = CASE_INDEX_PATH) -> "CaseIndex":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    @classmethod
+    def from_mapping(cls, path: Any = MAPPING_PATH) -> "CaseIndex":
+        return cls(build_case_index(json.loads(Path(path).read_text(encoding="utf-8"))))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row(self, row_id: int) -> Dict[str, str]:
+        return dict(zip(self.fields, self.rows[row_id]))
+
+    def by_supreme(self, supreme_case_number: str) -> List[Dict[str, str]]:
+        """Landsréttur rows behind a Supreme case number such as `2026-42`."""
+        return [self.row(row_id) for row_id in self.by_supreme_case_number.get(supreme_case_number.strip(), [])]
+
+    def between(
+        self,
+        start: Any = None,
+        end: Any = None,
+        source_type: Optional[str] = None,
+        decision_status: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """Dated rows with `start <= verdict date <= end`, oldest first.
+
+        Bounds are `date` objects or ISO strings; None leaves that side open.
+        """
+        low = bisect.bisect_left(self.dates, _iso(start)) if start is not None else 0
+        high = bisect.bisect_right(self.dates, _iso(end)) if end is not None else len(self.dates)
+        row_ids: Iterable[int] = range(low, high)
+        for postings in [
+            self.by_source_type.get(source_type, []) if source_type is not None else None,
+            self.by_decision_status.get(decision_status, []) if decision_status is not None else None,
+        ]:
+            if postings is None:
+                continue
+            matched = postings[bisect.bisect_left(postings, low):bisect.bisect_left(postings, high)]
+            row_ids = matched if isinstance(row_ids, range) else sorted(set(row_ids).intersection(matched))
+        return [self.row(row_id) for row_id in row_ids]
+
+
+def _iso(value: Any) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+# ---------- Binary index -------------------------------------------------
+#
+# Layout, little-endian:
+#   header   magic, version, field count, key count, record count,
+#            records offset, strings offset
+#   keys     key count x (year u16, sequence u16, first record u32, records u32),
+#            sorted by (year, sequence)
+#   records  record count x field count string offsets (u32), each key's
+#            records contiguous and in date order
+#   strings  deduplicated (length u16, UTF-8 bytes) entries
+
+_BINARY_HEADER = struct.Struct("<4sHHIIII")
+_BINARY_KEY = struct.Struct("<HHII")
+_BINARY_LENGTH = struct.Struct("<H")
+
+
+def _binary_key(case: str) -> Optional[Tuple[int, int]]:
+    """(year, sequence) for a canonical `sequence/year`; None for anything else."""
+    match = SLASH_CASE_RE.match(case)
+    if not match or match.group(1) != str(int(match.group(1))):
+        return None
+    return int(match.group(2)), int(match.group(1))
+
+
+def build_binary_index(mapping: Dict[str, Any]) -> bytes:
+    """Encode `mapping.json` for `BinaryIndex`.
+
+    Keys that are not a canonical `sequence/year` cannot be looked up through
+    `normalize_case_input` anyway and are left out.
+    """
+    keyed = sorted(
+        (key, value if isinstance(value, list) else [value])
+        for key, value in ((_binary_key(case), value) for case, value in mapping.items())
+        if key is not None
+    )
+    strings: Dict[str, int] = {}
+    string_table = bytearray()
+    keys = bytearray()
+    records = bytearray()
+    record_count = 0
+    for (year, sequence), value in keyed:
+        keys += _BINARY_KEY.pack(year, sequence, record_count, len(value))
+        for record in sort_records(value):
+            for name in RECORD_FIELDS:
+                text = str(record.get(name) or "")
+                if text not in strings:
+                    strings[text] = len(string_table)
+                    encoded = text.encode("utf-8")
+                    string_table += _BINARY_LENGTH.pack(len(encoded)) + encoded
+                records += struct.pack("<I", strings[text])
+            record_count += 1
+
+    records_offset = _BINARY_HEADER.size + len(keys)
+    header = _BINARY_HEADER.pack(
+        BINARY_INDEX_MAGIC,
+        BINARY_INDEX_VERSION,
+        len(RECORD_FIELDS),
+        len(keyed),
+        record_count,
+        records_offset,
+        records_offset + len(records),
+    )
+    return header + bytes(keys) + bytes(records) + bytes(string_table)
+
+
+class BinaryIndex:
+    """Exact case-number lookups over a memory-mapped `mapping.idx`.
+
+    Opening reads only the header, so start-up does not grow with the corpus,
+    and the pages are shared by every process mapping the same file. Lookups
+    binary-search the fixed-width key table and decode only the matched
+    records. A replaced file is picked up by opening a new instance; an open
+    one keeps reading the file it mapped.
+    """
+
+    def __init__(self, path: Any = BINARY_INDEX_PATH):
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < _BINARY_HEADER.size:
+                raise ValueError(f"Truncated binary index: {self.path}")
+            magic, version, field_count, key_count, record_count, records_offset, strings_offset = (
+                _BINARY_HEADER.unpack_from(self._map, 0)
+            )
+            if magic != BINARY_INDEX_MAGIC:
+                raise ValueError(f"Not a binary case index: {self.path}")
+            if version != BINARY_INDEX_VERSION or field_count != len(RECORD_FIELDS):
+                raise ValueError(f"Unsupported binary index version: {version!r}")
+        except ValueError:
+            self._map.close()
+            raise
+        self.key_count = key_count
+        self.record_count = record_count
+        self._records_offset = records_offset
+        self._strings_offset = strings_offset
+        self._record = struct.Struct(f"<{field_count}I")
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "BinaryIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def _find(self, key: Tuple[int, int]) -> Tuple[int, int]:
+        low, high = 0, self.key_count
+        while low < high:
+            middle = (low + high) // 2
+            year, sequence, first, count = _BINARY_KEY.unpack_from(self._map, _BINARY_HEADER.size + middle * _BINARY_KEY.size)
+            if (year, sequence) < key:
+                low = middle + 1
+            elif (year, sequence) > key:
+                high = middle
+            else:
+                return first, count
+        return 0, 0
+
+    def _string(self, offset: int) -> str:
+        start = self._strings_offset + offset
+        (length,) = _BINARY_LENGTH.unpack_from(self._map, start)
+        start += _BINARY_LENGTH.size
+        return self._map[start:start + length].decode("utf-8")
+
+    def _decode(self, record_id: int) -> Dict[str, str]:
+        offsets = self._record.unpack_from(self._map, self._records_offset + record_id * self._record.size)
+        return {name: self._string(offset) for name, offset in zip(RECORD_FIELDS, offsets)}
+
+    def resolve(self, raw_case: Any) -> Tuple[str, List[Dict[str, str]]]:
+        """Return the normalized case number and its date-sorted matches, like `Lookup.resolve`."""
+        case = normalize_case_input(raw_case)
+        key = _binary_key(case) if case else None
+        if key is None:
+            return case, []
+        first, count = self._find(key)
+        return case, [self._decode(record_id) for record_id in range(first, first + count)]
+
+    def lookup(self, raw_case: Any) -> List[Dict[str, str]]:
+        return self.resolve(raw_case)[1]
+
+
+# ---------- Change feed --------------------------------------------------
+#
+# Every regeneration that changes `mapping.json` is a new generation.
+# `changes/<generation>.json` holds the delta from the previous generation,
+# `changes/changes.ndjson` logs every key change, and
+# `changes/manifest.json` lists the cheapest way to reach the latest
+# generation from each recent one: a chain of deltas, or `mapping.json`.
+
+
+def diff_mappings(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Keys added, changed (with their new values) and removed between two mappings."""
+    return {
+        "added": {key: new[key] for key in sorted(new.keys() - old.keys())},
+        "changed": {key: new[key] for key in sorted(new.keys() & old.keys()) if new[key] != old[key]},
+        "removed": sorted(old.keys() - new.keys()),
+    }
+
+
+def apply_delta(mapping: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a delta file to a mapping in place. Applying one twice is harmless."""
+    mapping.update(delta.get("added") or {})
+    mapping.update(delta.get("changed") or {})
+    for key in delta.get("removed") or []:
+        mapping.pop(key, None)
+    return mapping
+
+
+def sync_plan(manifest: Dict[str, Any], generation: Optional[int]) -> List[str]:
+    """Files to fetch, in order, to bring a copy at `generation` to the latest one.
+
+    Empty when the copy is current; `[manifest["mapping"]["path"]]` when no
+    delta chain is cheaper or the generation is unknown or too old.
+    """
+    if generation == manifest["generation"]:
+        return []
+    step = manifest["sync"].get(str(generation))
+    return list(step["paths"]) if step else [manifest["mapping"]["path"]]
+
+
+# ---------- Static case pages --------------------------------------------
+#
+# One pre-rendered page per case at `mal/<sequence>-<year>/index.html`, with
+# the markup `renderMatches` and `createVerdictItem` build in app.js, so a
+# shared deep link is a single small document. The search form submits to the
+# app with `?case=`, so the pages need no JavaScript.
+
+# The <head> is taken from index.html (see `case_page_head`), so analytics,
+# fonts and styles stay in one place.
+CASE_PAGE_TEMPLATE = """<!doctype html>
+<html lang="is">
+
+<head>{head}</head>
+
+<body>
+  <div class="container">
+    <h1>Finna dóma og ákvarðanir Hæstaréttar</h1>
+
+    <form id="lookupForm" action="../../" method="get">
+      <div class="input-group">
+        <label for="appealInput">Landsréttarmálið nr.:</label>
+        <input id="appealInput" name="case" type="text" value="{case}"
+          title="Sláðu inn málsnúmer Landsréttar, t.d. 731/2022 eða Mál nr. 731/2022"
+          inputmode="numeric" required autocomplete="off">
+      </div>
+      <button type="submit">Leita</button>
+    </form>
+
+    <div id="result">{result}</div>
+  </div>
+</body>
+
+</html>
+"""
+HEAD_RE = re.compile(r"<head>(.*?)</head>", re.S | re.I)
+TITLE_RE = re.compile(r"<title>(.*?)</title>", re.S | re.I)
+# Relative href/src values; case pages sit two directories below the app.
+RELATIVE_URL_RE = re.compile(r'\b(href|src)="(?![a-z][a-z0-9+.-]*:|/|#)([^"]+)"', re.I)
+
+
+@functools.lru_cache(maxsize=4)
+def case_page_head(index_path: Path = INDEX_HTML_PATH) -> Tuple[str, str]:
+    """The contents of index.html's <head> with relative URLs rebased for `mal/<slug>/`, and its title."""
+    html = Path(index_path).read_text(encoding="utf-8")
+    head = HEAD_RE.search(html)
+    title = TITLE_RE.search(head.group(1)) if head else None
+    if not head or not title:
+        raise ValueError(f"{index_path} has no <head> with a <title>")
+    return RELATIVE_URL_RE.sub(r'\1="../../\2"', head.group(1)), title.group(1)
+
+
+def case_page_slug(case: str) -> Optional[str]:
+    """`731-2022` for the key `731/2022`; None for keys that are not `sequence/year`."""
+    match = SLASH_CASE_RE.match(case)
+    return f"{match.group(1)}-{match.group(2)}" if match else None
+
+
+def case_page_fingerprint(records: List[Dict[str, Any]]) -> str:
+    """Changes whenever a page's records, the page markup version, or index.html's <head> change."""
+    payload = json.dumps([CASE_PAGE_VERSION, case_page_head(), records], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _safe_http_url(value: Any) -> str:
+    """Like `getSafeHttpUrl` in app.js, for the absolute links the mapping stores."""
+    raw = JS_TRIM_RE.sub("", "" if value is None else str(value))
+    parsed = urlparse(raw)
+    return raw if parsed.scheme in {"http", "https"} and parsed.netloc else ""
+
+
+def _external_link(url: str, inner: str) -> str:
+    return f'<a href="{escape(url)}" target="_blank" rel="noopener">{inner}</a>'
+
+
+def _decision_status_class(status: str) -> str:
+    if "Samþykkt" in status:
+        return "status-chip status-chip-approved"
+    if "Hafnað" in status:
+        return "status-chip status-chip-rejected"
+    return "status-chip status-muted"
+
+
+def _render_verdict_item(record: Dict[str, Any]) -> str:
+    source_type = str(record.get("source_type") or "") or "mál"
+    chip = "Ákvörðun" if "ákvörðun" in source_type else "Dómur"
+    link_text = escape(f"Mál nr. {record.get('supreme_case_number') or ''}")
+    supreme_url = _safe_http_url(record.get("supreme_case_link"))
+    link = _external_link(supreme_url, link_text) if supreme_url else f'<span class="result-link-fallback">{link_text}</span>'
+
+    meta = escape(JS_TRIM_RE.sub("", str(record.get("verdict_date") or "")))
+    status = JS_TRIM_RE.sub("", str(record.get("decision_status") or ""))
+    if "ákvörðun" in source_type and status:
+        meta += f'<span class="{_decision_status_class(status)}">{escape(status)}</span>'
+
+    return (
+        '<li class="result-item">'
+        f'<div class="result-main"><span class="case-chip">{chip}</span>{link}</div>'
+        f'<div class="verdict-meta">{meta}</div>'
+        "</li>"
+    )
+
+
+def render_case_page(case: str, records: List[Dict[str, Any]]) -> str:
+    """The static page for one mapping entry, matching what app.js renders for it."""
+    records = sort_records(records)
+    strong = f"<strong>{escape(case)}</strong>"
+    appeals_url = _safe_http_url(entry_appeals_link(records))
+    intro = (
+        f"Landsréttarmál nr. {_external_link(appeals_url, strong) if appeals_url else strong}"
+        " hefur verið til umfjöllunar í Hæstarétti:"
+    )
+    result = (
+        f'<div class="result-summary"><div class="result-summary-text"><div class="intro-text">{intro}</div></div></div>'
+        f'<ul class="result-list">{"".join(_render_verdict_item(record) for record in records)}</ul>'
+    )
+    head, title = case_page_head()
+    head = head.replace(f"<title>{title}</title>", f"<title>Landsréttarmál nr. {escape(case)} – {title}</title>", 1)
+    return CASE_PAGE_TEMPLATE.format(head=head, case=escape(case), result=result)
+
+
+# ---------- HTTP service -------------------------------------------------
+
+def if_none_match_tags(header: Optional[str]) -> Set[str]:
+    """Entity tags listed in an If-None-Match header, weak ones compared as strong (RFC 9110 weak comparison)."""
+    tags = {tag.strip() for tag in (header or "").split(",") if tag.strip()}
+    return {tag[2:] if tag.startswith("W/") else tag for tag in tags}
+
+
+def make_handler(index: MappingIndex) -> type:
+    class LookupHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; with Nagle on, keep-alive
+        # clients wait out a delayed ACK (~40 ms) on every response.
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            params = parse_qs(parsed.query)
+            snapshot = index.snapshot
+            if parsed.path == "/health":
+                self._send_json(200, {"status": "ok", "cases": len(snapshot.lookup.keys), "etag": snapshot.etag})
+                return
+            if parsed.path not in {"/lookup", "/suggest"}:
+                self._send_json(404, {"error": "Not found."})
+                return
+
+            raw_case = (params.get("case") or [""])[0]
+            case = normalize_case_input(raw_case)
+            if not case:
+                self._send_json(400, {"error": "Expected a Landsréttur case number such as 123/2024.", "query": raw_case})
+                return
+            if parsed.path == "/suggest":
+                self._send_json(200, {"case": case, "suggestions": snapshot.lookup.suggestions(case)}, conditional=True)
+            else:
+                self._send_json(200, snapshot.lookup.result(raw_case), conditional=True)
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path != "/lookup":
+                self._send_json(404, {"error": "Not found."})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0 or length > MAX_REQUEST_BYTES:
+                # The body is left unread, so the connection cannot be reused.
+                self.close_connection = True
+                status, limit = (413, f"at most {MAX_REQUEST_BYTES} bytes") if length > 0 else (400, "a valid Content-Length")
+                self._send_json(status, {"error": f"Expected a JSON body with {limit}."})
+                return
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+                cases = body.get("cases")
+            except (ValueError, AttributeError):
+                self._send_json(400, {"error": "Expected a JSON body like {\"cases\": [\"123/2024\"]}."})
+                return
+            if not isinstance(cases, list) or len(cases) > MAX_BATCH_SIZE:
+                self._send_json(400, {"error": f"\"cases\" must be a list of at most {MAX_BATCH_SIZE} case numbers."})
+                return
+            snapshot = index.snapshot
+            self._send_json(200, {"etag": snapshot.etag, "results": [snapshot.lookup.result(case) for case in cases]})
+
+        def _send_json(self, status: int, data: Dict[str, Any], conditional: bool = False) -> None:
+            """Send `data`; a `conditional` response gets a strong ETag of its body and honours If-None-Match.
+
+            The ETag covers one response, so a mapping change only
+            invalidates the cached lookups whose result changed.
+            """
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:20]}"' if conditional else ""
+            tags = if_none_match_tags(self.headers.get("If-None-Match"))
+            if etag and (etag in tags or "*" in tags):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format, *args)
+
+    return LookupHandler
+
+
+class LookupServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], index: MappingIndex, reload_interval: float):
+        super().__init__(address, make_handler(index))
+        self.index = index
+        self.reload_interval = reload_interval
+        self._stop_reloading = threading.Event()
+
+    def reload_loop(self) -> None:
+        while not self._stop_reloading.wait(self.reload_interval):
+            self.index.reload_if_changed()
+
+    def shutdown(self) -> None:
+        self._stop_reloading.set()
+        super().shutdown()
+
+
+def start_lookup_server(
+    index: MappingIndex,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    reload_interval: float = DEFAULT_RELOAD_INTERVAL_SECONDS,
+) -> LookupServer:
+    """Start the lookup API and its mapping reloader on daemon threads."""
+    server = LookupServer((host, port), index, reload_interval)
+    threading.Thread(target=server.serve_forever, name="lookup-http", daemon=True).start()
+    threading.Thread(target=server.reload_loop, name="lookup-reload", daemon=True).start()
+    logger.info(f"Serving {len(index.snapshot.lookup.keys)} cases on http://{host}:{server.server_address[1]}/lookup")
+    return server
+
+
+def serve_lookup(mapping_path: Path = MAPPING_PATH, host: str = "127.0.0.1", port: int = 8080) -> int:
+    server = start_lookup_server(MappingIndex(mapping_path), host=host, port=port)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        logger.info("Lookup service stopped.")
+    finally:
+        server.shutdown()
+    return 0
+
+
+# ---------- Bulk CLI -----------------------------------------------------
+
+BULK_CSV_FIELDS = ["query", "case", "found"] + RECORD_FIELDS
+
+
+def iter_bulk_rows(lookup: Lookup, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for line in lines:
+        query = line.strip()
+        if query:
+            yield lookup.result(query)
+
+
+def write_bulk_results(lookup: Lookup, lines: Iterable[str], output: TextIO, output_format: str = "csv") -> int:
+    """Stream lookups for each input line; memory stays flat in the input size."""
+    count = 0
+    if output_format == "ndjson":
+        for result in iter_bulk_rows(lookup, lines):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+        return count
+
+    writer = csv.DictWriter(output, fieldnames=BULK_CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for result in iter_bulk_rows(lookup, lines):
+        base = {"query": result["query"], "case": result["case"], "found": bool(result["matches"])}
+        for match in result["matches"] or [{}]:
+            writer.writerow({**base, **match})
+        count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Look up Landsréttur case numbers in bulk.")
+    parser.add_argument("input", help="File with one case number per line, or - for stdin.")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv", help="Output format.")
+    parser.add_argument("--output", default="-", help="Output file, or - for stdout.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--mapping", default=str(MAPPING_PATH), help="mapping.json to load.")
+    source.add_argument("--csv", default=None, help="Load the scraped CSV instead of mapping.json.")
+    args = parser.parse_args(argv)
+
+    lookup = Lookup.from_csv(args.csv) if args.csv else Lookup.from_mapping(args.mapping)
+    input_file = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        write_bulk_results(lookup, input_file, output_file, args.format)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
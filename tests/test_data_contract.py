@@ -5,10 +5,17 @@ from datetime import date
 from pathlib import Path
 from urllib.parse import urlparse
 
+import pytest
+
+from lookup import build_binary_index, build_case_index, case_page_fingerprint, case_page_slug, render_case_page
+
 
 ROOT = Path(__file__).resolve().parents[1]
 CSV_PATH = ROOT / "allir_domar_og_akvardanir.csv"
 MAPPING_PATH = ROOT / "mapping.json"
+CASE_INDEX_PATH = ROOT / "case_index.json"
+BINARY_INDEX_PATH = ROOT / "mapping.idx"
+CASE_PAGES_DIR = ROOT / "mal"
 
 EXPECTED_COLUMNS = [
     "supreme_case_number",
@@ -17,6 +24,7 @@ EXPECTED_COLUMNS = [
     "appeals_case_link",
     "source_type",
     "verdict_date",
+    "verdict_date_iso",
     "decision_status",
 ]
 FRONTEND_FIELDS = [
@@ -25,6 +33,7 @@ FRONTEND_FIELDS = [
     "appeals_case_link",
     "source_type",
     "verdict_date",
+    "verdict_date_iso",
     "decision_status",
 ]
 KNOWN_LEGACY_BLANK_APPEALS_LINKS = {"2019-271", "2020-118", "24/2019", "2020-156"}
@@ -143,6 +152,23 @@ def test_mapping_shape_and_frontend_fields():
         assert_supported_supreme_url(record["supreme_case_link"])
 
 
+def test_iso_dates_match_display_dates():
+    _, rows = load_csv_rows()
+
+    for row in rows:
+        assert row["verdict_date_iso"] == parse_verdict_date(row["verdict_date"]).isoformat()
+
+
+def test_mapping_lists_are_date_sorted():
+    mapping = json.loads(MAPPING_PATH.read_text(encoding="utf-8"))
+
+    for value in mapping.values():
+        if not isinstance(value, list):
+            continue
+        dates = [record["verdict_date_iso"] for record in value]
+        assert dates == sorted(dates)
+
+
 def test_rows_since_2018_use_island_links():
     _, rows = load_csv_rows()
 
@@ -153,3 +179,31 @@ def test_rows_since_2018_use_island_links():
         assert urlparse(row["supreme_case_link"]).netloc == "island.is"
         if row["appeals_case_number"].strip() and row["appeals_case_link"].strip():
             assert urlparse(row["appeals_case_link"]).netloc == "island.is"
+
+
+def test_case_index_matches_mapping():
+    mapping = json.loads(MAPPING_PATH.read_text(encoding="utf-8"))
+    case_index = json.loads(CASE_INDEX_PATH.read_text(encoding="utf-8"))
+
+    assert case_index == build_case_index(mapping)
+
+
+def test_binary_index_matches_mapping():
+    mapping = json.loads(MAPPING_PATH.read_text(encoding="utf-8"))
+
+    assert BINARY_INDEX_PATH.read_bytes() == build_binary_index(mapping)
+
+
+@pytest.mark.skipif(not (CASE_PAGES_DIR / "manifest.json").exists(), reason="mal/ is generated by the scrape workflow")
+def test_case_pages_match_mapping():
+    mapping = json.loads(MAPPING_PATH.read_text(encoding="utf-8"))
+    manifest = json.loads((CASE_PAGES_DIR / "manifest.json").read_text(encoding="utf-8"))
+
+    pages = {}
+    for case, value in mapping.items():
+        records = value if isinstance(value, list) else [value]
+        pages[case_page_slug(case)] = case_page_fingerprint(records)
+        assert (CASE_PAGES_DIR / case_page_slug(case) / "index.html").read_text(encoding="utf-8") == render_case_page(case, records)
+
+    assert manifest["pages"] == pages
+    assert {path.name for path in CASE_PAGES_DIR.iterdir() if path.is_dir()} == set(pages)
@@ -0,0 +1,223 @@
+import csv
+import http.client
+import io
+import json
+import os
+from datetime import date
+import urllib.request
+from urllib.error import HTTPError
+
+import pytest
+from lookup import MAX_REQUEST_BYTES, BinaryIndex, CaseIndex, Lookup, MappingIndex, build_binary_index, build_case_index, normalize_case_input, start_lookup_server, suggest_cases, write_bulk_results
+
+
+MAPPING = {
+    "731/2022": {
+        "supreme_case_number": "12/2023",
+        "supreme_case_link": "https://island.is/domar/s-one",
+        "appeals_case_link": "https://island.is/domar/g-one",
+        "source_type": "dóm",
+        "verdict_date": "1. mars 2023",
+        "verdict_date_iso": "2023-03-01",
+        "decision_status": "",
+    },
+    "37/2022": [
+        {
+            "supreme_case_number": "2022-101",
+            "supreme_case_link": "https://island.is/s/haestirettur/akvardanir/two",
+            "appeals_case_link": "https://island.is/domar/g-two",
+            "source_type": "ákvörðun",
+            "verdict_date": "2. maí 2022",
+            "verdict_date_iso": "2022-05-02",
+        "verdict_date_iso": "2022-05-02",
+            "decision_status": "Samþykkt",
+        },
+        {
+            "supreme_case_number": "40/2022",
+            "supreme_case_link": "https://island.is/domar/s-three",
+            "appeals_case_link": "https://island.is/domar/g-two",
+            "source_type": "dóm",
+            "verdict_date": "3. október 2022",
+            "verdict_date_iso": "2022-10-03",
+        "verdict_date_iso": "2022-10-03",
+            "decision_status": "",
+        },
+    ],
+}
+
+
+@pytest.fixture
+def mapping_path(tmp_path):
+    path = tmp_path / "mapping.json"
+    path.write_text(json.dumps(MAPPING, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("731/2022", "731/2022"),
+    ("  Mál nr. 731 / 2022 ", "731/2022"),
+    ("mal nr 731-2022", "731/2022"),
+    ("Landsréttarmál nr. 731–2022", "731/2022"),
+    ("Landsréttarmálið nr.731—2022", "731/2022"),
+    ("2022/731", ""),
+    ("\u0667\u0663\u0661/\u0662\u0660\u0662\u0662", ""),
+    ("\ufeff731/2022", "731/2022"),
+    ("\x1c731/2022", ""),
+    ("abc", ""),
+    (None, ""),
+])
+def test_normalize_case_input_matches_frontend(raw, expected):
+    assert normalize_case_input(raw) == expected
+
+
+def test_suggest_cases_prefers_close_case_numbers():
+    keys = ["731/2022", "37/2022", "732/2022", "731/2019", "5/2024"]
+    assert suggest_cases("731/2021", keys) == ["731/2022", "732/2022"]
+    assert suggest_cases("9999/1999", keys) == []
+
+
+def test_lookup_service_single_batch_etag_and_hot_reload(mapping_path):
+    index = MappingIndex(mapping_path)
+    server = start_lookup_server(index, port=0, reload_interval=3600)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with urllib.request.urlopen(f"{base_url}/lookup?case=M%C3%A1l%20nr.%20731-2022") as response:
+            etag = response.headers["ETag"]
+            single = json.loads(response.read())
+        assert single["case"] == "731/2022"
+        assert single["matches"][0]["supreme_case_number"] == "12/2023"
+
+        def conditional_status(case, tag):
+            request = urllib.request.Request(f"{base_url}/lookup?case={case}", headers={"If-None-Match": tag})
+            try:
+                with urllib.request.urlopen(request) as response:
+                    return response.status
+            except HTTPError as error:
+                return error.code
+
+        assert etag.startswith('"')
+        assert conditional_status("M%C3%A1l%20nr.%20731-2022", etag) == 304
+        assert conditional_status("M%C3%A1l%20nr.%20731-2022", f'"other", W/{etag}') == 304
+        # Input is validated before the conditional check, and each response has its own tag.
+        assert conditional_status("bad", "*") == 400
+        assert conditional_status("37/2022", etag) == 200
+
+        batch_request = urllib.request.Request(
+            f"{base_url}/lookup",
+            data=json.dumps({"cases": ["37/2022", "731/2021", "bad"]}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(batch_request) as response:
+            results = json.loads(response.read())["results"]
+        assert [len(result["matches"]) for result in results] == [2, 0, 0]
+        assert results[1]["suggestions"] == ["731/2022"]
+        assert "suggestions" not in results[2]
+
+        with pytest.raises(HTTPError) as invalid:
+            urllib.request.urlopen(f"{base_url}/lookup?case=bad")
+        assert invalid.value.code == 400
+
+        # Rejected from the declared length alone; the body is never sent.
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            connection.putrequest("POST", "/lookup")
+            connection.putheader("Content-Type", "application/json")
+            connection.putheader("Content-Length", str(MAX_REQUEST_BYTES + 1))
+            connection.endheaders()
+            assert connection.getresponse().status == 413
+        finally:
+            connection.close()
+
+        updated = dict(MAPPING, **{"1/2026": MAPPING["731/2022"]})
+        mapping_path.write_text(json.dumps(updated, ensure_ascii=False), encoding="utf-8")
+        os.utime(mapping_path, ns=(1, 1))
+        assert index.reload_if_changed() is True
+
+        with urllib.request.urlopen(f"{base_url}/lookup?case=1/2026") as response:
+            assert response.headers["ETag"] != etag
+            assert json.loads(response.read())["matches"]
+        # Cached lookups the reload did not change stay valid.
+        assert conditional_status("M%C3%A1l%20nr.%20731-2022", etag) == 304
+    finally:
+        server.shutdown()
+
+
+def test_lookup_returns_date_sorted_lists_from_mapping_and_csv(mapping_path, tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=["appeals_case_number"] + list(MAPPING["731/2022"]))
+        writer.writeheader()
+        for case, value in MAPPING.items():
+            for record in reversed(value) if isinstance(value, list) else [value]:
+                writer.writerow({"appeals_case_number": case, **record})
+
+    for lookup in [Lookup.from_mapping(mapping_path), Lookup.from_csv(csv_path)]:
+        assert [row["supreme_case_number"] for row in lookup.lookup("Mál nr. 37-2022")] == ["2022-101", "40/2022"]
+        assert lookup.lookup("731/2022") == [MAPPING["731/2022"]]
+        assert lookup.lookup("999/2022") == []
+        assert lookup.lookup(None) == []
+
+    lookup = Lookup.from_mapping(mapping_path)
+    lookup.lookup("731/2022").clear()
+    assert len(lookup.lookup("731/2022")) == 1
+    assert lookup.cache_info().hits == 1
+
+
+def test_bulk_lookup_streams_csv_and_ndjson(mapping_path):
+    lookup = Lookup.from_mapping(mapping_path)
+    lines = ["37/2022\n", "\n", "731/2021\n"]
+
+    output = io.StringIO()
+    assert write_bulk_results(lookup, lines, output, "ndjson") == 2
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [len(result["matches"]) for result in results] == [2, 0]
+    assert results[1]["suggestions"] == ["731/2022"]
+
+    output = io.StringIO()
+    write_bulk_results(lookup, lines, output, "csv")
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert [(row["case"], row["found"], row["supreme_case_number"]) for row in rows] == [
+        ("37/2022", "True", "2022-101"),
+        ("37/2022", "True", "40/2022"),
+        ("731/2021", "False", ""),
+    ]
+
+
+def test_case_index_answers_supreme_and_date_range_queries():
+    mapping = {**MAPPING, "5/2021": {**MAPPING["731/2022"], "supreme_case_number": "1/2021", "verdict_date": "", "verdict_date_iso": ""}}
+    case_index = CaseIndex(json.loads(json.dumps(build_case_index(mapping))))
+
+    assert len(case_index) == 4
+    assert [row["appeals_case_number"] for row in case_index.by_supreme("40/2022 ")] == ["37/2022"]
+    assert case_index.by_supreme("99/2022") == []
+
+    def numbers(rows):
+        return [row["supreme_case_number"] for row in rows]
+
+    assert numbers(case_index.between()) == ["2022-101", "40/2022", "12/2023"]
+    assert numbers(case_index.between(date(2022, 5, 2), "2023-03-01")) == ["2022-101", "40/2022", "12/2023"]
+    assert numbers(case_index.between("2022-05-03", "2023-02-28")) == ["40/2022"]
+    assert numbers(case_index.between(source_type="dóm")) == ["40/2022", "12/2023"]
+    assert numbers(case_index.between(end="2022-12-31", source_type="dóm")) == ["40/2022"]
+    assert numbers(case_index.between(source_type="ákvörðun", decision_status="Samþykkt")) == ["2022-101"]
+    assert numbers(case_index.between(source_type="dóm", decision_status="Samþykkt")) == []
+
+
+def test_binary_index_matches_lookup_and_rejects_unknown_files(tmp_path):
+    path = tmp_path / "mapping.idx"
+    path.write_bytes(build_binary_index({**MAPPING, "0731/2022": MAPPING["731/2022"]}))
+    lookup = Lookup.from_mapping_data(MAPPING)
+
+    with BinaryIndex(path) as index:
+        assert len(index) == 2
+        for query in ["731/2022", "Mál nr. 37-2022", "37/2022", "0731/2022", "38/2022", "abc"]:
+            assert index.resolve(query) == lookup.resolve(query)
+        assert [row["supreme_case_number"] for row in index.lookup("37/2022")] == ["2022-101", "40/2022"]
+
+    path.write_bytes(b"HVIX" + bytes([9, 0]) + path.read_bytes()[6:])
+    with pytest.raises(ValueError, match="version"):
+        BinaryIndex(path)
+    path.write_bytes(b"{}")
+    with pytest.raises(ValueError):
+        BinaryIndex(path)
@@ -1,18 +1,39 @@
 import json
+import pickle
+import threading
 from datetime import date
 
+import pandas as pd
 import pytest
 from bs4 import BeautifulSoup
 from get_new_verdicts import (
     APPEALS_NO_RE,
+    CassetteWriter,
     DATE_RE,
     DataManager,
+    HtmlArchive,
+    ListingWatcher,
+    MemoryTracker,
+    ReplayAdapter,
+    ScrapePipeline,
+    ScrapeReport,
     Scraper,
+    Shard,
     SUPREME_DECISION_RE,
+    UnlinkedCaseCache,
     SUPREME_VERDICT_RE,
+    VerdictRow,
+    legacy_supreme_link_to_island,
+    repaired_fields,
+    select_repair_rows,
     run_link_migration,
+    run_link_verification,
+    run_reparse_from_archive,
+    run_repair,
     run_scrape,
+    run_shard_merge,
 )
+from lookup import apply_delta, case_page_head, entry_appeals_link, sync_plan
 
 @pytest.fixture
 def scraper():
@@ -138,6 +159,75 @@ def test_get_verdict_listing_page_from_graphql(scraper, monkeypatch):
         ("https://island.is/domar/s-D9223705-6188-4590-9209-079CB613C5D2", "14/2026")
     ]
 
+def test_verdict_date_window_walks_every_page_and_skips_known(scraper, monkeypatch):
+    pages = {
+        1: [
+            ("https://island.is/domar/s-AAAA", "21/2026"),
+            ("https://island.is/domar/s-BBBB", "20/2026"),
+        ],
+        2: [("https://island.is/domar/s-CCCC", "22/2026")],
+    }
+    calls = []
+
+    def fake_fetch_json(url, payload):
+        variables = payload["variables"]["input"]
+        calls.append((variables["page"], variables["dateFrom"], variables["dateTo"]))
+        return {
+            "data": {
+                "webVerdicts": {
+                    "total": 3,
+                    "items": [
+                        {"id": item_url.rsplit("/", 1)[1], "caseNumber": case_number, "court": "Hæstiréttur"}
+                        for item_url, case_number in pages[variables["page"]]
+                    ],
+                }
+            }
+        }
+
+    monkeypatch.setattr(scraper, "fetch_json", fake_fetch_json)
+
+    batches = list(scraper.iter_verdict_batches({"21/2026", "20/2026"}, windows=[(date(2026, 4, 1), None)]))
+
+    assert calls == [(1, "2026-04-01", None), (2, "2026-04-01", None)]
+    assert batches == [[("https://island.is/domar/s-CCCC", "22/2026")]]
+
+def test_verdict_date_window_without_total_pages_until_empty(scraper, monkeypatch):
+    pages = {
+        1: [("https://island.is/domar/s-AAAA", "21/2026")],
+        2: [("https://island.is/domar/s-BBBB", "20/2026")],
+    }
+    calls = []
+
+    def fake_fetch_json(url, payload):
+        page = payload["variables"]["input"]["page"]
+        calls.append(page)
+        items = [{"id": item_url.rsplit("/", 1)[1], "caseNumber": case_number, "court": "Hæstiréttur"} for item_url, case_number in pages.get(page, [])]
+        return {"data": {"webVerdicts": {"items": items}}}
+
+    monkeypatch.setattr(scraper, "fetch_json", fake_fetch_json)
+
+    batches = list(scraper.iter_verdict_batches(set(), windows=[(date(2026, 1, 1), date(2026, 3, 31))]))
+
+    assert calls == [1, 2, 3]
+    assert [case_number for batch in batches for _, case_number in batch] == ["21/2026", "20/2026"]
+
+def test_date_windows_and_watermark():
+    from get_new_verdicts import date_windows
+
+    assert date_windows(date(2026, 1, 1), date(2026, 1, 25), 10) == [
+        (date(2026, 1, 16), date(2026, 1, 25)),
+        (date(2026, 1, 6), date(2026, 1, 15)),
+        (date(2026, 1, 1), date(2026, 1, 5)),
+    ]
+
+    manager = DataManager()
+    df = pd.DataFrame([
+        {"source_type": "dóm", "verdict_date": "8. maí 2026", "verdict_date_iso": "2026-05-08"},
+        {"source_type": "ákvörðun", "verdict_date": "20. maí 2026", "verdict_date_iso": "2026-05-20"},
+        {"source_type": "dóm", "verdict_date": "", "verdict_date_iso": ""},
+    ])
+    assert manager.verdict_watermark(df, overlap_days=7) == date(2026, 5, 1)
+
 def test_extract_appeals_link_unescapes_landsrettur_url(scraper):
     html = """
     <a href="https://landsrettur.is/domar-og-urskurdir/domur-urskurdur/?id=abc&amp;verdictid=def">
@@ -197,6 +287,26 @@ def test_parse_supreme_page_follows_island_lower_court_link(scraper, monkeypatch
     assert data["appeals_case_number"] == "155/2025"
     assert data["appeals_case_link"] == lower_court_url
 
+def test_parsing_in_processes_matches_inline_parse(scraper, monkeypatch):
+    supreme_url = "https://island.is/domar/s-B31031B4-3EEB-44FD-89E6-28D1C415BE50"
+    lower_court_url = "https://island.is/domar/g-323affbf-bb40-4730-b1d9-71c32293ea0d"
+    pages = {
+        supreme_url: f'<main><h2>Mál nr.18/2026</h2><p>Mánudagurinn 27. apríl 2026</p><a href="{lower_court_url}">Úrlausn</a></main>',
+        lower_court_url: "LANDSRÉTTUR Mál nr. 155/2025",
+    }
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: pages[url])
+    inline = scraper.parse_supreme_page(supreme_url, "dóm")
+
+    offloaded = []
+    monkeypatch.setattr(scraper, "parse_supreme_html", lambda *args: pytest.fail("parsed inline"))
+    with scraper.parsing_in_processes(1, inline_parse_bytes=0):
+        offloaded.append(scraper.parse_supreme_page(supreme_url, "dóm"))
+        offloaded.append(scraper.parse_html("extract_decision_links_from_html", "", ""))
+    assert scraper.parse_pool is None
+
+    assert offloaded == [inline, []]
+    assert inline["appeals_case_number"] == "155/2025"
+
 def test_parse_decision_resolves_island_link_when_landsrettur_link_fails(scraper, monkeypatch):
     decision_url = "https://island.is/s/haestirettur/akvardanir/EA844C6E-DA91-4701-8EBD-782B500E1C29"
     old_appeals_url = "https://landsrettur.is/domar-og-urskurdir/domur-urskurdur/?id=abc&verdictid=def"
@@ -268,12 +378,179 @@ def test_scrape_decisions_stops_after_known_cases(scraper, monkeypatch):
 
     monkeypatch.setattr(scraper, "parse_supreme_page", fake_parse)
 
-    rows, ok = scraper.scrape_decisions({"2026-30", "2026-29"}, full=False)
+    report = ScrapeReport()
+    rows = list(scraper.scrape_decisions({"2026-30", "2026-29"}, full=False, report=report))
 
-    assert ok is True
+    assert report.sources["decisions"].listing_pages_fetched > 0
     assert parsed_urls == [new_url]
     assert [row["supreme_case_number"] for row in rows] == ["2026-31"]
 
+def test_scrape_pipeline_runs_both_sources_with_incremental_stops(scraper, monkeypatch):
+    verdict_new = "https://island.is/domar/s-AAAAAAAA-1111-4111-8111-111111111111"
+    verdict_known = "https://island.is/domar/s-BBBBBBBB-2222-4222-8222-222222222222"
+    decision_new = "https://island.is/s/haestirettur/akvardanir/33333333-3333-4333-8333-333333333333"
+    decision_broken = "https://island.is/s/haestirettur/akvardanir/44444444-4444-4444-8444-444444444444"
+    decision_older = "https://island.is/s/haestirettur/akvardanir/55555555-5555-4555-8555-555555555555"
+    lower_court = "https://island.is/domar/g-66666666-6666-4666-8666-666666666666"
+    verdict_pages = {1: [(verdict_new, "20/2026"), (verdict_known, "19/2026")]}
+    decision_pages = {
+        1: [(decision_new, "2026-40"), (decision_broken, "")],
+        2: [(decision_older, "2026-38")],
+    }
+    pages = {
+        verdict_new: f'<main><h2>Mál nr. 20/2026</h2><a href="{lower_court}">Úrlausn</a></main>',
+        decision_new: f'<main><h2>Mál nr. 2026-40</h2><p>Hafnað</p><a href="{lower_court}">Úrlausn</a></main>',
+        decision_broken: None,
+        lower_court: "LANDSRÉTTUR Mál nr. 155/2025",
+    }
+    monkeypatch.setattr(
+        scraper,
+        "get_verdict_listing_page",
+        lambda page, date_from=None, date_to=None: (verdict_pages.get(page, []), 2, True),
+    )
+    monkeypatch.setattr(
+        scraper,
+        "get_decision_listing_page",
+        lambda page: (decision_pages.get(page, []), True),
+    )
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: pages[url])
+
+    known = {"19/2026", "2026-38"}
+    report = ScrapeReport()
+    rows, ok = ScrapePipeline(scraper, detail_workers=3, lower_court_workers=2, queue_size=1).run(
+        known, report=report
+    )
+
+    assert ok is True
+    assert sorted(row["supreme_case_number"] for row in rows) == ["20/2026", "2026-40"]
+    assert all(row["appeals_case_number"] == "155/2025" for row in rows)
+    assert {"2026-40", "20/2026"} <= known
+    assert report.sources["verdicts"].known_items_skipped == 1
+    assert report.sources["verdicts"].detail_pages_attempted == 1
+    assert report.sources["decisions"].listing_pages_fetched == 2
+    assert report.sources["decisions"].known_items_skipped == 1
+    assert report.sources["decisions"].detail_pages_attempted == 1
+    assert scraper.deferred == [("decisions", decision_broken)]
+
+    scraper.deferred_retry_backoff = 0
+    assert list(scraper.retry_deferred(report, known)) == []
+    assert report.deferred_retries == {"queued": 1, "recovered": 0, "failed": 1, "carried_over": 0, "rounds": 2}
+    assert report.sources["decisions"].detail_pages_attempted == 2
+    assert report.sources["decisions"].detail_pages_fetch_failed == 1
+    assert report.sources["decisions"].detail_pages_without_case_number == 0
+    assert report.skipped_cases[-1]["reason"] == "fetch_failed"
+
+def test_scrape_pipeline_counts_cross_source_duplicates_once(scraper, monkeypatch):
+    verdict = "https://island.is/domar/s-AAAAAAAA-1111-4111-8111-111111111111"
+    decision = "https://island.is/s/haestirettur/akvardanir/33333333-3333-4333-8333-333333333333"
+    page = '<main><h2>Mál nr. 20/2026</h2></main>'
+    monkeypatch.setattr(scraper, "get_verdict_listing_page", lambda page, date_from=None, date_to=None: ([(verdict, "")], 1, page == 1))
+    monkeypatch.setattr(scraper, "get_decision_listing_page", lambda page: ([(decision, "")], page == 1))
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: page)
+    monkeypatch.setattr(scraper, "extract_supreme_case_number", lambda html, text, source_type: "20/2026")
+
+    report = ScrapeReport()
+    rows, _ = ScrapePipeline(scraper, detail_workers=1, lower_court_workers=1).run(set(), max_pages=1, report=report)
+
+    assert [row["supreme_case_number"] for row in rows] == ["20/2026"]
+    assert sum(stats.detail_pages_attempted for stats in report.sources.values()) == 1
+    assert len(report.skipped_cases) == 1
+
+def test_scrape_pipeline_stops_when_collector_raises(scraper, monkeypatch):
+    links = [f"https://island.is/domar/s-{index:08d}-1111-4111-8111-111111111111" for index in range(50)]
+    monkeypatch.setattr(
+        scraper,
+        "get_verdict_listing_page",
+        lambda page, date_from=None, date_to=None: ([(link, "") for link in links] if page == 1 else [], 1, True),
+    )
+    monkeypatch.setattr(scraper, "get_decision_listing_page", lambda page: ([], True))
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: "<main>no case number</main>")
+
+    def broken_record(*args):
+        raise RuntimeError("collector broke")
+
+    monkeypatch.setattr("get_new_verdicts.record_detail_result", broken_record)
+    outcome = {}
+
+    def run():
+        try:
+            ScrapePipeline(scraper, detail_workers=2, lower_court_workers=2, queue_size=1, poll_interval=0.01).run(set(), full=True)
+        except RuntimeError as e:
+            outcome["error"] = str(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert outcome == {"error": "collector broke"}
+
+def test_unlabeled_listing_items_are_skipped_by_known_link(scraper, monkeypatch):
+    known_url = "https://island.is/s/haestirettur/akvardanir/22222222-2222-4222-8222-222222222222"
+    new_url = "https://island.is/s/haestirettur/akvardanir/11111111-1111-4111-8111-111111111111"
+    pages = {1: [(new_url, ""), (known_url.lower(), ""), ("https://island.is/s/haestirettur/akvardanir/33333333-3333-4333-8333-333333333333", "2026-29")]}
+    monkeypatch.setattr(scraper, "get_decision_listing_page", lambda page: (pages.get(page, []), page in pages))
+    parsed_urls = []
+    monkeypatch.setattr(scraper, "parse_supreme_page", lambda url, source_type: parsed_urls.append(url) or {})
+
+    legacy_link = "https://www.haestirettur.is/akvardanir/_malskotsbeidni/?id=22222222-2222-4222-8222-222222222222"
+    known_index = DataManager().known_item_index(pd.DataFrame({"supreme_case_link": [legacy_link]}))
+    report = ScrapeReport()
+
+    list(scraper.scrape_decisions({"2026-29"}, report=report, known_index=known_index))
+
+    assert parsed_urls == [new_url]
+    stats = report.sources["decisions"]
+    assert stats.known_items_skipped == 2
+    assert stats.known_items_skipped_by_reason == {"known_link": 1, "known_case_number": 1}
+
+def test_unlinked_case_cache_backs_off_exponentially(tmp_path, scraper):
+    from datetime import datetime, timedelta, timezone
+
+    cache_path = tmp_path / "unlinked_cases.json"
+    cache = UnlinkedCaseCache(cache_path)
+    url = "https://island.is/domar/s-AAAAAAAA-1111-4111-8111-111111111111"
+    case = {"supreme_case_number": "5/2026", "supreme_case_link": url, "source_type": "dóm", "reason": "missing_appeals_case_number"}
+    first = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=1)
+
+    cache.record(case, now=first)
+    cache.record(case, now=first + timedelta(days=1))
+    cache.save()
+
+    cache = UnlinkedCaseCache.load(cache_path)
+    entry = cache.entries["5/2026"]
+    assert entry["attempts"] == 2
+    assert entry["reason"] == "missing_appeals_case_number"
+    assert entry["next_check_at"] == (first + timedelta(days=3)).isoformat()
+    assert cache.is_suppressed(url.lower(), "", now=first + timedelta(days=2))
+    assert not cache.is_suppressed(url, "5/2026", now=first + timedelta(days=3))
+
+    known_index = DataManager().known_item_index(pd.DataFrame({"supreme_case_link": []}), cache)
+    report = ScrapeReport()
+    stats = report.source("verdicts")
+    queued = scraper._items_to_scrape([(url, "5/2026"), ("https://island.is/domar/s-new", "6/2026")], set(), False, known_index, stats)
+
+    assert queued == [("https://island.is/domar/s-new", "6/2026")]
+    assert stats.known_items_skipped_by_reason == {"unlinked_cache": 1}
+
+    cache.discard("5/2026")
+    assert len(cache) == 0
+
+def test_update_unlinked_cache_skips_fetch_failures(tmp_path):
+    manager = DataManager(unlinked_cache_path=str(tmp_path / "unlinked_cases.json"))
+    cache = manager.load_unlinked_cache()
+    report = ScrapeReport()
+    report.add_skipped_case("verdicts", {"supreme_case_link": "https://island.is/domar/s-blip", "source_type": "dóm"}, "missing_supreme_case_number")
+    report.add_skipped_case(
+        "verdicts",
+        {"supreme_case_number": "7/2026", "supreme_case_link": "https://island.is/domar/s-unlinked", "source_type": "dóm"},
+        "missing_appeals_case_number",
+    )
+
+    assert manager.update_unlinked_cache(cache, report, []) == 1
+    assert cache.is_suppressed("https://island.is/domar/s-unlinked", "7/2026")
+    assert not cache.is_suppressed("https://island.is/domar/s-blip", "")
+
 def test_run_scrape_blocks_suspicious_detail_parse_failure(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
@@ -282,8 +559,8 @@ def test_run_scrape_blocks_suspicious_detail_parse_failure(tmp_path, monkeypatch
     (tmp_path / "mapping.json").write_text('{"unchanged": true}\n', encoding="utf-8")
     (tmp_path / "last_updated.txt").write_text("Síðast uppfært áður.\n", encoding="utf-8")
 
-    class BrokenScraper:
-        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None):
+    class BrokenScraper(Scraper):
+        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None, windows=None, known_index=None):
             stats = report.source("verdicts")
             stats.listing_pages_fetched += 1
             stats.listing_items_discovered += 1
@@ -294,10 +571,10 @@ def test_run_scrape_blocks_suspicious_detail_parse_failure(tmp_path, monkeypatch
                 {"supreme_case_link": "https://island.is/domar/s-broken", "source_type": "dóm"},
                 "missing_supreme_case_number",
             )
-            return [], True
+            return []
 
-        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None):
-            return [], False
+        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None, known_index=None, page_ranges=None):
+            return []
 
     exit_code = run_scrape(BrokenScraper(), manager, max_pages=1, report_path=report_path)
 
@@ -322,17 +599,18 @@ def test_run_scrape_allows_incremental_no_change_run(tmp_path, monkeypatch):
     ])
     (tmp_path / "allir_domar_og_akvardanir.csv").write_text(csv_text, encoding="utf-8")
 
-    class NoChangeScraper:
-        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None):
+    class NoChangeScraper(Scraper):
+        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None, windows=None, known_index=None):
             stats = report.source("verdicts")
             stats.listing_pages_fetched += 1
             stats.listing_items_discovered += 1
             stats.known_items_skipped += 1
             assert "1/2026" in known_case_numbers
-            return [], True
+            assert windows == [(date(2025, 12, 18), None)]
+            return []
 
-        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None):
-            return [], False
+        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None, known_index=None, page_ranges=None):
+            return []
 
     exit_code = run_scrape(NoChangeScraper(), manager, max_pages=1, report_path=report_path)
 
@@ -346,6 +624,82 @@ def test_run_scrape_allows_incremental_no_change_run(tmp_path, monkeypatch):
     mapping = json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))
     assert mapping["2/2025"]["supreme_case_number"] == "1/2026"
 
+def test_run_scrape_records_memory_phases_and_enforces_budget(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    report_path = tmp_path / "scrape_report.json"
+    (tmp_path / "allir_domar_og_akvardanir.csv").write_text(",".join(manager.columns) + "\n", encoding="utf-8")
+    (tmp_path / "mapping.json").write_text('{"unchanged": true}\n', encoding="utf-8")
+
+    class OneRowScraper(Scraper):
+        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None, windows=None, known_index=None):
+            stats = report.source("verdicts")
+            stats.listing_pages_fetched += 1
+            stats.listing_items_discovered += 1
+            stats.detail_pages_attempted += 1
+            stats.detail_pages_with_case_number += 1
+            stats.linked_rows += 1
+            return [{
+                "supreme_case_number": "1/2026",
+                "supreme_case_link": "https://island.is/domar/s-known",
+                "appeals_case_number": "2/2025",
+                "appeals_case_link": "https://island.is/domar/g-known",
+                "source_type": "dóm",
+                "verdict_date": "1. janúar 2026",
+                "decision_status": "",
+            }]
+
+        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None, known_index=None, page_ranges=None):
+            return []
+
+    exit_code = run_scrape(OneRowScraper(), manager, max_pages=1, report_path=report_path)
+
+    assert exit_code == 0
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert list(report["memory"]) == [
+        "load_existing",
+        "scrape_verdicts",
+        "scrape_decisions",
+        "save_csv",
+        "generate_json_mapping",
+    ]
+    assert "top_allocations" not in report["memory"]["save_csv"]
+
+    (tmp_path / "mapping.json").write_text('{"unchanged": true}\n', encoding="utf-8")
+    budget = MemoryTracker(budget_mb=1, debug=True)
+    exit_code = run_scrape(OneRowScraper(), manager, max_pages=1, report_path=report_path, memory=budget)
+
+    assert exit_code == 1
+    assert (tmp_path / "mapping.json").read_text(encoding="utf-8") == '{"unchanged": true}\n'
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["failed"] is True
+    assert "memory budget" in report["failure_reason"]
+    assert report["memory_budget_mb"] == 1
+    assert list(report["memory"]) == ["load_existing"]
+    assert report["memory"]["load_existing"]["top_allocations"]
+
+    # Once publishing starts, an overrun is recorded but the artifacts still
+    # get written, so the CSV and mapping.json never drift apart.
+    peak = {"bytes": 0}
+    monkeypatch.setattr("get_new_verdicts.peak_rss_bytes", lambda: peak["bytes"])
+    publish_staged = manager.publish_staged
+
+    def publish_over_budget(sink):
+        peak["bytes"] = 2 * 1024 * 1024 * 1024
+        return publish_staged(sink)
+
+    monkeypatch.setattr(manager, "publish_staged", publish_over_budget)
+    budget = MemoryTracker(budget_mb=1024)
+    exit_code = run_scrape(OneRowScraper(), manager, full=True, max_pages=1, report_path=report_path, memory=budget)
+
+    assert exit_code == 0
+    assert "1/2026" in (tmp_path / "mapping.json").read_text(encoding="utf-8")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["memory"]["save_csv"]["budget_exceeded"] is True
+    assert report["memory"]["generate_json_mapping"]["budget_exceeded"] is True
+    assert (report["memory"]["save_csv"]["process_peak_rss_mb"], report["memory"]["save_csv"]["peak_growth_mb"]) == (2048, 2048)
+    assert (report["memory"]["generate_json_mapping"]["process_peak_rss_mb"], report["memory"]["generate_json_mapping"]["peak_growth_mb"]) == (2048, 0)
+
 def test_run_link_migration_rewrites_2018_and_newer_links(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
@@ -393,3 +747,783 @@ def test_run_link_migration_rewrites_2018_and_newer_links(tmp_path, monkeypatch)
 
     mapping = json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))
     assert mapping["155/2025"]["supreme_case_link"].startswith("https://island.is/domar/s-")
+
+def test_run_link_verification_checks_least_recently_verified_links(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    report_path = tmp_path / "scrape_report.json"
+    csv_text = "\n".join([
+        ",".join(manager.columns),
+        "1/2026,https://island.is/domar/s-one,2/2025,https://island.is/domar/g-one,dóm,1. janúar 2026,",
+        "2/2026,https://island.is/domar/s-two,3/2025,,dóm,2. janúar 2026,",
+        "",
+    ])
+    (tmp_path / "allir_domar_og_akvardanir.csv").write_text(csv_text, encoding="utf-8")
+    manager.save_link_verifications({
+        "https://island.is/domar/s-one": {"verified_at": "2026-05-01T00:00:00+00:00", "status": 200, "ok": True},
+        "https://island.is/domar/g-one": {"verified_at": "2026-05-02T00:00:00+00:00", "status": 200, "ok": True},
+        "https://island.is/domar/s-removed": {"verified_at": "2026-04-01T00:00:00+00:00", "status": 200, "ok": True},
+    })
+
+    checked = []
+
+    class FakeScraper:
+        def check_link(self, url):
+            checked.append(url)
+            return 404 if url.endswith("s-two") else 200
+
+    exit_code = run_link_verification(FakeScraper(), manager, budget=2, report_path=report_path)
+
+    assert exit_code == 1
+    assert sorted(checked) == ["https://island.is/domar/s-one", "https://island.is/domar/s-two"]
+    state = manager.load_link_verifications()
+    assert sorted(state) == [
+        "https://island.is/domar/g-one",
+        "https://island.is/domar/s-one",
+        "https://island.is/domar/s-two",
+    ]
+    assert state["https://island.is/domar/s-two"]["status"] == 404
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["mode"] == "verify-links"
+    assert report["link_verification"]["cycle_runs"] == 2
+    assert [link["url"] for link in report["broken_links"]] == ["https://island.is/domar/s-two"]
+    assert report["broken_links"][0]["supreme_case_number"] == "2/2026"
+
+def test_listing_watcher_scrapes_only_when_stand_in_listing_changes(tmp_path, monkeypatch):
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import get_new_verdicts
+
+    listing = {
+        "verdicts": [{"id": "s-AAAA", "caseNumber": "20/2026", "court": "Hæstiréttur"}],
+        "decisions_etag": '"v1"',
+        "decision_requests": [],
+    }
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"data": {"webVerdicts": {"total": 1, "items": listing["verdicts"]}}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            listing["decision_requests"].append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == listing["decisions_etag"]:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = b'<a href="/s/haestirettur/akvardanir/11111111-1111-4111-8111-111111111111">2026-40</a>'
+            self.send_response(200)
+            self.send_header("ETag", listing["decisions_etag"])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(get_new_verdicts, "GRAPHQL_URL", f"{base_url}/api/graphql")
+    monkeypatch.setattr(get_new_verdicts, "DECISION_LISTING_URL", f"{base_url}/s/haestirettur/akvardanir")
+
+    scrapes = []
+    status_path = tmp_path / "watch_status.json"
+    watcher = ListingWatcher(Scraper(retries=0), lambda: scrapes.append("scrape") or 0, interval=0, status_path=status_path)
+
+    try:
+        assert watcher.poll_once() is True
+        assert watcher.poll_once() is False
+        listing["verdicts"].insert(0, {"id": "s-BBBB", "caseNumber": "21/2026", "court": "Hæstiréttur"})
+        assert watcher.poll_once() is True
+        assert watcher.run(max_polls=1) == 0
+    finally:
+        server.shutdown()
+
+    assert scrapes == ["scrape", "scrape"]
+    assert listing["decision_requests"] == [None, '"v1"', '"v1"', '"v1"']
+    status = json.loads(status_path.read_text(encoding="utf-8"))
+    assert status["polls"] == 4
+    assert status["changes"] == 2
+    assert status["healthy"] is True
+    assert status["last_scrape_exit_code"] == 0
+
+def test_listing_watcher_retries_failed_scrapes_and_survives_errors(tmp_path, scraper, monkeypatch):
+    monkeypatch.setattr(scraper, "get_verdict_listing_page", lambda page: ([("https://island.is/domar/s-AAAA", "20/2026")], 1, True))
+    monkeypatch.setattr(scraper, "fetch_page_conditional", lambda url, validators: (200, "<main></main>", {"etag": '"v1"'}))
+    outcomes = [RuntimeError("scrape blew up"), 1, 0]
+    calls = []
+
+    def on_change():
+        calls.append(len(calls))
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    watcher = ListingWatcher(scraper, on_change, interval=0, status_path=tmp_path / "watch_status.json")
+
+    assert watcher.poll_once() is True
+    assert watcher.status["last_error"] == "Scrape raised RuntimeError: scrape blew up"
+    assert watcher.fingerprints == {}
+    assert watcher.poll_once() is True
+    assert watcher.status["last_scrape_exit_code"] == 1
+    assert watcher.poll_once() is True
+    assert watcher.poll_once() is False
+    assert calls == [0, 1, 2]
+    assert watcher.decision_validators == {"etag": '"v1"'}
+
+def test_reparse_from_archive_rederives_rows_offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    decision_url = "https://island.is/s/haestirettur/akvardanir/B6876E63-7F67-4945-8C8F-B29E7E3C7E2C"
+    appeals_url = "https://landsrettur.is/domar-og-urskurdir/domur-urskurdur/?id=abc&verdictid=def"
+    island_appeals_url = "https://island.is/domar/g-ccc9aa9e-15cb-47b2-87dd-9116cf17c3e3"
+    pages = {
+        decision_url.lower(): f"""
+        <main>
+          <h2>Mál nr.2026-27</h2>
+          <p>Miðvikudagurinn 15. apríl 2026</p>
+          <h3>Lykilorð</h3>
+          <ul><li>Hafnað</li></ul>
+          <a href="{appeals_url}">Úrlausn Landsréttar / Héraðsdóms</a>
+        </main>
+        """,
+        appeals_url: "Mál nr. 102/2025",
+    }
+    archive = HtmlArchive(tmp_path / "archive")
+    scraper = Scraper(archive=archive)
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: pages[url])
+    assert scraper.parse_supreme_page(decision_url.lower(), "ákvörðun")["decision_status"] == "Hafnað"
+    assert decision_url in archive
+    assert archive.load(appeals_url) == "Mál nr. 102/2025"
+
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    stale = pd.DataFrame([
+        ["2026-27", decision_url, "102/2025", island_appeals_url, "ákvörðun", "15. apríl 2026", "2026-04-15", "Samþykkt"],
+        ["1/2026", "https://island.is/domar/s-unarchived", "2/2025", "", "dóm", "1. janúar 2026", "2026-01-01", ""],
+    ], columns=manager.columns)
+    manager.write_data(stale)
+
+    assert run_reparse_from_archive(manager, archive, workers=2, dry_run=True) == 0
+    diff = json.loads((tmp_path / "reparse_diff.json").read_text(encoding="utf-8"))
+    assert (diff["rows_reparsed"], diff["rows_not_archived"], diff["rows_changed"]) == (1, 1, 1)
+    assert diff["changes"][0]["fields"] == {"decision_status": {"old": "Samþykkt", "new": "Hafnað"}}
+    assert manager.load_existing_data()["decision_status"].tolist() == ["Samþykkt", ""]
+
+    assert run_reparse_from_archive(manager, archive, workers=2) == 0
+    rows = manager.load_existing_data()
+    assert rows["decision_status"].tolist() == ["Hafnað", ""]
+    assert rows["appeals_case_link"].tolist() == [island_appeals_url, ""]
+    assert json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))["102/2025"]["decision_status"] == "Hafnað"
+
+def test_repair_refetches_only_selected_rows_and_fills_their_gaps(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    decision_url = "https://island.is/s/haestirettur/akvardanir/B6876E63-7F67-4945-8C8F-B29E7E3C7E2C"
+    failing_url = "https://island.is/s/haestirettur/akvardanir/EA844C6E-DA91-4701-8EBD-782B500E1C29"
+    verdict_url = "https://island.is/domar/s-B31031B4-3EEB-44FD-89E6-28D1C415BE50"
+    complete_url = "https://island.is/domar/s-0D3A8E51-2B1C-4C1E-9A57-4A5C4B0F1E22"
+    decision_appeals_url = "https://island.is/domar/g-ccc9aa9e-15cb-47b2-87dd-9116cf17c3e3"
+    verdict_appeals_url = "https://island.is/domar/g-323affbf-bb40-4730-b1d9-71c32293ea0d"
+    legacy_url = "https://www.haestirettur.is/domar/_domur/?id=7C4E0F0A-5B1D-4D0E-8F1A-2F7C9B1E6A11"
+    legacy_appeals_url = "https://landsrettur.is/domar-og-urskurdir/domur-urskurdur/?id=abc"
+    island_legacy_url = legacy_supreme_link_to_island(legacy_url, "dóm")
+    legacy_island_appeals_url = "https://island.is/domar/g-5e0f3a1c-9d2b-4c7e-8a6f-1b2c3d4e5f60"
+    pages = {
+        island_legacy_url: f'<main><h2>Mál nr.20/2026</h2><p>Þriðjudagurinn 28. apríl 2026</p><a href="{legacy_island_appeals_url}">Úrlausn</a></main>',
+        legacy_island_appeals_url: "LANDSRÉTTUR Mál nr. 156/2025",
+        decision_url: f"""
+        <main>
+          <h2>Mál nr.2026-27</h2>
+          <p>Miðvikudagurinn 15. apríl 2026</p>
+          <h3>Lykilorð</h3>
+          <ul><li>Hafnað</li></ul>
+          <a href="{decision_appeals_url}">Úrlausn Landsréttar / Héraðsdóms</a>
+        </main>
+        """,
+        decision_appeals_url: "LANDSRÉTTUR Mál nr. 102/2025",
+        verdict_url: f'<main><h2>Mál nr.18/2026</h2><p>Mánudagurinn 27. apríl 2026</p><a href="{verdict_appeals_url}">Úrlausn</a></main>',
+        verdict_appeals_url: "LANDSRÉTTUR Mál nr. 155/2025",
+        failing_url: None,
+    }
+    fetched = []
+
+    def fetch_page(url):
+        fetched.append(url)
+        return pages[url]
+
+    scraper = Scraper()
+    monkeypatch.setattr(scraper, "fetch_page", fetch_page)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    manager.write_data(pd.DataFrame([
+        ["2026-27", decision_url, "102/2025", decision_appeals_url, "ákvörðun", "15. apríl 2026", "2026-04-15", ""],
+        ["18/2026", verdict_url, "155/2025", "", "dóm", "27. apríl 2026", "2026-04-27", ""],
+        ["1/2026", complete_url, "2/2025", verdict_appeals_url, "dóm", "1. janúar 2026", "2026-01-01", ""],
+        ["2026-28", failing_url, "103/2025", decision_appeals_url, "ákvörðun", "16. apríl 2026", "2026-04-16", ""],
+        ["20/2026", legacy_url, "156/2025", legacy_appeals_url, "dóm", "28. apríl 2026", "2026-04-28", ""],
+    ], columns=manager.columns))
+
+    assert [idx for idx, _ in select_repair_rows(manager.load_rows(), [], before=date(2026, 4, 16))] == [0, 2]
+    assert run_repair(scraper, manager, workers=4, dry_run=True) == 0
+    assert complete_url not in fetched
+    diff = json.loads((tmp_path / "repair_diff.json").read_text(encoding="utf-8"))
+    assert legacy_url not in fetched
+    assert (diff["rows_selected"], diff["rows_changed"], diff["unresolved"]) == (4, 3, ["2026-28"])
+    assert {change["supreme_case_number"]: change["fields"] for change in diff["changes"]} == {
+        "2026-27": {"decision_status": {"old": "", "new": "Hafnað"}},
+        "18/2026": {"appeals_case_link": {"old": "", "new": verdict_appeals_url}},
+        "20/2026": {
+            "supreme_case_link": {"old": legacy_url, "new": island_legacy_url},
+            "appeals_case_link": {"old": legacy_appeals_url, "new": legacy_island_appeals_url},
+        },
+    }
+    assert manager.load_existing_data()["decision_status"].tolist() == ["", "", "", "", ""]
+
+    assert run_repair(scraper, manager, predicates=["missing-fields"], limit=2, workers=4) == 0
+    rows = manager.load_existing_data().set_index("supreme_case_number")
+    assert rows.loc["2026-27", "decision_status"] == "Hafnað"
+    assert rows.loc["18/2026", "appeals_case_link"] == verdict_appeals_url
+    assert rows.loc["2026-28", "decision_status"] == ""
+    assert rows.loc["20/2026", "supreme_case_link"] == legacy_url
+
+    assert run_repair(scraper, manager, predicates=["legacy-links"], workers=4) == 0
+    rows = manager.load_existing_data().set_index("supreme_case_number")
+    assert rows.loc["20/2026", ["supreme_case_link", "appeals_case_link"]].tolist() == [island_legacy_url, legacy_island_appeals_url]
+    assert select_repair_rows(manager.load_rows(), ["legacy-links"]) == []
+    assert json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))["155/2025"]["supreme_case_link"] == verdict_url
+
+    stored = VerdictRow(supreme_case_number="2026-27", appeals_case_number="102/2025", appeals_case_link=decision_appeals_url, verdict_date="15. apríl 2026")
+    flaky = stored.replace(appeals_case_link="https://landsrettur.is/domar/1", verdict_date="")
+    assert repaired_fields(stored, flaky) == {}
+
+def test_scraper_reuses_pooled_connections_across_threads():
+    import concurrent.futures
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class KeepAliveHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b"ok"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    scraper = Scraper(retries=0, pool_size=2)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
+            assert list(executor.map(scraper.fetch_page, [url] * 30)) == ["ok"] * 30
+    finally:
+        server.shutdown()
+
+    [stats] = scraper.connection_stats().values()
+    assert stats["requests"] == 30
+    assert stats["connections_opened"] <= 2
+    assert stats["connections_reused"] == 30 - stats["connections_opened"]
+
+def test_circuit_breaker_fails_fast_and_deferred_retry_recovers(scraper, monkeypatch):
+    links = [f"https://island.is/domar/s-{index:08d}-1111-4111-8111-111111111111" for index in range(7)]
+    monkeypatch.setattr(
+        scraper,
+        "get_verdict_listing_page",
+        lambda page, date_from=None, date_to=None: ([(link, f"{index}/2026") for index, link in enumerate(links)] if page == 1 else [], 7, True),
+    )
+    state = {"up": False, "fetches": []}
+
+    def fetch_page(url):
+        state["fetches"].append(url)
+        if not state["up"]:
+            return None
+        return f"<main><h2>Mál nr. {links.index(url)}/2026</h2></main>"
+
+    monkeypatch.setattr(scraper, "fetch_page", fetch_page)
+    report = ScrapeReport()
+    rows = list(scraper.scrape_verdicts(set(), full=True, report=report))
+
+    assert rows == [] and report.sources["verdicts"].listing_pages_fetched > 0
+    assert len(state["fetches"]) == 5
+    assert len(scraper.deferred) == 7
+    assert scraper.breaker.to_dict() == {"trips": {"island.is:verdict": 1}, "rejected": {"island.is:verdict": 2}, "open": ["island.is:verdict"]}
+    assert report.sources["verdicts"].detail_pages_attempted == 0
+
+    state["up"] = True
+    scraper.deferred_retry_backoff = 0
+    known = set()
+    recovered = list(scraper.retry_deferred(report, known))
+
+    assert sorted(row["supreme_case_number"] for row in recovered) == sorted(f"{index}/2026" for index in range(7))
+    assert report.deferred_retries == {"queued": 7, "recovered": 7, "failed": 0, "carried_over": 0, "rounds": 1}
+    assert report.sources["verdicts"].detail_pages_with_case_number == 7
+    assert report.circuit_breakers["open"] == []
+
+def test_time_budget_checkpoints_and_next_run_resumes(tmp_path, scraper, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    report_path = tmp_path / "scrape_report.json"
+    known = "https://island.is/domar/s-00000000-0000-4000-8000-000000000000"
+    (tmp_path / "allir_domar_og_akvardanir.csv").write_text(
+        ",".join(manager.columns) + f"\n1/2026,{known},1/2025,https://island.is/domar/g-known,dóm,1. janúar 2026,\n",
+        encoding="utf-8",
+    )
+    links = {f"{number}/2026": f"https://island.is/domar/s-{number:08d}-1111-4111-8111-111111111111" for number in (5, 4, 3)}
+    lower_court = "https://island.is/domar/g-66666666-6666-4666-8666-666666666666"
+    verdict_pages = {
+        1: [(links["5/2026"], "5/2026"), (links["4/2026"], "4/2026")],
+        2: [(links["3/2026"], "3/2026"), (known, "1/2026")],
+    }
+    monkeypatch.setattr(
+        scraper,
+        "get_verdict_listing_page",
+        lambda page, date_from=None, date_to=None: (verdict_pages.get(page, []), 4, True),
+    )
+    monkeypatch.setattr(scraper, "get_decision_listing_page", lambda page: ([], True))
+    fetched = []
+
+    def fetch_page(url):
+        if url == lower_court:
+            return "LANDSRÉTTUR Mál nr. 155/2025"
+        fetched.append(url)
+        if budget_spent["after"] == len(fetched):
+            # Publishing now needs more time than the budget has left.
+            scraper.deadline.reserve_flush(10 ** 6)
+        case_number = next(number for number, link in links.items() if link == url)
+        return f'<main><h2>Mál nr. {case_number}</h2><p>2. janúar 2026</p><a href="{lower_court}">Úrlausn</a></main>'
+
+    budget_spent = {"after": 1}
+    monkeypatch.setattr(scraper, "fetch_page", fetch_page)
+    exit_code = run_scrape(scraper, manager, report_path=report_path, watermark_overlap_days=None, time_budget=3600)
+
+    assert exit_code == 0
+    assert fetched == [links["5/2026"]]
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["time_budget"]["reached"] is True
+    assert report["csv_rows_added"] == 1
+    pending = json.loads((tmp_path / "pending_work.json").read_text(encoding="utf-8"))
+    assert pending["detail_links"] == [{"source": "verdicts", "link": links["4/2026"]}]
+    assert pending["listing_cursors"] == [
+        {"source": "verdicts", "page": 2, "full": False, "date_from": "", "date_to": ""},
+        {"source": "decisions", "page": 1, "full": False},
+    ]
+
+    budget_spent["after"] = 0
+    exit_code = run_scrape(scraper, manager, report_path=report_path, watermark_overlap_days=None)
+
+    assert exit_code == 0
+    assert fetched[1:] == [links["4/2026"], links["3/2026"]]
+    stored = set(manager.load_existing_data()["supreme_case_number"])
+    assert stored == {"1/2026", "3/2026", "4/2026", "5/2026"}
+    pending = json.loads((tmp_path / "pending_work.json").read_text(encoding="utf-8"))
+    assert pending == {"version": 1, "detail_links": [], "listing_cursors": []}
+
+
+def test_failed_budgeted_run_keeps_previous_and_deferred_work(tmp_path, scraper, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    (tmp_path / "allir_domar_og_akvardanir.csv").write_text(
+        ",".join(manager.columns) + "\n1/2026,https://island.is/domar/s-00000000-0000-4000-8000-000000000000,1/2025,"
+        "https://island.is/domar/g-known,dóm,1. janúar 2026,\n",
+        encoding="utf-8",
+    )
+    previous_link = {"source": "verdicts", "link": "https://island.is/domar/s-22222222-2222-4222-8222-222222222222"}
+    old_cursor = {"source": "decisions", "page": 3, "full": False}
+    manager.save_pending_work({"detail_links": [previous_link], "listing_cursors": [old_cursor]})
+    # Publishing needs more time than the whole budget, so nothing is dispatched.
+    monkeypatch.setattr(manager, "measure_flush_seconds", lambda df: 10 ** 6)
+    monkeypatch.setattr(scraper, "fetch_page", lambda url: pytest.fail(f"fetched {url}"))
+
+    exit_code = run_scrape(scraper, manager, report_path=tmp_path / "scrape_report.json", watermark_overlap_days=None, time_budget=3600)
+
+    assert exit_code == 1
+    pending = manager.load_pending_work()
+    assert pending["detail_links"] == [previous_link]
+    assert {cursor["source"]: cursor["page"] for cursor in pending["listing_cursors"]} == {"decisions": 3, "verdicts": 1}
+
+def test_verdict_row_packs_fields_and_renders_them_back():
+    fields = {
+        "supreme_case_number": "2026-31",
+        "supreme_case_link": "https://island.is/s/haestirettur/akvardanir/EA844C6E-DA91-4701-8EBD-782B500E1C29",
+        "appeals_case_number": "22/2025",
+        "appeals_case_link": "https://island.is/domar/g-2da6e6c6-52bf-4a6e-9656-ed6de5a4b709",
+        "source_type": "ákvörðun",
+        "verdict_date": "20. apríl 2026",
+        "verdict_date_iso": "2026-04-20",
+        "decision_status": "Hafnað",
+    }
+    row = VerdictRow(**fields)
+
+    assert row == fields and dict(row) == fields and row.to_dict() == fields
+    assert isinstance(row._supreme_case_link, bytes) and len(row._supreme_case_link) == 17
+    assert row.parsed_date == date(2026, 4, 20) and row.is_decision
+    assert pickle.loads(pickle.dumps(row)) == row
+    assert row.replace(appeals_case_link="")["appeals_case_link"] == ""
+    assert row.replace(verdict_date="1. maí 2026")["verdict_date_iso"] == "2026-05-01"
+    assert VerdictRow(**{**fields, "verdict_date_iso": ""})["verdict_date_iso"] == "2026-04-20"
+
+    odd = {
+        **fields,
+        "supreme_case_link": "https://island.is/domar/s-MiXeD",
+        "verdict_date": "08. apríl 2026",
+        "verdict_date_iso": "2026-04-08",
+        "source_type": "dómur",
+    }
+    assert VerdictRow.from_mapping(odd).to_dict() == odd
+
+
+def test_generated_mapping_is_date_sorted_with_iso_dates(tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text(
+        "supreme_case_number,supreme_case_link,appeals_case_number,appeals_case_link,source_type,verdict_date,decision_status\n"
+        "40/2022,https://island.is/domar/s-three,37/2022,,dóm,3. október 2022,\n"
+        "2022-150,https://island.is/s/haestirettur/akvardanir/four,37/2022,https://island.is/domar/g-two,ákvörðun,,Hafnað\n"
+        "2022-101,https://island.is/s/haestirettur/akvardanir/two,37/2022,https://landsrettur.is/domar/two,ákvörðun,2. maí 2022,Samþykkt\n"
+        "12/2023,https://island.is/domar/s-one,731/2022,https://island.is/domar/g-one,dóm,1. mars 2023,\n",
+        encoding="utf-8",
+    )
+    manager = DataManager(
+        csv_path=str(csv_path),
+        json_path=str(tmp_path / "mapping.json"),
+        index_path=str(tmp_path / "case_index.json"),
+        binary_index_path=str(tmp_path / "mapping.idx"),
+        pages_dir=str(tmp_path / "mal"),
+        changes_dir=str(tmp_path / "changes"),
+    )
+
+    assert manager.load_existing_data()["verdict_date_iso"].tolist() == ["2022-10-03", "", "2022-05-02", "2023-03-01"]
+    assert manager.verdict_watermark(manager.load_existing_data(), overlap_days=0) == date(2023, 3, 1)
+    assert manager.generate_json_mapping() == 4
+
+    mapping = json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))
+    assert mapping["731/2022"]["verdict_date_iso"] == "2023-03-01"
+    assert [record["supreme_case_number"] for record in mapping["37/2022"]] == ["2022-101", "40/2022", "2022-150"]
+    assert [record["appeals_case_link"] for record in mapping["37/2022"]] == ["https://landsrettur.is/domar/two", "", "https://island.is/domar/g-two"]
+    assert entry_appeals_link(mapping["37/2022"]) == "https://island.is/domar/g-two"
+    assert entry_appeals_link(mapping["37/2022"][:2]) == "https://landsrettur.is/domar/two"
+
+
+def test_case_pages_are_rendered_escaped_and_rewritten_only_when_changed(tmp_path):
+    record = {
+        "supreme_case_number": "12/2023",
+        "supreme_case_link": "https://island.is/domar/s-one",
+        "appeals_case_link": "javascript:alert(1)",
+        "source_type": "ákvörðun",
+        "verdict_date": "1. mars 2023",
+        "verdict_date_iso": "2023-03-01",
+        "decision_status": "<b>Hafnað</b>",
+    }
+    mapping = {"731/2022": record, "37/2022": [record, {**record, "supreme_case_number": "40/2022"}], "bad key": record}
+    manager = DataManager(pages_dir=str(tmp_path / "mal"))
+
+    assert manager.write_case_pages(mapping) == (2, 0)
+    page = (tmp_path / "mal" / "731-2022" / "index.html").read_text(encoding="utf-8")
+    assert '<a href="https://island.is/domar/s-one" target="_blank" rel="noopener">Mál nr. 12/2023</a>' in page
+    assert "Landsréttarmál nr. <strong>731/2022</strong>" in page
+    assert '<span class="status-chip status-chip-rejected">&lt;b&gt;Hafnað&lt;/b&gt;</span>' in page
+    assert page.count('class="result-item"') == 1
+    assert "<title>Landsréttarmál nr. 731/2022 – Finna dóma og ákvarðanir Hæstaréttar</title>" in page
+    assert '<link rel="stylesheet" href="../../style.css">' in page
+
+    assert manager.write_case_pages(mapping) == (0, 0)
+    changed = {"731/2022": {**record, "verdict_date": "2. mars 2023"}, "37/2022": mapping["37/2022"]}
+    assert manager.write_case_pages(changed) == (1, 0)
+    assert "2. mars 2023" in (tmp_path / "mal" / "731-2022" / "index.html").read_text(encoding="utf-8")
+
+    assert manager.write_case_pages({"731/2022": changed["731/2022"]}) == (0, 1)
+    assert not (tmp_path / "mal" / "37-2022").exists()
+
+
+def test_case_page_head_is_read_from_index_html_with_rebased_urls(tmp_path):
+    index = tmp_path / "index.html"
+    index.write_text(
+        '<html><head><script src="https://example.com/tag.js"></script><title>App</title>'
+        '<link rel="icon" href="/favicon.ico"><link rel="stylesheet" href="style.css"></head>'
+        '<body><script src="app.js"></script></body></html>',
+        encoding="utf-8",
+    )
+
+    head, title = case_page_head(index)
+
+    assert title == "App"
+    assert head == (
+        '<script src="https://example.com/tag.js"></script><title>App</title>'
+        '<link rel="icon" href="/favicon.ico"><link rel="stylesheet" href="../../style.css">'
+    )
+
+
+def test_change_feed_records_generations_and_cheapest_sync_paths(tmp_path, monkeypatch):
+    import get_new_verdicts
+
+    manager = DataManager(json_path=str(tmp_path / "mapping.json"), changes_dir=str(tmp_path / "changes"))
+    record = {"supreme_case_number": "12/2023", "verdict_date": "1. mars 2023"}
+
+    def publish(mapping):
+        previous = json.loads(manager.json_path.read_text(encoding="utf-8")) if manager.json_path.exists() else None
+        manager.json_path.write_text(json.dumps(mapping, ensure_ascii=False, indent=2) + " " * 2000, encoding="utf-8")
+        return manager.write_change_feed(previous, mapping)
+
+    generations = [
+        {"731/2022": record, "37/2022": record},
+        {"731/2022": {**record, "verdict_date": "2. mars 2023"}, "1/2024": [record, record]},
+        {"731/2022": {**record, "verdict_date": "2. mars 2023"}, "1/2024": [record, record], "2/2024": record},
+    ]
+    assert publish(generations[0]) == 1
+    assert publish(generations[1]) == 2
+    assert publish(generations[1]) is None and manager.generation == 2
+    monkeypatch.setattr(get_new_verdicts, "DELTA_RETENTION_GENERATIONS", 1)
+    assert publish(generations[2]) == 3
+
+    changes = tmp_path / "changes"
+    manifest = json.loads((changes / "manifest.json").read_text(encoding="utf-8"))
+    assert [step["generation"] for step in manifest["deltas"]] == [3]
+    assert not (changes / "2.json").exists()
+    assert sync_plan(manifest, 3) == []
+    assert sync_plan(manifest, 2) == ["changes/3.json"]
+    assert sync_plan(manifest, 1) == sync_plan(manifest, None) == ["mapping.json"]
+
+    delta = json.loads((changes / "3.json").read_text(encoding="utf-8"))
+    assert apply_delta(json.loads(json.dumps(generations[1])), delta) == generations[2]
+    log = [json.loads(line) for line in (changes / "changes.ndjson").read_text(encoding="utf-8").splitlines()]
+    assert [(event["generation"], event["op"], event["case"]) for event in log] == [
+        (2, "added", "1/2024"),
+        (2, "changed", "731/2022"),
+        (2, "removed", "37/2022"),
+        (3, "added", "2/2024"),
+    ]
+
+
+def test_row_sink_stages_batches_and_publishes_only_after_the_guards(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    csv_path = tmp_path / "allir_domar_og_akvardanir.csv"
+    csv_path.write_text(
+        "supreme_case_number,supreme_case_link,appeals_case_number,appeals_case_link,source_type,verdict_date,decision_status\n"
+        "1/2026,https://island.is/domar/s-known,2/2025,https://landsrettur.is/domur,dóm,1. janúar 2026,",
+        encoding="utf-8",
+    )
+
+    def row(number, appeals_case_number="5/2025"):
+        return VerdictRow(
+            supreme_case_number=f"{number}/2026",
+            supreme_case_link=f"https://island.is/domar/s-{number}",
+            appeals_case_number=appeals_case_number,
+            source_type="dóm",
+            verdict_date="2. janúar 2026",
+        )
+
+    sink = manager.row_sink({"1/2026"}, batch_size=2)
+    sink.extend([row(1), row(2), row(3), row(2), row(4, appeals_case_number="")])
+    assert (sink.staged, sink.linked) == (3, 2)
+    assert len(manager.staging_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    # A run that dies here leaves its staged rows for the next one.
+    sink = manager.row_sink({"1/2026"}, batch_size=2)
+    assert sink.recover() == 2
+    sink.extend([row(3), row(4, appeals_case_number="")])
+    assert manager.publish_staged(sink) == 2
+    assert not manager.staging_path.exists()
+    stored = manager.load_existing_data()
+    assert stored["supreme_case_number"].tolist() == ["1/2026", "2/2026", "3/2026"]
+    assert stored["verdict_date_iso"].tolist() == ["2026-01-01", "2026-01-02", "2026-01-02"]
+    assert csv_path.read_text(encoding="utf-8").startswith(",".join(manager.columns) + "\n")
+
+    class MostlyBrokenScraper(Scraper):
+        def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None, windows=None, known_index=None):
+            stats = report.source("verdicts")
+            stats.listing_pages_fetched += 1
+            stats.listing_items_discovered += 5
+            stats.detail_pages_attempted += 5
+            stats.detail_pages_with_case_number += 1
+            stats.detail_pages_without_case_number += 4
+            yield row(9)
+            assert manager.staging_path.exists() is False
+            yield from [row(10), row(11)]
+            assert manager.staging_path.exists()
+
+        def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None, known_index=None, page_ranges=None):
+            return []
+
+    before = csv_path.read_text(encoding="utf-8")
+    row_sink = manager.row_sink
+    monkeypatch.setattr(manager, "row_sink", lambda known: row_sink(known, batch_size=2))
+    assert run_scrape(MostlyBrokenScraper(), manager, max_pages=1, report_path=tmp_path / "scrape_report.json") == 1
+    assert csv_path.read_text(encoding="utf-8") == before
+    assert not manager.staging_path.exists()
+
+
+def test_shard_runs_split_the_listings_and_merge_into_one_publish(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    csv_path = tmp_path / "allir_domar_og_akvardanir.csv"
+    stored = (
+        "2025-1,https://island.is/s/haestirettur/akvardanir/00000000-0000-4000-8000-000000000000,"
+        "1/2024,https://island.is/domar/g-1,ákvörðun,1. janúar 2025,2025-01-01,Hafnað\n"
+    )
+    csv_path.write_text(",".join(manager.columns) + "\n" + stored, encoding="utf-8")
+
+    assert Shard.parse("2/2") == Shard(2, 2)
+    with pytest.raises(ValueError):
+        Shard.parse("3/2")
+    assert Shard(1, 2).decision_page_ranges(12) == [(1, 6), (11, 12)]
+    assert Shard(2, 2).decision_page_ranges(12) == [(6, 11)]
+    assert Shard(1, 1).decision_page_ranges(12) == [(1, 12)]
+    windows = [Shard(index, 2).verdict_windows(date(2026, 1, 1), date(2026, 10, 19), 100) for index in (1, 2)]
+    assert windows == [
+        [(date(2026, 7, 20), None), (date(2026, 1, 1), date(2026, 4, 10))],
+        [(date(2026, 4, 11), date(2026, 7, 19))],
+    ]
+
+    class ListingScraper(Scraper):
+        def get_decision_listing_page(self, page):
+            if page > 9:
+                return [], True
+            return [
+                (f"https://island.is/s/haestirettur/akvardanir/{page:08d}-0000-4000-8000-{item:012d}", f"2025-{(page - 1) * 3 + item}")
+                for item in (1, 2, 3)
+            ], True
+
+        def get_verdict_listing_page(self, page, date_from=None, date_to=None):
+            return [(f"https://island.is/domar/s-{date_from.isoformat()}", "")], 1, True
+
+        def parse_supreme_page(self, url, source_type):
+            key = url.rsplit("/", 1)[-1]
+            if source_type == "dóm":
+                sequence = date.fromisoformat(key[2:]).timetuple().tm_yday
+                number, appeals_number, verdict_date = f"{sequence}/2026", f"{sequence}/2023", "1. mars 2026"
+            else:
+                page, *_, item = key.split("-")
+                sequence = (int(page) - 1) * 3 + int(item)
+                number, appeals_number, verdict_date = f"2025-{sequence}", f"{sequence}/2024", "2. mars 2025"
+            return VerdictRow(
+                supreme_case_number=number,
+                supreme_case_link=url,
+                appeals_case_number=appeals_number,
+                appeals_case_link=f"https://island.is/domar/g-{appeals_number.replace('/', '-')}",
+                source_type=source_type,
+                verdict_date=verdict_date,
+            )
+
+    shard_options = dict(max_pages=12, since_date=date(2026, 1, 1), date_window_days=100)
+    assert run_scrape(ListingScraper(), manager, shard=Shard(1, 2), **shard_options) == 0
+    assert csv_path.read_text(encoding="utf-8").endswith(stored)
+    assert not (tmp_path / "mapping.json").exists()
+
+    # Without every shard of the split there is nothing to publish.
+    assert run_shard_merge(manager, report_path=tmp_path / "scrape_report.json") == 1
+    assert "Missing shard reports: 2/2" in json.loads((tmp_path / "scrape_report.json").read_text(encoding="utf-8"))["failure_reason"]
+
+    assert run_scrape(ListingScraper(), manager, shard=Shard(2, 2), **shard_options) == 0
+    shard_reports = [json.loads((tmp_path / "shards" / f"shard-{index}-of-2.report.json").read_text(encoding="utf-8")) for index in (1, 2)]
+    assert [report["shard"] for report in shard_reports] == ["1/2", "2/2"]
+    # Shard 1 walks decision pages 1-6 and finds page 11 empty; shard 2
+    # walks 6-9 until page 10 is empty. Page 6 is read by both.
+    assert [report["csv_rows_added"] for report in shard_reports] == [2 + 6 * 3 - 1, 1 + 4 * 3]
+
+    assert run_shard_merge(manager, report_path=tmp_path / "scrape_report.json") == 0
+    report = json.loads((tmp_path / "scrape_report.json").read_text(encoding="utf-8"))
+    assert report["merged_shards"] == ["1/2", "2/2"]
+    assert report["sources"]["decisions"]["listing_pages_fetched"] == 7 + 5
+    assert report["csv_rows_added"] == 3 + 27 - 1
+    rows = manager.load_existing_data()
+    assert rows["supreme_case_number"].is_unique
+    assert len(rows) == 3 + 27
+    assert rows.iloc[0]["appeals_case_link"] == "https://island.is/domar/g-1"
+    assert len(json.loads((tmp_path / "mapping.json").read_text(encoding="utf-8"))) == 30
+
+    # Merging the same shards again adds nothing.
+    assert run_shard_merge(manager, report_path=tmp_path / "scrape_report.json") == 0
+    assert len(manager.load_existing_data()) == 30
+
+
+def test_recorded_cassette_replays_the_run_without_the_network(tmp_path):
+    import gzip
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    requests_seen = []
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def respond(self, status, body=b"", headers=()):
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests_seen.append(("POST", payload["variables"]["page"]))
+            self.respond(200, json.dumps({"page": payload["variables"]["page"]}).encode(), [("Content-Type", "application/json")])
+
+        def do_HEAD(self):
+            requests_seen.append(("HEAD", self.path))
+            self.respond(301, headers=[("Location", "/domar/s-moved")]) if self.path == "/domar/s-old" else self.respond(200)
+
+        def do_GET(self):
+            requests_seen.append(("GET", self.path))
+            time.sleep(0.05)
+            if self.path == "/missing":
+                self.respond(404)
+            elif self.headers.get("If-None-Match") == '"v1"':
+                self.respond(304)
+            else:
+                self.respond(200, "<p>Mál nr. 5/2026 – dómur</p>".encode("utf-8"), [("ETag", '"v1"'), ("Content-Type", "text/html; charset=utf-8")])
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    cassette = tmp_path / "night.ndjson.gz"
+
+    def run(scraper):
+        return [
+            scraper.fetch_page(f"{base_url}/domar"),
+            scraper.fetch_json(f"{base_url}/api/graphql", {"query": "q", "variables": {"page": 1, "court": "H"}}),
+            scraper.fetch_json(f"{base_url}/api/graphql", {"variables": {"court": "H", "page": 2}, "query": "q"}),
+            scraper.fetch_page(f"{base_url}/missing"),
+            scraper.fetch_page_conditional(f"{base_url}/domar", {"etag": '"v1"'})[0],
+            scraper.check_link(f"{base_url}/domar/s-old"),
+        ]
+
+    try:
+        recorder = Scraper(retries=0, recorder=CassetteWriter(cassette))
+        with recorder.session:
+            recorded = run(recorder)
+        assert recorder.transport_stats() == {"mode": "record", "cassette": str(cassette), "exchanges": 7}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert recorded == ["<p>Mál nr. 5/2026 – dómur</p>", {"page": 1}, {"page": 2}, None, 304, 200]
+    with gzip.open(cassette, "rt", encoding="utf-8") as file:
+        entries = [json.loads(line) for line in file]
+    assert json.loads(entries[1]["request"]["body"])["variables"] == {"page": 1, "court": "H"}
+    assert entries[0]["response"]["headers"]["ETag"] == '"v1"'
+    assert entries[0]["elapsed"] >= 0.05
+    seen = len(requests_seen)
+
+    replay = ReplayAdapter(cassette)
+    replayed = Scraper(retries=0, replay=replay)
+    assert run(replayed) == recorded
+    assert replayed.fetch_page(f"{base_url}/never-recorded") is None
+    assert replayed.transport_stats() == {"mode": "replay", "cassette": str(cassette), "exchanges_served": 7, "misses": 1}
+    assert len(requests_seen) == seen
+
+    started = time.perf_counter()
+    Scraper(retries=0, replay=ReplayAdapter(cassette, latency_scale=1.0)).fetch_page(f"{base_url}/missing")
+    assert time.perf_counter() - started >= 0.05
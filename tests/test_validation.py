@@ -0,0 +1,184 @@
+import json
+from pathlib import Path
+
+import validation
+from get_new_verdicts import DataManager, Scraper, run_scrape
+from validation import ContractValidator, check_mapping, check_row, check_rows
+
+ROOT = Path(__file__).resolve().parents[1]
+VALID_ROW = {
+    "supreme_case_number": "2026-31",
+    "supreme_case_link": "https://island.is/s/haestirettur/akvardanir/EA844C6E-DA91-4701-8EBD-782B500E1C29",
+    "appeals_case_number": "22/2025",
+    "appeals_case_link": "https://island.is/domar/g-2da6e6c6-52bf-4a6e-9656-ed6de5a4b709",
+    "source_type": "ákvörðun",
+    "verdict_date": "20. apríl 2026",
+    "verdict_date_iso": "2026-04-20",
+    "decision_status": "Hafnað",
+}
+
+
+def rules(violations):
+    return sorted(violation.rule for violation in violations)
+
+
+def test_row_rules():
+    assert check_row(VALID_ROW) == []
+    legacy = {
+        **VALID_ROW,
+        "supreme_case_number": "24/2017",
+        "supreme_case_link": "https://www.haestirettur.is/domar/_domur/?id=1",
+        "appeals_case_link": "https://www.landsrettur.is/domar-og-urskurdir/domur-urskurdur/?id=2",
+        "verdict_date": "3. maí 2017",
+        "verdict_date_iso": "2017-05-03",
+    }
+    assert check_row(legacy) == []
+    assert check_row({**VALID_ROW, "supreme_case_number": "2020-118", "appeals_case_link": ""}) == []
+
+    assert rules(check_row({**VALID_ROW, "appeals_case_link": ""})) == ["appeals_case_link"]
+    assert rules(check_row({**VALID_ROW, "appeals_case_number": "22-2025"})) == ["appeals_case_number"]
+    assert rules(check_row({**VALID_ROW, "supreme_case_link": "https://island.is/s/haestirettur/akvardanir/nope"})) == ["supreme_case_link"]
+    assert rules(check_row({**VALID_ROW, "verdict_date_iso": "2026-04-21"})) == ["verdict_date_iso"]
+    assert rules(check_row({**VALID_ROW, "verdict_date": "", "verdict_date_iso": ""})) == ["missing_verdict_date"]
+    assert rules(check_row({**VALID_ROW, "verdict_date": "31. febrúar 2026", "verdict_date_iso": ""})) == ["verdict_date"]
+    assert rules(check_row({**VALID_ROW, "supreme_case_link": "https://www.haestirettur.is/domar/_domur/?id=1"})) == ["island_links"]
+    assert rules(check_row({**legacy, "verdict_date": "3. maí 2018", "verdict_date_iso": "2018-05-03"})) == ["island_links", "island_links"]
+
+
+def test_rows_must_be_unique_within_the_delta_and_against_the_store():
+    other = {**VALID_ROW, "supreme_case_number": "2026-32"}
+
+    assert check_rows([VALID_ROW, other], stored_case_numbers={"2026-1"}) == []
+    assert rules(check_rows([VALID_ROW, other, VALID_ROW])) == ["unique_supreme_case_number"]
+    assert rules(check_rows([other], stored_case_numbers={"2026-32"})) == ["unique_supreme_case_number"]
+
+
+def test_mapping_shape():
+    record = {name: VALID_ROW[name] for name in validation.MAPPING_FIELDS}
+    later = {**record, "supreme_case_number": "2026-40", "verdict_date": "1. maí 2026", "verdict_date_iso": "2026-05-01"}
+
+    assert check_mapping({"22/2025": record, "23/2025": [record, later]}) == []
+    assert check_mapping({}) != []
+    assert len(check_mapping({"22-2025": record, "23/2025": [], "24/2025": [later, record]})) == 3
+    assert len(check_mapping({"22/2025": [record, {**later, "appeals_case_link": ""}]})) == 1
+    assert check_mapping({"22/2025": [record, {**later, "appeals_case_link": "https://island.is/domar/g-other"}]}) == []
+
+
+def test_full_check_records_state_that_later_runs_reuse(tmp_path, monkeypatch):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text(",".join(validation.CSV_COLUMNS) + "\n" + ",".join(VALID_ROW.values()) + "\n", encoding="utf-8")
+    validator = ContractValidator(tmp_path / "state.json")
+
+    assert not validator.is_current(csv_path)
+    assert validator.validate_csv(csv_path) == []
+    assert ContractValidator(tmp_path / "state.json").is_current(csv_path)
+
+    monkeypatch.setattr(validation, "RULES_VERSION", validation.RULES_VERSION + 1)
+    assert not ContractValidator(tmp_path / "state.json").is_current(csv_path)
+    monkeypatch.undo()
+
+    with csv_path.open("a", encoding="utf-8") as file:
+        file.write(",".join(VALID_ROW.values()) + "\n")
+    assert not validator.is_current(csv_path)
+    assert rules(validator.validate_csv(csv_path)) == ["unique_supreme_case_number"]
+    assert not validator.is_current(csv_path)
+
+
+def test_committed_data_satisfies_the_contract(tmp_path):
+    assert validation.main([
+        "--csv", str(ROOT / "allir_domar_og_akvardanir.csv"),
+        "--mapping", str(ROOT / "mapping.json"),
+        "--state", str(tmp_path / "state.json"),
+    ]) == 0
+
+
+class OneSourceScraper(Scraper):
+    """Yields `scraped` from the verdict listing and nothing else."""
+
+    def __init__(self, scraped):
+        super().__init__()
+        self.scraped = scraped
+
+    def scrape_verdicts(self, known_case_numbers, full=False, max_pages=None, report=None, windows=None, known_index=None):
+        stats = report.source("verdicts")
+        stats.listing_pages_fetched += 1
+        stats.listing_items_discovered += len(self.scraped)
+        stats.detail_pages_attempted += len(self.scraped)
+        stats.detail_pages_with_case_number += len(self.scraped)
+        return list(self.scraped)
+
+    def scrape_decisions(self, known_case_numbers, full=False, max_pages=None, report=None, known_index=None, page_ranges=None):
+        return []
+
+
+def store_valid_row(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(csv_path="allir_domar_og_akvardanir.csv", json_path="mapping.json")
+    csv_path = tmp_path / "allir_domar_og_akvardanir.csv"
+    csv_path.write_text(",".join(manager.columns) + "\n" + ",".join(VALID_ROW.values()) + "\n", encoding="utf-8")
+    return manager, csv_path
+
+
+def test_run_scrape_validates_only_new_rows_and_blocks_violations(tmp_path, monkeypatch):
+    manager, csv_path = store_valid_row(tmp_path, monkeypatch)
+    scraped = []
+
+    def run():
+        return run_scrape(OneSourceScraper(scraped), manager, report_path=tmp_path / "scrape_report.json")
+
+    # The first run has no recorded state, so the stored rows get the full check.
+    scraped[:] = [{**VALID_ROW, "supreme_case_number": "2026-32"}]
+    assert run() == 0
+    assert ContractValidator(tmp_path / "validation_state.json").is_current(csv_path)
+
+    def no_full_check(self, csv_path):
+        raise AssertionError("the stored rows were already validated")
+
+    monkeypatch.setattr(ContractValidator, "validate_csv", no_full_check)
+    before = csv_path.read_text(encoding="utf-8")
+    scraped[:] = [
+        {**VALID_ROW, "supreme_case_number": "2026-33"},
+        {**VALID_ROW, "supreme_case_number": "2026-34", "appeals_case_link": "https://www.landsrettur.is/domar/1"},
+    ]
+    assert run() == 1
+    report = json.loads((tmp_path / "scrape_report.json").read_text(encoding="utf-8"))
+    assert report["failure_reason"].startswith("1 data contract violation(s): 2026-34")
+    assert report["contract_violations"] == [{
+        "rule": "island_links",
+        "case": "2026-34",
+        "message": "case from 2026 keeps a non-Ísland.is Landsréttur link",
+    }]
+    assert csv_path.read_text(encoding="utf-8") == before
+    assert not manager.staging_path.exists()
+
+    scraped[:] = scraped[:1]
+    assert run() == 0
+    assert list(manager.load_existing_data()["supreme_case_number"]) == ["2026-31", "2026-32", "2026-33"]
+    assert ContractValidator(tmp_path / "validation_state.json").is_current(csv_path)
+
+
+def test_stored_violations_are_reported_but_do_not_block(tmp_path, caplog):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text(
+        ",".join(validation.CSV_COLUMNS) + "\n" + ",".join({**VALID_ROW, "verdict_date_iso": ""}.values()) + "\n",
+        encoding="utf-8",
+    )
+    manager = DataManager(csv_path=str(csv_path), validation_path=str(tmp_path / "state.json"))
+
+    assert manager.validate_publish([{**VALID_ROW, "supreme_case_number": "2026-32"}], {"2026-31"}) == []
+    assert "Stored rows already break the data contract" in caplog.text
+    manager.record_validation()
+    assert not (tmp_path / "state.json").exists()
+    assert rules(manager.validate_publish([VALID_ROW], {"2026-31"})) == ["unique_supreme_case_number"]
+
+
+def test_undated_new_rows_are_published_with_a_warning(tmp_path, monkeypatch, caplog):
+    manager, csv_path = store_valid_row(tmp_path, monkeypatch)
+    manager.validator.validate_csv(csv_path)
+    undated = {**VALID_ROW, "supreme_case_number": "2026-32", "verdict_date": "", "verdict_date_iso": ""}
+
+    assert run_scrape(OneSourceScraper([undated]), manager, report_path=tmp_path / "scrape_report.json") == 0
+    assert list(manager.load_existing_data()["supreme_case_number"]) == ["2026-31", "2026-32"]
+    assert "Publishing rows the data contract flags: 1 data contract violation(s): 2026-32" in caplog.text
+    # The CSV now holds a flagged row, so it is not recorded as valid.
+    assert not ContractValidator(tmp_path / "validation_state.json").is_current(csv_path)
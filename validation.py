@@ -0,0 +1,295 @@
+"""Data contract checks for the stored CSV and the generated `mapping.json`.
+
+The same guarantees as `tests/test_data_contract.py`, as a library the
+scraper runs before it publishes anything: unique Supreme case numbers,
+supported link shapes, parseable dates that agree with their ISO column,
+Ísland.is links for cases from 2018 onward, and the mapping's
+object-or-list shape.
+
+A full check streams the CSV once and records the file's digest in
+`validation_state.json`. While the CSV still has that digest, a run only
+needs to check the rows it adds or changes:
+
+    validator = ContractValidator()
+    violations = validator.check_delta(new_rows, stored_case_numbers)
+
+Standard library only, like `lookup.py`. `python validation.py` runs the
+full check and exits non-zero on violations.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+from urllib.parse import urlparse
+
+from lookup import parse_verdict_date
+
+# Bump when a rule changes, so the next run re-checks every stored row.
+RULES_VERSION = 1
+STATE_PATH = Path("validation_state.json")
+CSV_PATH = Path("allir_domar_og_akvardanir.csv")
+MAPPING_PATH = Path("mapping.json")
+CSV_COLUMNS = [
+    "supreme_case_number",
+    "supreme_case_link",
+    "appeals_case_number",
+    "appeals_case_link",
+    "source_type",
+    "verdict_date",
+    "verdict_date_iso",
+    "decision_status",
+]
+MAPPING_FIELDS = [
+    "supreme_case_number",
+    "supreme_case_link",
+    "appeals_case_link",
+    "source_type",
+    "verdict_date",
+    "verdict_date_iso",
+    "decision_status",
+]
+# Stored before Landsréttur links were scraped; their lower-court pages were never found.
+KNOWN_LEGACY_BLANK_APPEALS_LINKS = {"2019-271", "2020-118", "24/2019", "2020-156"}
+ISLAND_LINKS_SINCE = date(2018, 1, 1)
+LANDSRETTUR_CASE_RE = re.compile(r"^\d{1,4}/(?:19|20)\d{2}$")
+ISLAND_VERDICT_RE = re.compile(r"^/domar/s-[A-Za-z0-9-]+/?$")
+ISLAND_LOWER_COURT_RE = re.compile(r"^/domar/g-[A-Za-z0-9-]+/?$")
+ISLAND_DECISION_RE = re.compile(r"^/s/haestirettur/akvardanir/[A-Fa-f0-9-]{36}/?$")
+# The scraper may leave `verdict_date` empty when a page has no date. Such
+# rows are still published and logged; `--repair missing-fields` re-fetches them.
+NON_BLOCKING_RULES = {"missing_verdict_date"}
+# Violations listed in reports and logs; the count is always complete.
+MAX_REPORTED_VIOLATIONS = 50
+
+
+@dataclass(frozen=True)
+class Violation:
+    rule: str
+    case: str
+    message: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return f"{self.case or '?'}: {self.message} [{self.rule}]"
+
+
+def supreme_url_problem(url: str) -> str:
+    parsed = urlparse(url)
+    if parsed.scheme not in {"http", "https"}:
+        return "is not an http(s) URL"
+    if parsed.netloc == "island.is":
+        if ISLAND_VERDICT_RE.match(parsed.path) or ISLAND_DECISION_RE.match(parsed.path):
+            return ""
+        return "is not an Ísland.is verdict or decision page"
+    if parsed.netloc not in {"www.haestirettur.is", "haestirettur.is"}:
+        return "is not on island.is or haestirettur.is"
+    return ""
+
+
+def appeals_url_problem(url: str) -> str:
+    parsed = urlparse(url)
+    if parsed.scheme not in {"http", "https"}:
+        return "is not an http(s) URL"
+    if parsed.netloc == "island.is":
+        return "" if ISLAND_LOWER_COURT_RE.match(parsed.path) else "is not an Ísland.is lower-court page"
+    if parsed.netloc == "landsrettur.is" or parsed.netloc.endswith(".landsrettur.is"):
+        return ""
+    return "is not on island.is or landsrettur.is"
+
+
+def check_row(row: Mapping[str, str]) -> List[Violation]:
+    """Every rule that concerns one CSV row on its own."""
+    case = (row.get("supreme_case_number") or "").strip()
+    appeals_case_number = (row.get("appeals_case_number") or "").strip()
+    supreme_link = (row.get("supreme_case_link") or "").strip()
+    appeals_link = (row.get("appeals_case_link") or "").strip()
+    violations: List[Violation] = []
+
+    def violate(rule: str, message: str) -> None:
+        violations.append(Violation(rule, case, message))
+
+    if not case:
+        violate("supreme_case_number", "Supreme case number is empty")
+    if not (row.get("source_type") or "").strip():
+        violate("source_type", "source type is empty")
+    problem = supreme_url_problem(supreme_link)
+    if problem:
+        violate("supreme_case_link", f"Supreme link {supreme_link!r} {problem}")
+    if appeals_case_number:
+        if not LANDSRETTUR_CASE_RE.match(appeals_case_number):
+            violate("appeals_case_number", f"Landsréttur case number {appeals_case_number!r} is not sequence/year")
+        if appeals_link:
+            problem = appeals_url_problem(appeals_link)
+            if problem:
+                violate("appeals_case_link", f"Landsréttur link {appeals_link!r} {problem}")
+        elif case not in KNOWN_LEGACY_BLANK_APPEALS_LINKS:
+            violate("appeals_case_link", "Landsréttur case number has no link")
+
+    if not (row.get("verdict_date") or "").strip():
+        violate("missing_verdict_date", "verdict date is empty")
+        return violations
+    verdict_date = parse_verdict_date(row.get("verdict_date", ""))
+    if verdict_date is None:
+        violate("verdict_date", f"verdict date {row.get('verdict_date', '')!r} does not parse")
+        return violations
+    if row.get("verdict_date_iso", "") != verdict_date.isoformat():
+        violate("verdict_date_iso", f"ISO date {row.get('verdict_date_iso', '')!r} does not match {row.get('verdict_date')!r}")
+    if verdict_date >= ISLAND_LINKS_SINCE:
+        if urlparse(supreme_link).netloc != "island.is":
+            violate("island_links", f"case from {verdict_date.year} keeps a non-Ísland.is Supreme link")
+        if appeals_case_number and appeals_link and urlparse(appeals_link).netloc != "island.is":
+            violate("island_links", f"case from {verdict_date.year} keeps a non-Ísland.is Landsréttur link")
+    return violations
+
+
+def check_rows(rows: Iterable[Mapping[str, str]], stored_case_numbers: Collection[str] = ()) -> List[Violation]:
+    """Row rules plus uniqueness, within `rows` and against `stored_case_numbers`."""
+    violations: List[Violation] = []
+    seen: Set[str] = set()
+    for row in rows:
+        violations.extend(check_row(row))
+        case = (row.get("supreme_case_number") or "").strip()
+        if case and (case in seen or case in stored_case_numbers):
+            violations.append(Violation("unique_supreme_case_number", case, "Supreme case number is stored twice"))
+        seen.add(case)
+    return violations
+
+
+def check_mapping(mapping: Mapping[str, Any]) -> List[Violation]:
+    """Shape of the generated mapping, as `app.js` reads it."""
+    violations: List[Violation] = []
+    if not mapping:
+        return [Violation("mapping", "", "mapping is empty")]
+    for case, value in mapping.items():
+        if not LANDSRETTUR_CASE_RE.match(case or ""):
+            violations.append(Violation("mapping", case, "mapping key is not a Landsréttur case number"))
+        if isinstance(value, dict):
+            records = [value]
+        elif isinstance(value, list) and value and all(isinstance(record, dict) for record in value):
+            records = value
+        else:
+            violations.append(Violation("mapping", case, "mapping value is neither an object nor a non-empty list of objects"))
+            continue
+        for record in records:
+            missing = [name for name in MAPPING_FIELDS if name not in record]
+            if missing:
+                violations.append(Violation("mapping", case, f"record lacks {', '.join(missing)}"))
+                continue
+            for name in ("supreme_case_number", "supreme_case_link", "source_type"):
+                if not str(record[name]).strip():
+                    violations.append(Violation("mapping", case, f"record has an empty {name}"))
+            if not record["appeals_case_link"].strip() and record["supreme_case_number"] not in KNOWN_LEGACY_BLANK_APPEALS_LINKS:
+                violations.append(Violation("mapping", case, f"{record['supreme_case_number']} has no Landsréttur link"))
+            problem = supreme_url_problem(record["supreme_case_link"])
+            if problem:
+                violations.append(Violation("mapping", case, f"Supreme link {record['supreme_case_link']!r} {problem}"))
+        if len(records) > 1:
+            dates = [record["verdict_date_iso"] for record in records if "verdict_date_iso" in record]
+            if dates != sorted(dates):
+                violations.append(Violation("mapping", case, "records are not sorted by date"))
+    return violations
+
+
+def iter_csv_rows(path: Path) -> Iterator[Dict[str, str]]:
+    with Path(path).open(newline="", encoding="utf-8") as file:
+        yield from csv.DictReader(file)
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContractValidator:
+    """Checks rows before they are published, remembering what is known valid.
+
+    The state file records the digest of the last CSV that passed a full
+    check under the current `RULES_VERSION`. `is_current` says whether the
+    stored CSV is still that file; if so, only the rows a run adds or
+    changes need `check_delta`, and `record` moves the state on to the CSV
+    the run publishes. Otherwise `validate_csv` re-checks everything.
+    """
+
+    def __init__(self, state_path: Path = STATE_PATH):
+        self.state_path = Path(state_path)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def is_current(self, csv_path: Path) -> bool:
+        if self.state.get("rules_version") != RULES_VERSION or not Path(csv_path).exists():
+            return False
+        return self.state.get("csv_sha256") == file_digest(csv_path)
+
+    def check_delta(self, rows: Iterable[Mapping[str, str]], stored_case_numbers: Collection[str] = ()) -> List[Violation]:
+        """Check added rows, or changed rows with `stored_case_numbers` left empty."""
+        return check_rows(rows, stored_case_numbers)
+
+    def validate_csv(self, csv_path: Path = CSV_PATH) -> List[Violation]:
+        """Stream every stored row through the rules; records the state when clean."""
+        with Path(csv_path).open(newline="", encoding="utf-8") as file:
+            header = next(csv.reader(file), [])
+        if header != CSV_COLUMNS:
+            return [Violation("columns", "", f"CSV columns {header} are not {CSV_COLUMNS}")]
+        violations = check_rows(iter_csv_rows(csv_path))
+        if not violations:
+            self.record(csv_path)
+        return violations
+
+    def record(self, csv_path: Path) -> None:
+        """Remember `csv_path`, as it is now, as fully valid."""
+        self.state = {
+            "rules_version": RULES_VERSION,
+            "csv_sha256": file_digest(csv_path),
+            "validated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        tmp_path = self.state_path.with_name(f".{self.state_path.name}.tmp")
+        tmp_path.write_text(json.dumps(self.state, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+
+def summarize(violations: List[Violation]) -> str:
+    shown = "; ".join(str(violation) for violation in violations[:3])
+    more = f" (+{len(violations) - 3} more)" if len(violations) > 3 else ""
+    return f"{len(violations)} data contract violation(s): {shown}{more}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the stored CSV and mapping.json against the data contract.")
+    parser.add_argument("--csv", default=str(CSV_PATH))
+    parser.add_argument("--mapping", default=str(MAPPING_PATH))
+    parser.add_argument("--state", default=str(STATE_PATH))
+    args = parser.parse_args(argv)
+
+    violations = ContractValidator(Path(args.state)).validate_csv(Path(args.csv))
+    mapping_path = Path(args.mapping)
+    if mapping_path.exists():
+        violations.extend(check_mapping(json.loads(mapping_path.read_text(encoding="utf-8"))))
+    for violation in violations[:MAX_REPORTED_VIOLATIONS]:
+        print(violation, file=sys.stderr)
+    if violations:
+        print(summarize(violations), file=sys.stderr)
+        return 1
+    print(f"{args.csv} and {args.mapping} satisfy the data contract.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())